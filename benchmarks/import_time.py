@@ -0,0 +1,111 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks how long importing the library takes.
+
+Each Robot Framework (or pabot) process imports the library once, so
+its import time adds to the start-up time of every process. The script
+imports ``xmlvalidator`` in a number of fresh interpreters and prints
+the median wall time, plus the packages that took longest to import:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 20
+
+Run it from the repository root, with the package installed or with
+``src`` on ``PYTHONPATH``. The first runs warm the file system cache,
+so use enough runs for the median to settle.
+"""
+
+# Standard library imports.
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# Matches a line of ``python -X importtime`` output.
+IMPORT_TIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)$")
+
+
+def time_import(module: str) -> float:
+    """
+    Returns the seconds a fresh interpreter takes to import a module.
+    """
+    started_at = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        check=True,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - started_at
+
+
+def get_package_import_times(module: str) -> dict[str, float]:
+    """
+    Returns the seconds spent importing each package, when a fresh
+    interpreter imports a module, per ``python -X importtime``.
+
+    A package's time is the cumulative time of its outermost import,
+    which includes the packages that it imports in turn.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    package_times: dict[str, float] = defaultdict(float)
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            package_name = match.group(2).split(".")[0]
+            package_times[package_name] = max(
+                package_times[package_name], int(match.group(1)) / 1_000_000
+            )
+    return package_times
+
+
+def main() -> None:
+    """
+    Prints the median import time and the heaviest imported packages.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks how long importing the library takes."
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--module", default="xmlvalidator")
+    arguments = parser.parse_args()
+    baseline = statistics.median(time_import("sys") for _ in range(arguments.runs))
+    timings = [time_import(arguments.module) for _ in range(arguments.runs)]
+    print(
+        f"import {arguments.module}: median {statistics.median(timings) * 1000:.0f}"
+        f" ms over {arguments.runs} runs (an empty interpreter takes"
+        f" {baseline * 1000:.0f} ms)"
+    )
+    package_times = get_package_import_times(arguments.module)
+    package_times.pop(arguments.module.split(".")[0], None)
+    for package_name, seconds in sorted(
+        package_times.items(), key=lambda item: item[1], reverse=True
+    )[:5]:
+        print(f"  {package_name}: {seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
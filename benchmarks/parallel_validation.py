@@ -0,0 +1,149 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks batch validation sequentially, in a process pool and in a
+thread pool.
+
+The script generates two corpora of valid XML files in a temporary
+folder, many small files and a few large ones, and times
+``Validate Xml Files`` on each corpus with ``workers=1`` and with
+``--workers`` worker processes and worker threads:
+
+    python benchmarks/parallel_validation.py
+    python benchmarks/parallel_validation.py --small-files 500 --workers 8
+
+Run it from the repository root, with the package installed or with
+``src`` on ``PYTHONPATH``. A parallel speedup needs as many free CPU
+cores as workers; on a single core, the pools can only save the
+per-file overhead of sequential validation.
+"""
+
+# Standard library imports.
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+# Local application imports.
+from xmlvalidator import XmlValidator
+
+XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:element name="batch">
+        <xs:complexType>
+            <xs:sequence>
+                <xs:element name="record" maxOccurs="unbounded">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="name" type="xs:string"/>
+                            <xs:element name="amount" type="xs:decimal"/>
+                        </xs:sequence>
+                        <xs:attribute name="id" type="xs:int" use="required"/>
+                    </xs:complexType>
+                </xs:element>
+            </xs:sequence>
+        </xs:complexType>
+    </xs:element>
+</xs:schema>
+"""
+# One record takes up about 80 bytes.
+RECORD = '<record id="{0}"><name>Record {0}</name><amount>{0}.50</amount></record>\n'
+
+
+def write_corpus(folder: Path, files: int, records_per_file: int) -> None:
+    """
+    Writes the schema plus a number of valid XML files into a folder.
+    """
+    folder.mkdir()
+    (folder / "batch.xsd").write_text(XSD, encoding="utf-8")
+    records = "".join(RECORD.format(index) for index in range(records_per_file))
+    for index in range(files):
+        (folder / f"batch_{index:05}.xml").write_text(
+            f"<batch>\n{records}</batch>\n", encoding="utf-8"
+        )
+
+
+def time_validation(
+    validator: XmlValidator, folder: Path, workers: int, parallelism: str
+) -> float:
+    """
+    Returns the seconds one ``Validate Xml Files`` call takes.
+    """
+    started_at = time.perf_counter()
+    errors, _ = validator.validate_xml_files(
+        folder,
+        folder / "batch.xsd",
+        write_to_csv=False,
+        error_table=False,
+        fail_on_errors=False,
+        workers=workers,
+        parallelism=parallelism,  # type: ignore
+    )
+    elapsed = time.perf_counter() - started_at
+    if errors:
+        raise RuntimeError(f"The corpus in {folder} turned out to be invalid.")
+    return elapsed
+
+
+def main() -> None:
+    """
+    Generates the corpora and prints the timings, one line per corpus.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks sequential and parallel batch validation."
+    )
+    parser.add_argument("--small-files", type=int, default=2000)
+    parser.add_argument("--large-files", type=int, default=16)
+    parser.add_argument(
+        "--large-file-mb", type=float, default=3.9, help="size of each large file"
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--validation-backend", default="lxml")
+    arguments = parser.parse_args()
+    corpora = {
+        f"{arguments.small_files:,} small files": (arguments.small_files, 10),
+        f"{arguments.large_files} files of {arguments.large_file_mb} MB": (
+            arguments.large_files,
+            int(arguments.large_file_mb * 1024 * 1024 / 80),
+        ),
+    }
+    runs = {
+        "sequential": (1, "processes"),
+        "processes": (arguments.workers, "processes"),
+        "threads": (arguments.workers, "threads"),
+    }
+    validator = XmlValidator(
+        validation_backend=arguments.validation_backend, verbosity="silent"
+    )
+    print(
+        f"{arguments.validation_backend} backend, {arguments.workers} workers "
+        "(seconds per Validate Xml Files call)"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for index, (corpus, (files, records_per_file)) in enumerate(corpora.items()):
+            folder = Path(temp_dir) / f"corpus_{index}"
+            write_corpus(folder, files, records_per_file)
+            timings = [
+                f"{run} {time_validation(validator, folder, *run_settings):.2f}s"
+                for run, run_settings in runs.items()
+            ]
+            print(f"{corpus}: {', '.join(timings)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,8 @@ XSD validation can use either lxml's fast C-backed validator or
 xmlschema's richer Python validation engine. The default ``auto``
 backend uses lxml when possible and falls back to xmlschema. Users can
 force the legacy xmlschema validation path with
-``validation_backend=xmlschema``.
+``validation_backend=xmlschema``, or validate XML files that are too
+large to hold in memory with ``validation_backend=streaming``.
 
 Key Features:
 
@@ -50,6 +51,7 @@ This module is intended to be imported by Robot Framework test suites.
 # ruff: noqa: E501                      # On account of tables in docstrings.
 
 # Standard library imports.
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Literal
 
@@ -60,14 +62,22 @@ from xmlschema import XMLSchema
 
 # Local application imports.
 from ._version import __version__
+from .error_table import ErrorTableMode
 from .paths import get_file_paths
 from .results import ValidatorResultRecorder
-from .schema.manager import ValidatorSchemaManager
+from .schema.catalog import XmlCatalog
+from .schema.manager import (
+    DEFAULT_MAX_CACHED_SCHEMA_BYTES,
+    DEFAULT_MAX_CACHED_SCHEMAS,
+    ValidatorSchemaManager,
+)
 from .schema.resolver import ValidatorSchemaResolver
 from .validation import (
+    Parallelism,
     ValidationBackend,
     XmlValidationRunner,
 )
+from .verbosity import DEFAULT_VERBOSITY, Verbosity, use_verbosity, validate_verbosity
 
 
 @library(scope="GLOBAL", version=__version__, doc_format="REST")
@@ -458,6 +468,14 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         error_facets: list[str] | None = None,
         fail_on_errors: bool = True,
         validation_backend: ValidationBackend = "auto",
+        schema_cache_dir: str | Path | None = None,
+        max_cached_schemas: int = DEFAULT_MAX_CACHED_SCHEMAS,
+        max_cached_schema_mb: int = DEFAULT_MAX_CACHED_SCHEMA_BYTES // 2**20,
+        xml_catalog: str | Path | dict[str, str] | None = None,
+        verbosity: Verbosity = DEFAULT_VERBOSITY,
+        error_table: ErrorTableMode = "html",
+        max_error_table_rows: int | None = None,
+        error_spill_dir: str | Path | None = None,
     ) -> None:
         """
         **Library Scope**
@@ -481,7 +499,23 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         | fail_on_errors | bool        | No       | Whether to fail the test case if one or more XML validation errors are found.               | True           |
         |                |             |          | Can be overridden per keyword call.                                                         |                |
         +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
-        | validation_backend | str     | No       | Validation backend: ``auto``, ``lxml`` or ``xmlschema``.                                    | auto           |
+        | validation_backend | str     | No       | Validation backend: ``auto``, ``lxml``, ``streaming`` or ``xmlschema``.                     | auto           |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | schema_cache_dir | str       | No       | Folder in which built schemas are cached across test runs.                                  | None           |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | max_cached_schemas | int     | No       | Maximum number of schemas kept in each in-memory schema cache.                              | 64             |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | max_cached_schema_mb | int   | No       | Maximum estimated memory (in MB) taken up by the schemas in each in-memory cache.           | 512            |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | xml_catalog    | str or dict | No       | OASIS XML catalog file, or dictionary, mapping schema URLs to local files.                  | None           |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | verbosity      | str         | No       | What validation runs log: ``silent``, ``summary``, ``per-file`` or ``per-error``.           | per-error      |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | error_table    | str         | No       | How the error table is rendered in the log: ``html`` or ``json``.                           | html           |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | max_error_table_rows | int   | No       | Maximum number of rows of one error table in the log.                                       | None           |
+        +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
+        | error_spill_dir | str        | No       | Folder in which collected errors are stored as JSON Lines, instead of in memory.            | None           |
         +----------------+-------------+----------+---------------------------------------------------------------------------------------------+----------------+
 
         All arguments are optional.
@@ -547,6 +581,107 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         - ``lxml``: require lxml validation.
         - ``xmlschema``: use xmlschema's ``iter_errors()`` path,
           preserving the pre-performance-refactor diagnostic behavior.
+        - ``streaming``: validate with bounded memory, for XML files
+          too large to hold in memory. lxml validates each file while
+          parsing it in chunks and discards what it parsed. Only for
+          invalid files, xmlschema collects the errors in lazy mode.
+          The error facets are those of the ``xmlschema`` backend,
+          except that ``path`` points to the top-level subtree (a
+          child of the root element) holding the invalid element.
+
+        ``schema_cache_dir``
+
+        Building a schema object for a large XSD set can take seconds,
+        which each new Robot Framework run would otherwise pay again.
+        If ``schema_cache_dir`` is set, each built schema is stored in
+        that folder and later runs load it from there instead of
+        rebuilding it. A cached schema is only used as long as neither
+        the XSD file nor any of the files it (transitively) includes or
+        imports have changed. Schemas that include or import remote
+        files are not cached.
+
+        The folder is created if needed. Only use a folder that is not
+        writable by untrusted users, as cached schemas are unpickled.
+
+        ``max_cached_schemas`` and ``max_cached_schema_mb``
+
+        Compiled lxml schemas and built XMLSchema objects are kept in
+        memory, so that each schema is compiled and built only once.
+        These arguments bound each of both caches by the number of
+        schemas and by their estimated combined memory size. The size
+        of a cached schema is estimated from the size of its XSD files.
+        When a limit is exceeded, the least recently used schemas are
+        discarded (and compiled again if needed later). Use ``Get
+        Schema Cache Statistics`` to inspect the caches.
+
+        ``xml_catalog``
+
+        Many standards schemas import other schemas by absolute URL,
+        e.g. ``http://www.w3.org/2001/xml.xsd``. Fetching those over
+        the network is slow and breaks in offline CI environments. The
+        ``xml_catalog`` argument maps such URLs to local copies. It is
+        either the path to an OASIS XML catalog file (supporting
+        ``uri``, ``system``, ``rewriteURI``, ``rewriteSystem`` and
+        ``nextCatalog`` entries) or a dictionary of URLs to local
+        paths. A dictionary key that ends with a slash maps all URLs
+        that start with it, e.g.
+        ``{'http://example.com/schemas/': 'local/schemas'}``.
+
+        With a catalog, schemas are loaded and compiled without any
+        network access. Loading a schema that includes or imports a
+        remote URL that is not in the catalog fails right away, with
+        an error naming the unmapped URL(s).
+
+        ``verbosity``
+
+        Controls what ``Validate Xml Files`` writes to the console and
+        the Robot Framework log. Logging every file and every error
+        makes ``output.xml`` grow large for runs with many errors.
+
+        - ``silent``: nothing is logged.
+        - ``summary``: only one aggregated summary message per run.
+        - ``per-file``: also each file's progress and outcome, the
+          export path of the CSV file and the error table.
+        - ``per-error``: also the details of each error (the default).
+
+        The collected errors are always returned and exported to CSV,
+        if requested, and ``fail_on_errors`` still applies. Can be
+        overridden per keyword call.
+
+        ``error_table`` and ``max_error_table_rows``
+
+        By default, the error table of a run is logged as a plain HTML
+        table. With hundreds of thousands of errors, such a table makes
+        ``log.html`` slow to open and to filter. With
+        ``error_table=json``, the rows are embedded as compact JSON and
+        rendered by the browser: only the rows scrolled into view are
+        shown, and the filter searches an index of the rows.
+
+        ``max_error_table_rows`` caps the number of rows of each error
+        table, in either mode. The table then states how many errors
+        were left out. The returned errors and the CSV export always
+        hold all errors.
+
+        ``error_spill_dir``
+
+        By default, all errors of a run are kept in memory until the run
+        is finalized. For long batches with many errors, set
+        ``error_spill_dir`` to a folder: each file's errors are then
+        appended to a JSON Lines file ``errors_<timestamp>.jsonl`` in
+        that folder as soon as the file is validated. Memory use no
+        longer grows with the number of errors, and the errors of a run
+        that crashes or times out are kept in that file.
+
+        The CSV export, the error table and the errors returned by
+        ``Validate Xml Files`` are then read back from the file. The
+        returned errors are a sequence that reads from the file when it
+        is iterated or indexed. Facet values that JSON cannot represent
+        are returned as strings. The file is only created once errors
+        are collected, and a run that resets the errors deletes the
+        file of the previous run, after which the errors returned by
+        that run can no longer be read. Combine this with
+        ``max_error_table_rows``, as an uncapped error table still
+        holds all errors.
 
         ``fail_on_errors``
 
@@ -634,14 +769,23 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         +---------------+--------------------------------------------------------------+
         """
         # Use composition for collaborators that keep state.
-        self.schema_manager = ValidatorSchemaManager()
+        self.schema_manager = ValidatorSchemaManager(
+            schema_cache_dir,
+            max_cached_schemas,
+            max_cached_schema_mb * 2**20,
+            XmlCatalog.from_value(xml_catalog) if xml_catalog else None,
+        )
         self.schema_resolver = ValidatorSchemaResolver(self.schema_manager)
         self.validation_runner = XmlValidationRunner(self.schema_manager)
-        self.validator_results = ValidatorResultRecorder()
+        self.validator_results = ValidatorResultRecorder(
+            error_table, max_error_table_rows, error_spill_dir
+        )
         # Set the backend to use for validation.
         self.validation_backend: ValidationBackend = (
             XmlValidationRunner.validate_validation_backend(validation_backend)
         )
+        # Set what validation runs write to the log.
+        self.verbosity: Verbosity = validate_verbosity(verbosity)
         # Initialize the xsd schema from the xsd_path, if provided.
         self.schema = self.schema_manager.try_load_initial_schema(
             xsd_path=xsd_path, base_url=base_url
@@ -695,8 +839,8 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         """
         Returns the currently configured default validation backend.
 
-        The returned value is one of ``auto``, ``lxml`` or
-        ``xmlschema``.
+        The returned value is one of ``auto``, ``lxml``,
+        ``streaming`` or ``xmlschema``.
 
         This value is used by ``Validate Xml Files`` unless that keyword
         call provides its own ``validation_backend`` argument.
@@ -708,7 +852,8 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         """
         Sets the default backend used by subsequent validation runs.
 
-        Accepted values are ``auto``, ``lxml`` and ``xmlschema``.
+        Accepted values are ``auto``, ``lxml``, ``streaming`` and
+        ``xmlschema``.
 
         The setting affects later ``Validate Xml Files`` calls unless a
         specific call provides its own ``validation_backend`` argument.
@@ -720,6 +865,33 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
             f"Validation backend set to: {self.validation_backend}.", also_console=True
         )
 
+    @keyword
+    def get_verbosity(self) -> Verbosity:
+        """
+        Returns the currently configured default verbosity.
+
+        The returned value is one of ``silent``, ``summary``,
+        ``per-file`` or ``per-error``.
+
+        This value is used by ``Validate Xml Files`` unless that keyword
+        call provides its own ``verbosity`` argument.
+        """
+        return self.verbosity
+
+    @keyword
+    def set_verbosity(self, verbosity: Verbosity) -> None:
+        """
+        Sets the default verbosity of subsequent validation runs.
+
+        Accepted values are ``silent``, ``summary``, ``per-file`` and
+        ``per-error``.
+
+        The setting affects later ``Validate Xml Files`` calls unless a
+        specific call provides its own ``verbosity`` argument.
+        """
+        self.verbosity = validate_verbosity(verbosity)
+        logger.info(f"Verbosity set to: {self.verbosity}.", also_console=True)
+
     @keyword
     def get_schema(self, return_schema_name: bool = True) -> str | XMLSchema | None:
         """
@@ -756,6 +928,75 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
             return getattr(self.schema, "name", None)
         return self.schema
 
+    @keyword
+    def get_schema_cache_statistics(self, cache: str = "lxml") -> dict[str, int]:
+        """
+        .. raw:: html
+
+            <span style="text-decoration: underline; font-size: 15px;">Description</span>
+
+        Returns the statistics of an in-memory schema cache.
+
+        The counters cover all keyword calls since library import.
+        Schemas compiled by parallel workers (see ``workers`` of
+        ``Validate Xml Files``) are cached per worker and not counted.
+
+        .. raw:: html
+
+            <span style="text-decoration: underline; font-size: 15px;">Arguments</span>
+
+        cache:
+
+        - ``lxml`` (default): the cache of compiled lxml schemas.
+        - ``xmlschema``: the cache of built XMLSchema objects.
+
+        .. raw:: html
+
+            <span style="text-decoration: underline; font-size: 15px;">Returns</span>
+
+        A dictionary with the keys:
+
+        - ``hits``: lookups served by an up-to-date cached schema.
+        - ``misses``: lookups that required compiling a schema.
+        - ``evictions``: schemas discarded because a limit was exceeded.
+        - ``entries``: the number of schemas currently cached.
+        - ``failures``: how many of them are compile errors, see ``Get
+          Lxml Fallback Schemas``.
+        - ``estimated_bytes``: their estimated combined memory size.
+        - ``max_entries`` and ``max_bytes``: the configured limits.
+        """
+        if cache == "lxml":
+            return self.schema_manager.get_lxml_schema_cache_statistics()
+        if cache == "xmlschema":
+            return self.schema_manager.get_xmlschema_cache_statistics()
+        raise ValueError(
+            f"Unsupported schema cache: {cache}. Expected one of: lxml, xmlschema."
+        )
+
+    @keyword
+    def get_lxml_fallback_schemas(self) -> list[dict[str, str | None]]:
+        """
+        .. raw:: html
+
+            <span style="text-decoration: underline; font-size: 15px;">Description</span>
+
+        Returns the schemas that lxml could not compile.
+
+        With the ``auto`` validation backend, files are validated against
+        such schemas with xmlschema instead, which is considerably
+        slower for large files. The compile error of each schema is
+        cached, so it is only paid once, until one of its files
+        changes. Schemas compiled by parallel workers are not included.
+
+        .. raw:: html
+
+            <span style="text-decoration: underline; font-size: 15px;">Returns</span>
+
+        A list with a dictionary per schema, with the keys ``xsd_path``,
+        ``base_url`` and ``error``.
+        """
+        return self.schema_manager.get_lxml_fallback_schemas()
+
     @keyword
     def log_schema(self, log_name: bool = True):
         """
@@ -846,7 +1087,14 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         allow_declared_namespace_match: bool = False,
         skip_none_error_facets: bool = False,
         validation_backend: ValidationBackend | None = None,
-    ) -> tuple[list[dict[str, Any]], str | None]:
+        workers: int = 1,
+        parallelism: Parallelism = "processes",
+        max_errors_per_file: int | None = None,
+        max_errors_total: int | None = None,
+        stop_on_first_invalid: bool = False,
+        verbosity: Verbosity | None = None,
+        allow_nested_namespace_match: bool = False,
+    ) -> tuple[Sequence[dict[str, Any]], str | None]:
         """
         **Introduction**
 
@@ -957,15 +1205,69 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         ``validation_backend``
 
         Backend used for XSD validation. Use ``auto`` for the fast lxml
-        path with xmlschema fallback, ``lxml`` to require lxml, or
+        path with xmlschema fallback, ``lxml`` to require lxml,
         ``xmlschema`` to preserve the pre-performance-refactor
-        xmlschema ``iter_errors()`` behavior. Defaults to the backend
-        configured during library import.
+        xmlschema ``iter_errors()`` behavior, or ``streaming`` to
+        validate very large files with bounded memory. Defaults to the
+        backend configured during library import.
+
+        ``workers``
+
+        Number of worker processes used to validate the XML files. With
+        the default of 1, files are validated one after another in the
+        Robot Framework process. With a higher number, files are
+        validated in parallel and each worker process compiles and
+        caches its own schemas. Results are still logged, recorded and
+        exported in the original file order. Facet values that are not
+        plain strings or numbers (e.g. ``elem`` or ``validator``) are
+        reported as strings when using multiple worker processes.
+
+        ``parallelism``
+
+        Kind of workers used when ``workers`` is greater than 1:
+        ``processes`` (default) or ``threads``. Worker threads avoid the
+        start-up and data transfer costs of processes, which pays off
+        for batches of many small files. They still run in parallel,
+        because lxml releases the GIL while parsing and validating. The
+        ``xmlschema`` backend is pure Python and therefore gains little
+        from threads.
+
+        ``max_errors_per_file``
+
+        Maximum number of errors to report per XML file. Once a file
+        has more errors, error collection for that file stops and a
+        note, stating that its errors were truncated, is reported as an
+        extra error row instead. Defaults to None (no limit).
+
+        ``max_errors_total``
+
+        Maximum number of errors to report for the whole run. Once it
+        is reached, further invalid files are still reported as
+        invalid, with only a truncation note. Defaults to None (no
+        limit).
+
+        ``stop_on_first_invalid``
+
+        If True, stops the run at the first invalid XML file, e.g. for
+        smoke checks that only need to know whether any file is
+        invalid. The files after it are not validated, but listed as
+        skipped in the log and counted in the summary. With
+        ``workers``, validations that did not start yet are cancelled.
+        Defaults to False.
+
+        ``verbosity``
+
+        What the run writes to the console and the log: ``silent``,
+        ``summary``, ``per-file`` or ``per-error``. Defaults to the
+        verbosity configured during library import. See the library
+        import documentation for the details.
 
         ``pre_parse``
 
         If True, performs well-formedness checks on all XML/XSD files
         before schema validation. Defaults to True.
+        With the ``streaming`` backend, XML files are checked without
+        being held in memory, which takes an extra pass over each file.
 
         ``write_to_csv``
 
@@ -1000,6 +1302,14 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
         if they are not the schema's target namespace or an explicitly
         imported namespace. Defaults to False.
 
+        ``allow_nested_namespace_match``
+
+        If True, dynamic namespace matching of an XML file whose root
+        element's namespaces match no XSD falls back to the namespaces
+        declared below the root. The XML file is then streamed only up
+        to the first declaration of a namespace that an XSD matches.
+        Defaults to False.
+
         **Returns**
 
         A tuple, holding:
@@ -1008,6 +1318,9 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
             A list of all validation errors found during the run. Each
             error is a dictionary with items that are based on the
             `error_facets`.
+            With ``error_spill_dir``, a sequence that reads the errors
+            from the spill file instead, until a next run resets the
+            errors.
           - A string or None:
             The path to the generated CSV file if there are errors and
             `write_to_csv=True`; otherwise None.
@@ -1042,32 +1355,41 @@ class XmlValidator:  # pylint: disable=R0902:too-many-instance-attributes
             if validation_backend is not None
             else self.validation_backend
         )
-        # Determine and resolve/normalize the XML file path(s).
-        xml_file_paths, is_single_xml_file = get_file_paths(xml_path, "xml")
-        # Pair each XML file with its proper XSD counterpart.
-        validations = self.schema_resolver.build_validation_plan(
-            xml_file_paths,
-            xsd_path=xsd_path,
-            xsd_search_strategy=xsd_search_strategy,
-            base_url=base_url,
-            allow_declared_namespace_match=allow_declared_namespace_match,
-        )
-        # Execute the validation plan and record each file's result.
-        self.validation_runner.run_validation_plan(
-            validations,
-            self.validator_results,
-            base_url,
-            error_facets,
-            self.error_facets,
-            pre_parse,
-            skip_none_error_facets,
-            effective_validation_backend,
-        )
-        # Export, report and return the completed validation results.
-        return self.validation_runner.finalize_validation_run(
-            xml_file_paths,
-            is_single_xml_file,
-            self.validator_results,
-            (write_to_csv, timestamped, error_table),
-            fail_on_errors,
-        )
+        # Apply the call's verbosity to everything logged during the run.
+        with use_verbosity(verbosity or self.verbosity):
+            # Determine and resolve/normalize the XML file path(s).
+            xml_file_paths, is_single_xml_file = get_file_paths(xml_path, "xml")
+            # Pair each XML file with its proper XSD counterpart.
+            validations = self.schema_resolver.build_validation_plan(
+                xml_file_paths,
+                xsd_path=xsd_path,
+                xsd_search_strategy=xsd_search_strategy,
+                base_url=base_url,
+                allow_declared_namespace_match=allow_declared_namespace_match,
+                lazy_schema=effective_validation_backend != "xmlschema",
+                allow_nested_namespace_match=allow_nested_namespace_match,
+            )
+            # Execute the validation plan and record each file's result.
+            self.validation_runner.run_validation_plan(
+                validations,
+                self.validator_results,
+                base_url,
+                error_facets,
+                self.error_facets,
+                pre_parse,
+                skip_none_error_facets,
+                effective_validation_backend,
+                workers=workers,
+                parallelism=parallelism,
+                max_errors_per_file=max_errors_per_file,
+                max_errors_total=max_errors_total,
+                stop_on_first_invalid=stop_on_first_invalid,
+            )
+            # Export, report and return the completed validation results.
+            return self.validation_runner.finalize_validation_run(
+                xml_file_paths,
+                is_single_xml_file,
+                self.validator_results,
+                (write_to_csv, timestamped, error_table),
+                fail_on_errors,
+            )
@@ -0,0 +1,243 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the renderers of the error tables written to the log.
+
+An error table is rendered in one of two modes:
+
+- ``html``: a plain HTML table holding all rows. Simple, but a log
+  with tens of thousands of rows becomes slow to open and to filter.
+- ``json``: the rows are embedded as compact JSON and rendered in the
+  browser. Only the rows scrolled into view are turned into HTML, and
+  the filter searches a lowercased index of the rows instead of the
+  table's cells.
+"""
+
+# Standard library imports.
+import html
+import json
+from collections.abc import Sequence
+from typing import Any, Literal, cast
+
+# Define type and allowed values for the user-provided table mode.
+ErrorTableMode = Literal["html", "json"]
+# Runtime counterpart of ErrorTableMode.
+ERROR_TABLE_MODES = ("html", "json")
+
+# Styling plus rendering script for embedding JSON error tables in the
+# log. Rows get a fixed height, so that the visible rows follow from the
+# scroll position.
+JSON_TABLE_STYLE_AND_SCRIPT = """
+    <style>
+        .json_table_viewport {
+            position: relative;
+            max-height: 30em;
+            overflow-y: auto;
+        }
+        .json_table table {
+            table-layout: fixed;
+            width: 100%;
+            border-collapse: collapse;
+        }
+        .json_table th {
+            background-color: var(--primary-color);
+        }
+        .json_table th, .json_table td {
+            border: 1px solid var(--secondary-color);
+            padding: 0 0.3em;
+            height: 1.6em;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            font-family: Helvetica, sans-serif;
+        }
+        .json_table_body {
+            position: absolute;
+            top: 0;
+        }
+        .json_table input.filter {
+            width: 25em;
+            background-color: var(--background-color);
+            border: 2px solid var(--secondary-color);
+            border-radius: 2px;
+            color: var(--text-color);
+            font-family: Helvetica, sans-serif;
+        }
+    </style>
+    <script>
+        function getJsonTable(blockId) {
+            const container = document.getElementById("table_block_" + blockId);
+            if (!container.jsonTable) {
+                const data = JSON.parse(
+                    container.querySelector(".json_table_data").textContent
+                );
+                container.jsonTable = {
+                    rows: data.rows,
+                    total: data.total,
+                    index: data.rows.map(row => row.join("\\u0000").toLowerCase()),
+                    matches: data.rows.map((_, i) => i),
+                    filter: "",
+                    rowHeight: 0,
+                };
+                container.querySelector(".json_table_viewport").onscroll =
+                    () => renderJsonTable(blockId);
+            }
+            return container.jsonTable;
+        }
+
+        function filterJsonTable(blockId) {
+            const container = document.getElementById("table_block_" + blockId);
+            const table = getJsonTable(blockId);
+            const filter = container.querySelector("input").value.toLowerCase();
+            // A longer filter can only match rows the shorter one matched.
+            const candidates = filter.startsWith(table.filter)
+                ? table.matches
+                : table.index.map((_, i) => i);
+            table.matches = candidates.filter(i => table.index[i].includes(filter));
+            table.filter = filter;
+            container.querySelector(".json_table_viewport").scrollTop = 0;
+            renderJsonTable(blockId);
+        }
+
+        function renderJsonTable(blockId) {
+            const container = document.getElementById("table_block_" + blockId);
+            const table = getJsonTable(blockId);
+            const viewport = container.querySelector(".json_table_viewport");
+            const body = container.querySelector(".json_table_body");
+            const tbody = body.querySelector("tbody");
+            const rowHeight = table.rowHeight || 24;
+            const first = Math.floor(viewport.scrollTop / rowHeight);
+            const count = Math.ceil((viewport.clientHeight || 480) / rowHeight) + 1;
+            const rows = table.matches.slice(first, first + count).map(i => {
+                const tr = document.createElement("tr");
+                for (const value of table.rows[i]) {
+                    const td = document.createElement("td");
+                    td.textContent = value;
+                    td.title = value;
+                    tr.appendChild(td);
+                }
+                return tr;
+            });
+            tbody.replaceChildren(...rows);
+            if (!table.rowHeight && rows.length) {
+                table.rowHeight = rows[0].getBoundingClientRect().height || rowHeight;
+                return renderJsonTable(blockId);
+            }
+            body.style.top = first * rowHeight + "px";
+            container.querySelector(".json_table_spacer").style.height =
+                table.matches.length * rowHeight + "px";
+            container.querySelector(".json_table_status").textContent =
+                table.matches.length + " of " + table.rows.length + " rows match"
+                + (table.total > table.rows.length
+                    ? " (" + table.total + " errors, see the CSV export for all)."
+                    : ".");
+        }
+    </script>
+  """
+
+
+def validate_error_table_mode(error_table: str) -> ErrorTableMode:
+    """
+    Validates and normalizes a user-provided error table mode.
+    """
+    if error_table not in ERROR_TABLE_MODES:
+        raise ValueError(
+            f"Unsupported error table mode: {error_table}. Expected one of: "
+            f"{', '.join(ERROR_TABLE_MODES)}."
+        )
+    return cast(ErrorTableMode, error_table)
+
+
+def get_html_table(errors: Sequence[dict[str, Any]], columns: list[str]) -> str:
+    """
+    Renders errors as an HTML table with one column per key.
+
+    The table has the markup of a pandas ``DataFrame.to_html()`` table.
+    Missing values and None are rendered as empty cells.
+    """
+    header = "".join(f"<th>{_to_cell(column)}</th>" for column in columns)
+    rows = "".join(
+        "<tr>"
+        + "".join(f"<td>{_to_cell(error.get(column))}</td>" for column in columns)
+        + "</tr>"
+        for error in errors
+    )
+    return (
+        '<table class="dataframe">'
+        f'<thead><tr style="text-align: right;">{header}</tr></thead>'
+        f"<tbody>{rows}</tbody>"
+        "</table>"
+    )
+
+
+def get_json_table(
+    table_id: int, errors: Sequence[dict[str, Any]], columns: list[str], total: int
+) -> str:
+    """
+    Renders errors as a JSON table, to be rendered by the browser.
+
+    ``total`` is the number of errors before the rows were capped. The
+    returned block still needs ``JSON_TABLE_STYLE_AND_SCRIPT`` in the
+    log, before its ``renderJsonTable()`` call runs.
+    """
+    data = json.dumps(
+        {
+            "total": total,
+            "rows": [
+                [_to_text(error.get(column)) for column in columns] for error in errors
+            ],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    # Keep the JSON from closing its script element.
+    data = data.replace("<", "\\u003c")
+    header = "".join(f"<th>{_to_cell(column)}</th>" for column in columns)
+    return f"""<div id="table_block_{table_id}" class="json_table">
+            <input class="filter" type="text"
+                   onkeyup="filterJsonTable('{table_id}')"
+                   placeholder="Search validation errors...">
+            <span class="json_table_status"></span>
+            <table><thead><tr>{header}</tr></thead></table>
+            <div class="json_table_viewport">
+                <div class="json_table_spacer"></div>
+                <table class="json_table_body"><tbody></tbody></table>
+            </div>
+            <script type="application/json" class="json_table_data">{data}</script>
+        </div>"""
+
+
+def get_json_table_render_call(table_id: int) -> str:
+    """
+    Returns the script that renders a JSON table once it is in the log.
+    """
+    return f"<script>renderJsonTable('{table_id}');</script>"
+
+
+def _to_text(value: Any) -> str:
+    """
+    Returns the text of a table cell, empty for None.
+    """
+    return "" if value is None else str(value)
+
+
+def _to_cell(value: Any) -> str:
+    """
+    Returns the escaped HTML content of a table cell.
+    """
+    return html.escape(_to_text(value), quote=False)
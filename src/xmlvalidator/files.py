@@ -22,6 +22,7 @@ Provides file-level sanity checks for XML and XSD validation workflows.
 # pylint: disable=I1101:c-extension-no-member
 
 # Standard library imports.
+from collections.abc import Callable
 from pathlib import Path
 
 # Third party library imports.
@@ -29,6 +30,9 @@ from lxml import etree
 
 # Local application imports.
 from .results import ValidatorResult
+from .streaming import parse_streaming
+
+SchemaCompiler = Callable[[Path, str | None], etree.XMLSchema]
 
 DEFAULT_ERROR_FACETS: dict[type, list[str]] = {
     OSError: ["strerror"],
@@ -38,12 +42,15 @@ DEFAULT_ERROR_FACETS: dict[type, list[str]] = {
 }
 
 
-def sanity_check_files(  # pylint: disable=R0914:too-many-locals
+def sanity_check_files(  # pylint: disable=R0913:too-many-arguments, R0914:too-many-locals, R0917:too-many-positional-arguments
     file_paths: list[Path],
     base_url: str | None = None,
     error_facets: list[str] | None = None,
     parse_files: bool = False,
     skip_none_error_facets: bool = False,
+    schema_compiler: SchemaCompiler | None = None,
+    stream_xml_files: bool = False,
+    parse_xml_files: bool = True,
 ) -> ValidatorResult:
     """
     Performs file-level sanity checks on XML or XSD files.
@@ -53,12 +60,30 @@ def sanity_check_files(  # pylint: disable=R0914:too-many-locals
     also parses XML files and parses/compiles XSD files before the main
     validation step starts.
 
+    The parsed XML trees are returned as the result value, keyed by
+    file path, so the validation step can reuse them instead of parsing
+    each XML file a second time. The value is an empty dictionary when
+    ``parse_files`` is False.
+
+    XSD files are compiled with ``schema_compiler`` if one is passed,
+    e.g. ``ValidatorSchemaManager.compile_lxml_schema()``, which compiles
+    each schema only once instead of once per sanity check.
+
+    If ``stream_xml_files`` is True, XML files are checked for
+    well-formedness with ``parse_streaming()`` instead, which never
+    holds a full document in memory. No XML trees are returned then.
+
+    If ``parse_xml_files`` is False, XML files only get the file-level
+    checks, even if ``parse_files`` is True. This is for callers that
+    check the well-formedness of XML files while validating them.
+
     Parsing errors are converted into structured error dictionaries.
     By default, requested error facets whose value is ``None`` are kept
     and reported as ``Unavailable``. If ``skip_none_error_facets`` is
     True, such facets are omitted instead.
     """
     errors: list[dict[str, str | None]] = []
+    documents: dict[Path, etree._ElementTree] = {}
     for file_path in file_paths:
         file_type = file_path.suffix.lower()
         file_error = _check_file_path(file_path, file_type)
@@ -66,7 +91,14 @@ def sanity_check_files(  # pylint: disable=R0914:too-many-locals
             errors.append(file_error)
             continue
         try:
-            _parse_file_for_sanity_check(file_path, file_type, base_url, parse_files)
+            document = _parse_file_for_sanity_check(
+                file_path,
+                file_type,
+                base_url,
+                parse_files and (parse_xml_files or file_type != ".xml"),
+                schema_compiler,
+                stream_xml_files,
+            )
         except (
             OSError,
             etree.ParseError,
@@ -77,8 +109,11 @@ def sanity_check_files(  # pylint: disable=R0914:too-many-locals
                 e, error_facets, DEFAULT_ERROR_FACETS, skip_none_error_facets
             )
             _append_file_error(errors, file_path, "File parsing failed.", error_details)
+            continue
+        if document is not None and file_type == ".xml":
+            documents[file_path] = document
     success = len(errors) == 0
-    return ValidatorResult(success=success, error=errors)
+    return ValidatorResult(success=success, value=documents, error=errors)
 
 
 def _check_file_path(file_path: Path, file_type: str) -> dict[str, str | None] | None:
@@ -106,20 +141,36 @@ def _check_file_path(file_path: Path, file_type: str) -> dict[str, str | None] |
     return None
 
 
-def _parse_file_for_sanity_check(
-    file_path: Path, file_type: str, base_url: str | None, parse_files: bool
-) -> None:
+def _parse_file_for_sanity_check(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
+    file_path: Path,
+    file_type: str,
+    base_url: str | None,
+    parse_files: bool,
+    schema_compiler: SchemaCompiler | None = None,
+    stream_xml_file: bool = False,
+) -> etree._ElementTree | None:
     """
     Parses a file when sanity checks include XML/XSD parsing.
+
+    Returns the parsed XML tree, or None if parsing is disabled or if
+    the XSD file was compiled by the given ``schema_compiler`` or the
+    XML file was parsed in a streaming fashion.
     """
     if not parse_files:
-        return
+        return None
+    if file_type == ".xsd" and schema_compiler is not None:
+        schema_compiler(file_path, base_url)
+        return None
+    if file_type == ".xml" and stream_xml_file:
+        parse_streaming(file_path)
+        return None
     with file_path.open("rb") as file:
         tree = etree.parse(
             file, parser=etree.XMLParser(), base_url=base_url  # type: ignore
         )
         if file_type == ".xsd":
             _ = etree.XMLSchema(tree)
+    return tree
 
 
 def _extract_error_details(
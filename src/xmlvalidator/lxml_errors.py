@@ -0,0 +1,352 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides helpers that turn lxml validation errors into error facets.
+
+The LxmlErrorLocator class resolves the structural paths that lxml
+reports for validation errors to elements, readable element paths and
+sibling positions. The LxmlReasonRegistry class rewrites lxml's error
+messages into the reasons that xmlschema reports for the same errors.
+"""
+
+# pylint: disable=I1101:c-extension-no-member
+
+# Standard library imports.
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+# Third party library imports.
+from lxml import etree
+
+# One step of the element paths that libxml2 reports: an element name
+# without prefix, or ``*`` for an element in the default namespace,
+# optionally followed by a one-based position.
+ERROR_PATH_STEP = re.compile(r"^(\*|[^:/\[\]*]+)(?:\[([1-9][0-9]*)\])?$")
+# Number of distinct error messages whose rewritten reason is memoized.
+DEFAULT_REASON_CACHE_SIZE = 4096
+# Rewrites the match of an error message, optionally given the one-based
+# sibling position of the element the error is about, into a reason.
+ReasonRewrite = Callable[..., str | None]
+
+
+class LxmlErrorLocator:
+    """
+    Resolves lxml error paths to elements of the validated document.
+
+    lxml reports the location of each validation error as a structural
+    XPath, e.g. ``/batch/record[5123]/amount``. Evaluating that XPath
+    walks all preceding siblings of each step, so resolving the paths
+    of many errors among many siblings takes quadratic time.
+
+    This class walks such paths itself instead. The children of each
+    parent are indexed by tag once, after which each step is a list
+    lookup. Resolved paths, and the sibling positions of each parent's
+    children, are cached, so that each error is resolved in time
+    proportional to the depth of its element. Paths in another form are
+    still evaluated as XPath, once per distinct path.
+
+    A locator is meant for the errors of one validation of a document,
+    which must not be modified while the locator is in use.
+    """
+
+    def __init__(self, document: etree._ElementTree) -> None:
+        """
+        Initializes an LxmlErrorLocator instance.
+        """
+        self.document = document
+        self._elements: dict[str, etree._Element | None] = {}
+        self._children: dict[tuple[etree._Element, str], list[etree._Element]] = {}
+        self._positions: dict[etree._Element, dict[etree._Element, int]] = {}
+
+    def find_element(self, path: str) -> etree._Element | None:
+        """
+        Returns the element an lxml error path points to.
+
+        Returns None if the path matches no element or cannot be
+        evaluated.
+        """
+        if path not in self._elements:
+            self._elements[path] = self._resolve_path(path)
+        return self._elements[path]
+
+    def get_readable_path(self, path: str) -> str:
+        """
+        Returns a slash-separated path of local element names, without
+        positions, or the given path if it cannot be resolved.
+        """
+        element = self.find_element(path)
+        if element is None:
+            return path
+        path_parts = [
+            etree.QName(ancestor).localname for ancestor in element.iterancestors()
+        ]
+        path_parts.reverse()
+        path_parts.append(etree.QName(element).localname)
+        return "/" + "/".join(path_parts)
+
+    def get_position(self, path: str) -> int:
+        """
+        Returns the one-based position of the element among all children
+        of its parent, or 1 if that cannot be determined.
+        """
+        element = self.find_element(path)
+        if element is None:
+            return 1
+        parent = element.getparent()
+        if parent is None:
+            return 1
+        if parent not in self._positions:
+            self._positions[parent] = {
+                child: position for position, child in enumerate(parent, start=1)
+            }
+        return self._positions[parent][element]
+
+    def _resolve_path(self, path: str) -> etree._Element | None:
+        """
+        Walks an element path, or evaluates it as XPath if it has
+        another form.
+        """
+        steps = path.split("/")
+        step_matches = [ERROR_PATH_STEP.match(step) for step in steps[1:]]
+        if steps[0] or not step_matches or not all(step_matches):
+            return self._evaluate_xpath(path)
+        element: etree._Element | None = None
+        for step_match in step_matches:
+            name, position = step_match.groups()  # type: ignore[union-attr]
+            candidates = (
+                [self.document.getroot()]
+                if element is None
+                else self._get_children(element, name)
+            )
+            if element is None and not self._matches_name(candidates[0], name):
+                return None
+            index = int(position) - 1 if position else 0
+            if index >= len(candidates):
+                return None
+            element = candidates[index]
+        return element
+
+    def _get_children(self, parent: etree._Element, name: str) -> list[etree._Element]:
+        """
+        Returns the child elements of a parent that match an XPath name
+        test, indexed once per parent and name.
+        """
+        key = (parent, name)
+        if key not in self._children:
+            self._children[key] = [
+                child for child in parent if self._matches_name(child, name)
+            ]
+        return self._children[key]
+
+    @staticmethod
+    def _matches_name(element: etree._Element, name: str) -> bool:
+        """
+        Returns whether an element matches an unprefixed XPath name test.
+
+        Like in XPath, ``*`` matches any element and a plain name only
+        matches elements without namespace.
+        """
+        if not isinstance(element.tag, str):
+            return False
+        return name in ("*", element.tag)
+
+    def _evaluate_xpath(self, path: str) -> etree._Element | None:
+        """
+        Evaluates a path as XPath and returns the first matching element.
+        """
+        try:
+            matches = self.document.xpath(path)
+        except etree.XPathError:
+            return None
+        if not isinstance(matches, list) or not matches:
+            return None
+        first_match = matches[0]
+        return first_match if etree.iselement(first_match) else None
+
+
+# pylint: disable-next=R0903:too-few-public-methods
+class LxmlReasonRewriter:
+    """
+    Rewrites lxml error messages that match a pattern into a reason.
+
+    ``rewrite`` receives the match of ``pattern`` against the message.
+    If ``needs_position`` is True, it also receives the one-based
+    position of the invalid element among its siblings. ``marker`` is a
+    substring that each matching message contains; messages without it
+    are skipped without running the regular expression.
+    """
+
+    def __init__(
+        self,
+        pattern: str | re.Pattern[str],
+        rewrite: ReasonRewrite,
+        marker: str | None = None,
+        needs_position: bool = False,
+    ) -> None:
+        """
+        Initializes an LxmlReasonRewriter instance.
+        """
+        self.pattern = re.compile(pattern)
+        self.rewrite = rewrite
+        self.marker = marker
+        self.needs_position = needs_position
+
+
+class LxmlReasonRegistry:
+    """
+    Rewrites lxml error messages into the reasons xmlschema reports.
+
+    The registry holds LxmlReasonRewriter objects with precompiled
+    patterns and tries them in order; the first one that matches a
+    message wins. Messages that no rewriter matches are reported as-is.
+
+    Heavily invalid files produce the same messages over and over, so
+    the outcome is memoized per distinct message: each message is
+    matched against the patterns once. Only rewriters that need the
+    position of the invalid element run again per error, on the
+    memoized match.
+
+    Use ``register()`` to add rewriters for messages of your own
+    schemas. They take precedence over the built-in ones.
+    """
+
+    def __init__(
+        self,
+        rewriters: list[LxmlReasonRewriter] | None = None,
+        cache_size: int = DEFAULT_REASON_CACHE_SIZE,
+    ) -> None:
+        """
+        Initializes an LxmlReasonRegistry instance.
+        """
+        self.rewriters = list(rewriters or [])
+        self._find_rewriter = lru_cache(maxsize=cache_size)(self._match_message)
+
+    def register(
+        self,
+        pattern: str | re.Pattern[str],
+        rewrite: ReasonRewrite,
+        marker: str | None = None,
+        needs_position: bool = False,
+    ) -> LxmlReasonRewriter:
+        """
+        Adds a rewriter that takes precedence over those registered
+        before, and returns it.
+        """
+        rewriter = LxmlReasonRewriter(pattern, rewrite, marker, needs_position)
+        self.rewriters.insert(0, rewriter)
+        self._find_rewriter.cache_clear()
+        return rewriter
+
+    def get_reason(
+        self, message: str, get_position: Callable[[], int] = lambda: 1
+    ) -> str:
+        """
+        Returns the reason for an lxml error message.
+
+        ``get_position`` is only called if the matching rewriter needs
+        the position of the invalid element.
+        """
+        reason, rewriter, match = self._find_rewriter(message)
+        if rewriter is None or match is None:
+            return reason
+        return rewriter.rewrite(match, get_position()) or message
+
+    def _match_message(
+        self, message: str
+    ) -> tuple[str, LxmlReasonRewriter | None, re.Match[str] | None]:
+        """
+        Finds the first rewriter for a message.
+
+        Returns the reason if it does not depend on the position of the
+        invalid element, or else the rewriter plus the match to pass to
+        it.
+        """
+        for rewriter in self.rewriters:
+            if rewriter.marker is not None and rewriter.marker not in message:
+                continue
+            match = rewriter.pattern.match(message)
+            if match is None:
+                continue
+            if rewriter.needs_position:
+                return message, rewriter, match
+            reason = rewriter.rewrite(match)
+            # A rewriter may decline a match by returning None.
+            if reason is not None:
+                return reason, None, None
+        return message, None, None
+
+
+def _rewrite_invalid_value(match: re.Match[str]) -> str | None:
+    """
+    Rewrites an invalid atomic value message for common types.
+    """
+    _, value, value_type = match.groups()
+    if value_type in {"xs:int", "xs:integer"}:
+        return f"invalid literal for int() with base 10: '{value}'"
+    if value_type == "xs:decimal":
+        return f"invalid value '{value}' for xs:decimal"
+    if value_type == "xs:ID":
+        return "value doesn't match any pattern of ['[\\\\i-[:]][\\\\c-[:]]*']"
+    return None
+
+
+def _rewrite_unexpected_child(match: re.Match[str], position: int) -> str:
+    """
+    Rewrites an unexpected child element message.
+    """
+    child_tag, expected_tag = match.groups()
+    reason = f"Unexpected child with tag '{child_tag}' at position {position}."
+    if expected_tag:
+        reason = f"{reason} Tag '{expected_tag.strip()}' expected."
+    return reason
+
+
+def _rewrite_pattern_mismatch(match: re.Match[str]) -> str:
+    """
+    Rewrites a pattern facet violation message.
+    """
+    _, _, pattern = match.groups()
+    pattern = pattern.replace("\\", "\\\\")
+    return f"value doesn't match any pattern of ['{pattern}']"
+
+
+# The registry used by the lxml validation backend.
+DEFAULT_REASON_REGISTRY = LxmlReasonRegistry(
+    [
+        LxmlReasonRewriter(
+            r"Element '([^']+)': '([^']+)' is not a valid value of "
+            r"the atomic type '([^']+)'\.",
+            _rewrite_invalid_value,
+            marker="is not a valid value of the atomic type",
+        ),
+        LxmlReasonRewriter(
+            r"Element '([^']+)': This element is not expected\."
+            r"(?: Expected is \( ([^)]+) \)\.)?",
+            _rewrite_unexpected_child,
+            marker="This element is not expected.",
+            needs_position=True,
+        ),
+        LxmlReasonRewriter(
+            r"Element '([^']+)': \[facet 'pattern'\] The value '([^']+)' "
+            r"is not accepted by the pattern '([^']+)'\.",
+            _rewrite_pattern_mismatch,
+            marker="[facet 'pattern']",
+        ),
+    ]
+)
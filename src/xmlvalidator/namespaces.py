@@ -22,12 +22,18 @@ Provides namespace extraction and XML/XSD namespace matching helpers.
 # pylint: disable=I1101:c-extension-no-member
 
 # Standard library imports.
+from collections.abc import Callable
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 # Third party library imports.
 from lxml import etree
 from robot.api import logger
 
+# Local application imports.
+from .streaming import iter_namespace_declarations
+from .verbosity import is_logged
+
 if TYPE_CHECKING:
     from xmlschema import XMLSchema
 
@@ -41,18 +47,32 @@ INFRASTRUCTURE_SCHEMA_NAMESPACES = {
 
 
 def extract_namespaces(
-    xml_root: etree.ElementBase,
+    xml_root: etree.ElementBase | str | Path,
     include_nested: bool | None = False,
     return_dict: bool | None = False,
+    stop_when: Callable[[str], bool] | None = None,
 ) -> set[str] | dict[str | None, str]:
     """
-    Extracts XML namespaces from an XML root element.
+    Extracts XML namespaces from an XML root element or XML file.
 
     Namespaces can be returned as a set of namespace URIs or as a
     dictionary mapping prefixes to URIs. Nested namespace declarations
     are included only when `include_nested` is True.
+
+    If a file path is passed, only the namespaces declared on the root
+    element are read with ``peek_root_namespaces()``, so the file is not
+    parsed beyond the root's start tag. With `include_nested`, the file
+    is streamed with ``stream_nested_namespaces()`` instead of being
+    parsed into a tree, and stops early as soon as `stop_when` returns
+    True for a declared URI.
     """
-    if include_nested:
+    if isinstance(xml_root, (str, Path)):
+        namespaces = (
+            stream_nested_namespaces(xml_root, stop_when)
+            if include_nested
+            else peek_root_namespaces(xml_root)
+        )
+    elif include_nested:
         namespaces = _extract_nested_namespaces(xml_root)
     else:
         namespaces = {
@@ -62,18 +82,68 @@ def extract_namespaces(
     return namespaces if return_dict else set(namespaces.values())
 
 
+def peek_root_namespaces(xml_file_path: str | Path) -> dict[str | None, str]:
+    """
+    Returns the namespaces declared on the root element of an XML file.
+
+    The file is parsed incrementally and only up to the root element's
+    start tag, so the cost does not grow with the size of the file. The
+    rest of the file is not checked for well-formedness. The default
+    namespace has the prefix None, like in ``nsmap``.
+
+    Raises OSError if the file cannot be read and ``etree.XMLSyntaxError``
+    if the file is malformed before the end of the root's start tag.
+    """
+    namespaces: dict[str | None, str] = {}
+    with open(xml_file_path, "rb") as xml_file:
+        for event, item in etree.iterparse(xml_file, events=("start-ns", "start")):
+            # All declarations of the root precede its start event.
+            if event == "start":
+                break
+            prefix, uri = item
+            namespaces[prefix or None] = uri
+    return namespaces
+
+
+def stream_nested_namespaces(
+    xml_file_path: str | Path, stop_when: Callable[[str], bool] | None = None
+) -> dict[str | None, str]:
+    """
+    Extracts the namespaces declared anywhere in an XML file, without
+    building its tree.
+
+    Only namespace declarations are handled, not each element, and
+    memory use does not grow with the size of the file, see
+    ``iter_namespace_declarations()``. If a prefix is declared more
+    than once, the last declaration in document order wins.
+
+    If `stop_when` is given, it is called with the URI of each
+    declaration, and extraction stops as soon as it returns True, e.g.
+    once a namespace of a candidate schema has been seen (see
+    ``SchemaNamespaceIndex.has_namespace()``). The chunks of the file
+    after the one holding that declaration are then neither read nor
+    checked for well-formedness.
+    """
+    namespaces: dict[str | None, str] = {}
+    for prefix, uri in iter_namespace_declarations(Path(xml_file_path)):
+        namespaces[prefix] = uri
+        if stop_when is not None and stop_when(uri):
+            break
+    return namespaces
+
+
 def _extract_nested_namespaces(element: etree.ElementBase) -> dict[str | None, str]:
     """
-    Recursively extracts namespaces from all elements in an XML tree.
+    Extracts the namespaces in scope of an element and those declared
+    on all of its descendants.
+
+    The namespaces that the element inherits from its ancestors are
+    taken from its ``nsmap``. Below it, only the declarations are
+    visited, instead of the inherited namespaces of each element.
     """
-    all_namespaces = {}
-    for el in element.iter(None):
-        all_namespaces.update(
-            {
-                k.replace("xmlns:", "") if k else None: v
-                for k, v in (el.nsmap or {}).items()
-            }
-        )
+    all_namespaces: dict[str | None, str] = dict(element.nsmap)
+    for _, (prefix, uri) in etree.iterwalk(element, events=("start-ns",)):
+        all_namespaces[prefix or None] = uri
     return all_namespaces
 
 
@@ -89,28 +159,114 @@ def schema_matches_xml_namespaces(
         _prepare_schema_namespace_matches(xsd_schema, allow_declared_namespace_match)
     )
     if target_namespace and target_namespace in xml_namespaces:
-        logger.info(
-            f"Schema matched by target namespace: '{target_namespace}'.",
-            also_console=True,
-        )
+        if is_logged("per-file"):
+            logger.info(
+                f"Schema matched by target namespace: '{target_namespace}'.",
+                also_console=True,
+            )
         return True
     matching_imported_namespaces = imported_namespaces & xml_namespaces
     if matching_imported_namespaces:
         namespace = next(iter(matching_imported_namespaces))
-        logger.info(
-            f"Schema matched by imported namespace: '{namespace}'.", also_console=True
-        )
+        if is_logged("per-file"):
+            logger.info(
+                f"Schema matched by imported namespace: '{namespace}'.",
+                also_console=True,
+            )
         return True
     matching_declared_namespaces = declared_match_namespaces & xml_namespaces
     if matching_declared_namespaces:
         namespace = next(iter(matching_declared_namespaces))
-        logger.info(
-            f"Schema matched by declared namespace: '{namespace}'.", also_console=True
-        )
+        if is_logged("per-file"):
+            logger.info(
+                f"Schema matched by declared namespace: '{namespace}'.",
+                also_console=True,
+            )
         return True
     return False
 
 
+class SchemaNamespaceIndex:
+    """
+    Maps schema namespaces to the XSD files that can validate them.
+
+    The index applies the same rules as
+    ``schema_matches_xml_namespaces()``, but it inspects every candidate
+    schema only once. Matching an XML file then becomes a lookup of the
+    XML's namespaces, instead of a comparison against every schema.
+
+    Schemas keep the order in which they were added: if several schemas
+    match an XML file, the first added schema wins, just like when the
+    candidate schemas are tested one after another.
+    """
+
+    # Match kinds, ordered by precedence within a single schema.
+    MATCH_KINDS = ("target", "imported", "declared")
+
+    def __init__(self, allow_declared_namespace_match: bool = False) -> None:
+        """
+        Initializes an empty SchemaNamespaceIndex instance.
+        """
+        self.allow_declared_namespace_match = allow_declared_namespace_match
+        self.xsd_file_paths: list[Path] = []
+        # Namespace -> (schema position, match kind), in schema order.
+        self._matches_by_namespace: dict[str, list[tuple[int, str]]] = {}
+
+    def add_schema(self, xsd_file_path: Path, xsd_schema: "XMLSchema") -> None:
+        """
+        Registers the matchable namespaces of a loaded schema.
+        """
+        position = len(self.xsd_file_paths)
+        self.xsd_file_paths.append(xsd_file_path)
+        target_namespace, imported_namespaces, declared_match_namespaces = (
+            _prepare_schema_namespace_matches(
+                xsd_schema, self.allow_declared_namespace_match
+            )
+        )
+        target_namespaces = {target_namespace} if target_namespace else set()
+        namespaces_by_kind = (
+            target_namespaces,
+            imported_namespaces - target_namespaces,
+            declared_match_namespaces - imported_namespaces - target_namespaces,
+        )
+        for kind, namespaces in zip(self.MATCH_KINDS, namespaces_by_kind):
+            for namespace in namespaces:
+                self._matches_by_namespace.setdefault(namespace, []).append(
+                    (position, kind)
+                )
+
+    def has_namespace(self, namespace: str) -> bool:
+        """
+        Returns whether an indexed schema matches a namespace.
+        """
+        return namespace in self._matches_by_namespace
+
+    def match(self, xml_namespaces: set[str]) -> Path | None:
+        """
+        Returns the first indexed XSD file that matches the namespaces.
+        """
+        best_match: tuple[int, int, str] | None = None
+        for namespace in xml_namespaces:
+            matches = self._matches_by_namespace.get(namespace)
+            if not matches:
+                continue
+            # Only the earliest schema per namespace can win the match.
+            position, kind = matches[0]
+            candidate = (position, self.MATCH_KINDS.index(kind), namespace)
+            if best_match is None or candidate < best_match:
+                best_match = candidate
+        if best_match is None:
+            return None
+        position, kind_rank, namespace = best_match
+        if is_logged("per-file"):
+            logger.info(
+                f"Schema matched by {self.MATCH_KINDS[kind_rank]} namespace: "
+                f"'{namespace}'.",
+                also_console=True,
+            )
+        return self.xsd_file_paths[position]
+
+
 def _prepare_schema_namespace_matches(
     xsd_schema: "XMLSchema", allow_declared_namespace_match: bool
 ) -> tuple[str | None, set[str], set[str]]:
@@ -150,8 +306,9 @@ def _prepare_schema_namespace_matches(
         )
     ) | infrastructure_namespaces
     for namespace in sorted(ignored_namespaces):
-        logger.info(
-            f"Schema namespace ignored during matching: '{namespace}'.",
-            also_console=False,
-        )
+        if is_logged("per-file"):
+            logger.info(
+                f"Schema namespace ignored during matching: '{namespace}'.",
+                also_console=False,
+            )
     return target_namespace, imported_namespaces, declared_match_namespaces
@@ -28,20 +28,36 @@ This module defines:
 - ValidatorResult:
   A lightweight result wrapper for encapsulating success/failure states
   and their corresponding values or errors.
+- ErrorLimits:
+  Caps the number of errors reported per file and per validation run.
 
 These classes are used internally by the XmlValidator library and
 associated utilities to manage and report validation outcomes.
 """
 
 # Standard library imports.
+import csv
+import os
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 # Third party library imports.
-import pandas as pd
 from robot.api import logger
 
+# Local application imports.
+from .error_table import (
+    JSON_TABLE_STYLE_AND_SCRIPT,
+    ErrorTableMode,
+    get_html_table,
+    get_json_table,
+    get_json_table_render_call,
+    validate_error_table_mode,
+)
+from .spill import SpilledErrors
+from .verbosity import get_verbosity, is_logged
+
 
 class ValidatorResultRecorder:
     """
@@ -59,14 +75,31 @@ class ValidatorResultRecorder:
 
     Attributes:
 
-    - errors_by_file (list[dict[str, Any]]):
+    - errors_by_file (list[dict[str, Any]] | SpilledErrors):
       A list of validation error dictionaries, each tagged with its
-      corresponding file name.
+      corresponding file name. If an error spill folder is set, the
+      errors are kept in a JSON Lines file in that folder instead.
 
     - validation_summary (dict[str, list[str]]):
       A dictionary with two keys: 'valid' and 'invalid'. Each key maps
       to a list of file names.
 
+    - truncated_files (list[str]):
+      The names of the files whose errors were not all recorded,
+      because an error limit was reached.
+
+    - skipped_files (list[str]):
+      The names of the files that were not validated, because the run
+      stopped at the first invalid file.
+
+    - error_table (str):
+      How error tables are rendered in the log: ``html`` or ``json``.
+      See the error_table module.
+
+    - max_error_table_rows (int | None):
+      The maximum number of rows of one error table, or None for no
+      maximum.
+
     Notes:
 
     - This class is used internally by XmlValidator to record,
@@ -128,10 +161,20 @@ class ValidatorResultRecorder:
         </script>
       """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        error_table: ErrorTableMode = "html",
+        max_error_table_rows: int | None = None,
+        error_spill_dir: str | Path | None = None,
+    ) -> None:
         """
         Initializes a ValidatorResultRecorder instance.
 
+        Raises ValueError for an unsupported ``error_table`` mode or a
+        ``max_error_table_rows`` below 1. If ``error_spill_dir`` is set,
+        errors are written to a JSON Lines file in that folder as each
+        file completes, instead of being kept in memory.
+
         The recorder starts with:
 
         - an empty error collection
@@ -139,11 +182,25 @@ class ValidatorResultRecorder:
         - error-table-id counter set to zero
         """
         # Stores all collected errors, grouped by source file.
-        self.errors_by_file: list[dict[str, Any]] = []
+        self.errors_by_file: list[dict[str, Any]] | SpilledErrors = (
+            SpilledErrors(error_spill_dir) if error_spill_dir else []
+        )
         # Tracks validated file names by outcome category.
         self.validation_summary: dict[str, list[str]] = {"valid": [], "invalid": []}
+        # Tracks the files whose errors were truncated by an error limit.
+        self.truncated_files: list[str] = []
+        # Tracks the files left unvalidated by an aborted run.
+        self.skipped_files: list[str] = []
         # Tracks error tables so each table receives a unique HTML id.
         self.error_table_id: int = 0
+        # Sets how error tables are rendered and how many rows they hold.
+        self.error_table = validate_error_table_mode(error_table)
+        if max_error_table_rows is not None and max_error_table_rows < 1:
+            raise ValueError(
+                "max_error_table_rows must be 1 or higher, got: "
+                f"{max_error_table_rows}."
+            )
+        self.max_error_table_rows = max_error_table_rows
 
     # Collect validation results.
 
@@ -165,7 +222,8 @@ class ValidatorResultRecorder:
         None
         """
         self.validation_summary["valid"].append(file_path.name)
-        logger.info("\tXML is valid!", also_console=True)
+        if is_logged("per-file"):
+            logger.info("\tXML is valid!", also_console=True)
 
     def add_invalid_file(self, file_path: Path) -> None:
         """
@@ -185,7 +243,8 @@ class ValidatorResultRecorder:
         None
         """
         self.validation_summary["invalid"].append(file_path.name)
-        logger.warn("\tXML is invalid:")
+        if is_logged("per-file"):
+            logger.warn("\tXML is invalid:")
 
     def add_file_errors(
         self,
@@ -224,6 +283,54 @@ class ValidatorResultRecorder:
         for error in error_details:
             error_entry = {"file_name": file_path.name, **error}
             self.errors_by_file.append(error_entry)
+        self._flush_errors()
+
+    def add_truncation_note(self, file_path: Path, note: str) -> None:
+        """
+        Records that not all errors of a file were recorded.
+
+        The note is added to `errors_by_file` as the `reason` of an
+        extra entry for the file, so that it shows up in the error
+        table and the CSV file, and it is logged as a warning.
+
+        Args:
+
+        - file_path (Path):
+          The path of the XML file whose errors were truncated.
+
+        - note (str):
+          Describes which error limit was reached.
+
+        Returns:
+
+        None
+        """
+        self.truncated_files.append(file_path.name)
+        self.errors_by_file.append({"file_name": file_path.name, "reason": note})
+        self._flush_errors()
+        if is_logged("per-error"):
+            logger.warn(f"\t\t{note}")
+
+    def add_skipped_files(self, file_paths: list[Path]) -> None:
+        """
+        Records files that were not validated and logs their names.
+
+        Args:
+
+        - file_paths (list[Path]):
+          The paths of the XML files that were skipped.
+
+        Returns:
+
+        None
+        """
+        self.skipped_files.extend(file_path.name for file_path in file_paths)
+        if not is_logged("per-file"):
+            return
+        logger.warn(
+            f"Stopped at the first invalid file: skipped {len(file_paths)} "
+            f"file(s): {', '.join(file_path.name for file_path in file_paths)}."
+        )
 
     # Write errors to the console and log file.
 
@@ -245,6 +352,8 @@ class ValidatorResultRecorder:
 
         None
         """
+        if not is_logged("per-error"):
+            return
         for idx, error in enumerate(errors):
             logger.warn(f"\t\tError #{idx}:")
             for key, value in error.items():
@@ -259,10 +368,23 @@ class ValidatorResultRecorder:
         files from `_get_summary()` and logs them in a structured
         format.
 
+        With the ``summary`` verbosity, the summary is logged as one
+        aggregated message, including the number of collected errors.
+
         Returns:
 
         None
         """
+        if get_verbosity() == "summary":
+            summary = ", ".join(
+                f"{category}: {value}"
+                for category, value in self._get_summary().items()
+            )
+            error_count = len(self.errors_by_file) - len(self.truncated_files)
+            logger.info(f"{summary}, Errors: {error_count}.", also_console=True)
+            return
+        if not is_logged("per-file"):
+            return
         for category, value in self._get_summary().items():
             logger.info(f"{category}: {value}.", also_console=True)
 
@@ -280,25 +402,31 @@ class ValidatorResultRecorder:
           {
               "Total_files validated": int,
               "Valid files": int,
-              "Invalid files": int
+              "Invalid files": int,
+              "Skipped files": int  (only if files were skipped)
           }
         """
         valid_files = len(self.validation_summary.get("valid", []))
         invalid_files = len(self.validation_summary.get("invalid", []))
-        return {
+        summary = {
             "Total_files validated": valid_files + invalid_files,
             "Valid files": valid_files,
             "Invalid files": invalid_files,
         }
+        if self.skipped_files:
+            summary["Skipped files"] = len(self.skipped_files)
+        return summary
 
     # Write extended reports.
 
-    def write_error_table_to_log(self, errors: list[dict[str, Any]]) -> None:
+    def write_error_table_to_log(self, errors: Sequence[dict[str, Any]]) -> None:
         """
         Writes a table of validation errors to the log file.
 
         This method takes a list of error dictionaries and renders them
-        as a filterable HTML table in the Robot Framework log.
+        as a filterable table in the Robot Framework log, in the mode
+        set by `error_table`. Only the first `max_error_table_rows`
+        errors are included, if set.
 
         Args:
 
@@ -311,19 +439,41 @@ class ValidatorResultRecorder:
 
         - If `errors` is an empty list, the method exits early and logs
           an informational message without writing a table to the log.
-        - The method uses `pandas` for HTML table generation.
+        - In ``html`` mode, the table has the markup of a pandas
+          ``DataFrame.to_html()`` table, so that the table style
+          applies. Missing values and None are rendered as empty cells.
+        - In ``json`` mode, the rows are embedded as JSON and rendered
+          by the browser, only the rows scrolled into view at a time.
         """
         # Return if no errors were passed.
         if not errors:
-            logger.info("No errors to write to log file.")
+            if is_logged("per-file"):
+                logger.info("No errors to write to log file.")
             return
-        # Convert the errors list to a DataFrame.
-        df = pd.DataFrame(errors)
-        # Convert the DataFrame to HTML.
-        html_table = df.to_html(index=False, border=0)
+        # Cap the rows of the table.
+        total = len(errors)
+        errors = errors[: self.max_error_table_rows]
         # Get the table id and increment for the next one.
         error_table_id = self.error_table_id
         self.error_table_id += 1
+        if self.error_table == "json":
+            full_html = get_json_table(
+                error_table_id, errors, self._get_columns(errors), total
+            )
+            # Add the style and render script if it is the first table.
+            if error_table_id == 0:
+                full_html = f"{full_html}{JSON_TABLE_STYLE_AND_SCRIPT}"
+            logger.info(
+                f"{full_html}{get_json_table_render_call(error_table_id)}", html=True
+            )
+            return
+        # Convert the errors list to an HTML table.
+        html_table = get_html_table(errors, self._get_columns(errors))
+        if len(errors) < total:
+            html_table = (
+                f"<p>Showing the first {len(errors)} of {total} errors, "
+                f"see the CSV export for all.</p>{html_table}"
+            )
         # Add filter input to the HTML table (includes the function call).
         full_html = f"""<div id="table_block_{error_table_id}">
             <input class="filter" type="text"
@@ -339,7 +489,7 @@ class ValidatorResultRecorder:
 
     def write_errors_to_csv(
         self,
-        errors: list[dict[str, Any]],
+        errors: Sequence[dict[str, Any]],
         output_path: Path,
         include_timestamp: bool | None = False,
         file_name_column: str | None = None,
@@ -389,15 +539,18 @@ class ValidatorResultRecorder:
           an informational message without creating a file.
         - Column reordering occurs only if `file_name_column` exists in
           the error dictionaries.
-        - If different error dictionaries contain different keys,
-          pandas creates columns for the union of those keys. Missing
-          values are written as empty CSV cells. Explicit values such as
-          "Unavailable" are preserved.
-        - The method uses `pandas` for CSV generation.
+        - If different error dictionaries contain different keys, the
+          CSV holds columns for the union of those keys, in order of
+          first appearance. Missing values and None are written as empty
+          CSV cells. Explicit values such as "Unavailable" are
+          preserved.
+        - The rows are streamed to the file with the `csv` module, so no
+          copy of the errors is built in memory.
         """
         # Nothing to export.
         if not errors:
-            logger.info("No errors to write to CSV.")
+            if is_logged("per-file"):
+                logger.info("No errors to write to CSV.")
             return ""
         # Generate a timestamp to be added to the filename.
         timestamp = (
@@ -407,25 +560,43 @@ class ValidatorResultRecorder:
         )
         # Construct the output path.
         output_csv_path = output_path.parent / f"errors{timestamp}.csv"
-        # Convert the errors list to a DataFrame.
-        df = pd.DataFrame(errors)
+        columns = self._get_columns(errors)
         # Ensure the specified column is first, if provided.
-        if file_name_column and file_name_column in df.columns:
-            columns_order = [file_name_column] + [
-                col for col in df.columns if col != file_name_column
-            ]
-            df = df[columns_order]
-        # Write the DataFrame to a CSV file.
+        if file_name_column and file_name_column in columns:
+            columns.remove(file_name_column)
+            columns.insert(0, file_name_column)
+        # Stream the errors to a CSV file.
         try:
-            df.to_csv(output_csv_path, index=False)
+            with output_csv_path.open("w", encoding="utf-8", newline="") as csv_file:
+                writer = csv.writer(csv_file, lineterminator=os.linesep)
+                writer.writerow(columns)
+                writer.writerows(
+                    [error.get(column) for column in columns] for error in errors
+                )
+        except OSError as e:
+            raise OSError(f"Failed to write CSV file: {output_csv_path}.") from e
+        if is_logged("per-file"):
             logger.info(
                 f"Validation errors exported to: \n\t'{output_csv_path}'.",
                 also_console=True,
             )
-        except OSError as e:
-            raise OSError(f"Failed to write CSV file: {output_csv_path}.") from e
         return str(output_csv_path.resolve())
 
+    def _flush_errors(self) -> None:
+        """
+        Writes the buffered errors of spilled error storage to disk.
+        """
+        if isinstance(self.errors_by_file, SpilledErrors):
+            self.errors_by_file.flush()
+
+    @staticmethod
+    def _get_columns(errors: Sequence[dict[str, Any]]) -> list[str]:
+        """
+        Returns the union of the keys of all errors, in order of first
+        appearance.
+        """
+        return list(dict.fromkeys(key for error in errors for key in error))
+
     # Clear all results.
 
     def reset(self) -> None:
@@ -435,13 +606,26 @@ class ValidatorResultRecorder:
         This method resets the internal state of the result recorder,
         including:
 
-        - `errors_by_file`: list emptied.
+        - `errors_by_file`: list emptied. Spilled errors are discarded,
+          deleting their spill file, and a new spill file is created
+          once errors are added again.
         - `validation_summary`: dict reset to default structure with
           empty 'valid' and 'invalid' lists
+        - `truncated_files`: list emptied.
+        - `skipped_files`: list emptied.
         - `error_table_id`: counter reset to zero.
         """
-        self.errors_by_file.clear()
+        if isinstance(self.errors_by_file, SpilledErrors):
+            # Delete the previous run's file, so runs do not pile up files.
+            self.errors_by_file.discard()
+            self.errors_by_file = SpilledErrors(
+                self.errors_by_file.spill_dir, self.errors_by_file.buffer_size
+            )
+        else:
+            self.errors_by_file.clear()
         self.validation_summary = {"valid": [], "invalid": []}
+        self.truncated_files.clear()
+        self.skipped_files.clear()
         self.error_table_id = 0
 
 
@@ -532,3 +716,78 @@ class ValidatorResult:  # pylint: disable=R0903:too-few-public-methods
         if self.success:
             return f"Result(success=True, value={self.value})"
         return f"Result(success=False, error={self.error})"
+
+
+class ErrorLimits:
+    """
+    Caps the number of errors reported per file and per validation run.
+
+    Files are validated with a limit on the number of errors to
+    collect, so that a badly broken file does not produce millions of
+    error dictionaries. One more error than will be reported is
+    collected, which tells whether the errors of a file were
+    truncated.
+    """
+
+    def __init__(
+        self,
+        max_errors_per_file: int | None = None,
+        max_errors_total: int | None = None,
+    ) -> None:
+        """
+        Initializes an ErrorLimits instance.
+
+        Raises ValueError if a limit is lower than 1.
+        """
+        for setting, value in (
+            ("max_errors_per_file", max_errors_per_file),
+            ("max_errors_total", max_errors_total),
+        ):
+            if value is not None and value < 1:
+                raise ValueError(f"{setting} must be 1 or higher, got: {value}.")
+        self.max_errors_per_file = max_errors_per_file
+        self.max_errors_total = max_errors_total
+        self.reported_errors = 0
+
+    def get_file_limit(self) -> int | None:
+        """
+        Returns the number of errors that will be reported for the next
+        file, or None if that number is not limited.
+        """
+        if self.max_errors_total is None:
+            return self.max_errors_per_file
+        remaining_errors = max(0, self.max_errors_total - self.reported_errors)
+        if self.max_errors_per_file is None:
+            return remaining_errors
+        return min(remaining_errors, self.max_errors_per_file)
+
+    def get_collection_limit(self) -> int | None:
+        """
+        Returns the number of errors to collect for the next file: one
+        more than will be reported, or None if that is not limited.
+        """
+        file_limit = self.get_file_limit()
+        return None if file_limit is None else file_limit + 1
+
+    def apply(
+        self, errors: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Truncates the errors of one file to the limit and counts them.
+
+        Returns the errors to report plus, if errors were dropped, a
+        note that says so.
+        """
+        file_limit = self.get_file_limit()
+        if file_limit is None or len(errors) <= file_limit:
+            self.reported_errors += len(errors)
+            return errors, None
+        self.reported_errors += file_limit
+        if file_limit == self.max_errors_per_file:
+            setting = f"max_errors_per_file={self.max_errors_per_file}"
+        else:
+            setting = f"max_errors_total={self.max_errors_total}"
+        return errors[:file_limit], (
+            f"Error limit reached ({setting}): only the first {file_limit} "
+            "error(s) of this file are reported."
+        )
@@ -2,7 +2,14 @@
 Schema loading and resolution helpers for xmlvalidator.
 """
 
+from .cache import SchemaDiskCache
+from .catalog import XmlCatalog
 from .manager import ValidatorSchemaManager
 from .resolver import ValidatorSchemaResolver
 
-__all__ = ["ValidatorSchemaManager", "ValidatorSchemaResolver"]
+__all__ = [
+    "SchemaDiskCache",
+    "ValidatorSchemaManager",
+    "ValidatorSchemaResolver",
+    "XmlCatalog",
+]
@@ -0,0 +1,182 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides a persistent on-disk cache for built XMLSchema objects.
+
+The SchemaDiskCache class stores pickled xmlschema schema objects in a
+cache folder, so that later Robot Framework runs can skip rebuilding
+schemas whose files did not change.
+"""
+
+# Standard library imports.
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+from urllib.request import url2pathname
+
+# Third party library imports.
+import xmlschema
+from xmlschema import XMLSchema
+
+# Bump when the layout of the cache files changes.
+CACHE_FORMAT_VERSION = 1
+
+
+class SchemaDiskCache:
+    """
+    Persists built XMLSchema objects in a cache folder across runs.
+
+    Each cached schema is stored as a pickle, named after a content
+    hash of the XSD file and of all files it (transitively) includes
+    or imports. A small JSON manifest per XSD file and ``base_url``
+    records which files make up that closure. On lookup, the files
+    listed in the manifest are hashed again: the cached schema is only
+    used if none of them changed. The installed xmlschema version is
+    part of each hash, so upgrading xmlschema invalidates the cache.
+
+    Schemas that include or import files from a non-local location
+    are not cached, as their content cannot be checked cheaply.
+
+    The cache folder must only be shared with trusted processes, as
+    cached schemas are unpickled.
+    """
+
+    def __init__(self, cache_dir: str | Path, cache_namespace: str = "") -> None:
+        """
+        Initializes a SchemaDiskCache instance.
+
+        The cache folder is created if it does not exist yet. Schemas
+        built with different settings that affect the result (e.g. a
+        different XML catalog) must use a different
+        ``cache_namespace``.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_namespace = cache_namespace
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(self, xsd_path: Path, base_url: str | None = None) -> XMLSchema | None:
+        """
+        Returns the cached schema for an XSD file, if still up to date.
+
+        Returns None if nothing was cached for the XSD file and
+        ``base_url``, if one of the schema files changed or if the
+        cache entry cannot be read.
+        """
+        try:
+            manifest = json.loads(
+                self._get_manifest_path(xsd_path, base_url).read_text(encoding="utf-8")
+            )
+            closure_files = [Path(file_path) for file_path in manifest["files"]]
+            closure_hash = self._hash_closure(closure_files, base_url)
+            if closure_hash != manifest["closure_hash"]:
+                return None
+            with (self.cache_dir / f"{closure_hash}.pickle").open("rb") as file:
+                schema = pickle.load(file)
+        except Exception:  # pylint: disable=W0718:broad-exception-caught
+            # Any unreadable or outdated entry simply counts as a miss.
+            return None
+        return schema if isinstance(schema, XMLSchema) else None
+
+    def store(self, xsd_path: Path, base_url: str | None, schema: XMLSchema) -> bool:
+        """
+        Stores a built schema for an XSD file and ``base_url``.
+
+        Returns whether the schema was stored. Failing to store a schema
+        is not an error: the schema is then simply built again next time.
+        """
+        closure_files = self._get_closure_files(schema)
+        if closure_files is None:
+            return False
+        try:
+            closure_hash = self._hash_closure(closure_files, base_url)
+            self._write_atomically(
+                self.cache_dir / f"{closure_hash}.pickle", pickle.dumps(schema)
+            )
+            manifest = {
+                "files": [str(file_path) for file_path in closure_files],
+                "closure_hash": closure_hash,
+            }
+            self._write_atomically(
+                self._get_manifest_path(xsd_path, base_url),
+                json.dumps(manifest).encode("utf-8"),
+            )
+        except Exception:  # pylint: disable=W0718:broad-exception-caught
+            return False
+        return True
+
+    def _get_manifest_path(self, xsd_path: Path, base_url: str | None) -> Path:
+        """
+        Returns the manifest path for an XSD file and ``base_url``.
+        """
+        key = hashlib.sha256(
+            f"{CACHE_FORMAT_VERSION}|{self.cache_namespace}|{xsd_path.resolve()}|"
+            f"{base_url}".encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _get_closure_files(schema: XMLSchema) -> list[Path] | None:
+        """
+        Returns the local files the schema was built from.
+
+        The schemas that ship with xmlschema itself are left out. Returns
+        None if one of the other schemas was not read from a local file.
+        """
+        xmlschema_dir = Path(xmlschema.__file__).parent.resolve()
+        closure_files: set[Path] = set()
+        for closure_schema in schema.maps.iter_schemas():
+            url = closure_schema.url
+            if url is None:
+                return None
+            url_parts = urlsplit(url)
+            if url_parts.scheme not in {"file", ""}:
+                return None
+            file_path = Path(url2pathname(unquote(url_parts.path))).resolve()
+            if not file_path.is_relative_to(xmlschema_dir):
+                closure_files.add(file_path)
+        return sorted(closure_files)
+
+    def _hash_closure(self, closure_files: list[Path], base_url: str | None) -> str:
+        """
+        Returns a hash over the content of all files of a schema.
+        """
+        closure_hash = hashlib.sha256(
+            f"{CACHE_FORMAT_VERSION}|{xmlschema.__version__}|{self.cache_namespace}|"
+            f"{base_url}".encode()
+        )
+        for file_path in closure_files:
+            closure_hash.update(str(file_path).encode())
+            closure_hash.update(hashlib.sha256(file_path.read_bytes()).digest())
+        return closure_hash.hexdigest()
+
+    def _write_atomically(self, file_path: Path, content: bytes) -> None:
+        """
+        Writes a cache file so that readers never see a partial file.
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
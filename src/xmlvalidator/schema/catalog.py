@@ -0,0 +1,357 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=I1101:c-extension-no-member
+
+"""
+Provides the document resolution used to load and compile XSD schemas.
+
+The XmlCatalog class maps schema URLs to local files, like an OASIS XML
+catalog does. The SchemaDocumentStore class keeps an in-memory catalog
+of the XSD documents that were read from disk. The
+SchemaDocumentResolver class serves included and imported schema
+documents from those catalogs while lxml compiles a schema.
+"""
+
+# Standard library imports.
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import url2pathname
+
+# Third party library imports.
+from lxml import etree
+
+# Default limit of the combined size of the documents kept in memory.
+DEFAULT_MAX_STORED_DOCUMENT_BYTES = 64 * 1024 * 1024
+# Namespace of OASIS XML catalog files.
+OASIS_CATALOG_NAMESPACE = "urn:oasis:names:tc:entity:xmlns:xml:catalog"
+
+
+def get_local_path(url: str) -> Path | None:
+    """
+    Returns the local file path a URL or file path points to.
+
+    Returns None for URLs that point to a non-local location, e.g. an
+    http(s) URL.
+    """
+    url_parts = urlsplit(url)
+    if url_parts.scheme == "file":
+        return Path(url2pathname(url_parts.path)).resolve()
+    # One-letter schemes are Windows drive letters, not URL schemes.
+    if len(url_parts.scheme) > 1:
+        return None
+    return Path(url).resolve()
+
+
+def resolve_schema_location(
+    location: str | None, document_url: str, xml_catalog: "XmlCatalog | None" = None
+) -> Path | None:
+    """
+    Resolves a schemaLocation, relative to the URL of the document it
+    appears in, to a local file path.
+
+    Remote locations are mapped through ``xml_catalog``, if given.
+    Returns None if the location is empty or not a local file.
+    """
+    if not location:
+        return None
+    document_path = get_local_path(document_url)
+    if len(urlsplit(location).scheme) <= 1 and document_path is not None:
+        return (document_path.parent / unquote(location)).resolve()
+    # Remote locations, or relative locations in a remote document.
+    url = urljoin(document_url, location)
+    mapped_path = xml_catalog.resolve(url) if xml_catalog else None
+    return get_local_path(mapped_path or url)
+
+
+class XmlCatalog:
+    """
+    Maps schema URLs to local files, so that schemas can be loaded
+    without network access.
+
+    Large standards schemas often import schemas such as ``xml.xsd``
+    or ``xlink.xsd`` by absolute URL. A catalog maps those URLs to
+    local copies. A catalog can be read from an OASIS XML catalog file
+    (``uri``, ``system``, ``rewriteURI``, ``rewriteSystem`` and
+    ``nextCatalog`` entries are supported) or be built from a
+    dictionary of URLs to local paths. Dictionary keys ending with a
+    slash map every URL that starts with that key, like
+    ``rewriteURI`` does.
+    """
+
+    def __init__(
+        self,
+        mappings: dict[str, str] | None = None,
+        rewrites: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Initializes an XmlCatalog instance.
+
+        ``mappings`` maps complete URLs to local paths. ``rewrites``
+        maps URL prefixes to local path prefixes.
+        """
+        self.mappings = dict(mappings or {})
+        # Try the longest prefixes first, like OASIS catalogs do.
+        self.rewrites = dict(
+            sorted((rewrites or {}).items(), key=lambda item: -len(item[0]))
+        )
+
+    @classmethod
+    def from_value(
+        cls, value: "str | Path | dict[str, str] | XmlCatalog"
+    ) -> "XmlCatalog":
+        """
+        Creates a catalog from a catalog file path or a dictionary.
+        """
+        if isinstance(value, XmlCatalog):
+            return value
+        if isinstance(value, dict):
+            mappings: dict[str, str] = {}
+            rewrites: dict[str, str] = {}
+            for url, local_path in value.items():
+                target = rewrites if url.endswith("/") else mappings
+                target[url] = str(Path(local_path).resolve()) + (
+                    "/" if url.endswith("/") else ""
+                )
+            return cls(mappings, rewrites)
+        return cls.from_file(Path(value))
+
+    @classmethod
+    def from_file(cls, catalog_path: Path) -> "XmlCatalog":
+        """
+        Reads an OASIS XML catalog file.
+
+        Relative local paths in the catalog are resolved against the
+        folder of the catalog file. Raises OSError or an lxml parse
+        error if the catalog file cannot be read.
+        """
+        xml_catalog = cls()
+        pending_catalogs = [catalog_path.resolve()]
+        read_catalogs: set[Path] = set()
+        while pending_catalogs:
+            catalog_path = pending_catalogs.pop(0)
+            if catalog_path in read_catalogs:
+                continue
+            read_catalogs.add(catalog_path)
+            root = etree.parse(str(catalog_path)).getroot()
+            for element in root.iter(f"{{{OASIS_CATALOG_NAMESPACE}}}*"):
+                xml_catalog._add_catalog_entry(
+                    etree.QName(element).localname,
+                    element.attrib,
+                    catalog_path,
+                    pending_catalogs,
+                )
+        # Sort the rewrite prefixes from all catalog files.
+        return cls(xml_catalog.mappings, xml_catalog.rewrites)
+
+    def _add_catalog_entry(
+        self,
+        entry_type: str,
+        attributes: "etree._Attrib",
+        catalog_path: Path,
+        pending_catalogs: list[Path],
+    ) -> None:
+        """
+        Adds one entry of an OASIS XML catalog file.
+
+        Entries that lack one of their required attributes are ignored,
+        like entries of an unsupported type.
+        """
+
+        def to_local(reference: str) -> str:
+            return str(catalog_path.parent / unquote(reference))
+
+        if entry_type == "uri" and "name" in attributes and "uri" in attributes:
+            self.mappings[attributes["name"]] = to_local(attributes["uri"])
+        elif (
+            entry_type == "system" and "systemId" in attributes and "uri" in attributes
+        ):
+            self.mappings[attributes["systemId"]] = to_local(attributes["uri"])
+        elif (
+            entry_type == "rewriteURI"
+            and "uriStartString" in attributes
+            and "rewritePrefix" in attributes
+        ):
+            self.rewrites[attributes["uriStartString"]] = to_local(
+                attributes["rewritePrefix"]
+            )
+        elif (
+            entry_type == "rewriteSystem"
+            and "systemIdStartString" in attributes
+            and "rewritePrefix" in attributes
+        ):
+            self.rewrites[attributes["systemIdStartString"]] = to_local(
+                attributes["rewritePrefix"]
+            )
+        elif entry_type == "nextCatalog" and "catalog" in attributes:
+            pending_catalogs.append(Path(to_local(attributes["catalog"])).resolve())
+
+    def resolve(self, url: str) -> str | None:
+        """
+        Returns the local path a URL is mapped to, or None.
+        """
+        if url in self.mappings:
+            return self.mappings[url]
+        for url_prefix, path_prefix in self.rewrites.items():
+            if url.startswith(url_prefix):
+                return path_prefix.rstrip("/\\") + "/" + url[len(url_prefix) :]
+        return None
+
+    def get_fingerprint(self) -> str:
+        """
+        Returns a hash that identifies the catalog's mappings.
+        """
+        return hashlib.sha256(
+            repr((sorted(self.mappings.items()), list(self.rewrites.items()))).encode()
+        ).hexdigest()
+
+
+# pylint: disable-next=R0903:too-few-public-methods
+class CatalogUriMapper:
+    """
+    Maps schema URLs through an XML catalog for xmlschema.
+
+    Remote URLs that the catalog does not map are passed on unchanged
+    and recorded, so that a failing schema build can name them.
+    """
+
+    def __init__(self, xml_catalog: XmlCatalog) -> None:
+        """
+        Initializes a CatalogUriMapper instance.
+        """
+        self.xml_catalog = xml_catalog
+        self.unmapped_urls: list[str] = []
+
+    def __call__(self, url: str) -> str:
+        """
+        Returns the local path a URL is mapped to, or the URL itself.
+        """
+        mapped_path = self.xml_catalog.resolve(url)
+        if mapped_path is not None:
+            return mapped_path
+        if get_local_path(url) is None and url not in self.unmapped_urls:
+            self.unmapped_urls.append(url)
+        return url
+
+
+class SchemaDocumentStore:
+    """
+    Keeps the content of XSD documents read from disk in memory.
+
+    XSD files that are included or imported by several schemas (or by
+    several versions of one schema) are then read from disk only once.
+    A stored document is read again if its modification time or size
+    changed. The store is bounded by the combined size of its
+    documents: the least recently used documents are dropped first.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_STORED_DOCUMENT_BYTES) -> None:
+        """
+        Initializes a SchemaDocumentStore instance.
+        """
+        self.max_bytes = max_bytes
+        self.stored_bytes = 0
+        self._documents: OrderedDict[Path, tuple[int, int, bytes]] = OrderedDict()
+
+    def read(self, file_path: Path) -> bytes:
+        """
+        Returns the content of a file, from memory if it is unchanged.
+
+        Raises OSError if the file cannot be read.
+        """
+        stat_result = file_path.stat()
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        stored_document = self._documents.get(file_path)
+        if stored_document is not None and stored_document[:2] == signature:
+            self._documents.move_to_end(file_path)
+            return stored_document[2]
+        content = file_path.read_bytes()
+        if stored_document is not None:
+            self.stored_bytes -= len(stored_document[2])
+        self._documents[file_path] = (*signature, content)
+        self._documents.move_to_end(file_path)
+        self.stored_bytes += len(content)
+        while len(self._documents) > 1 and self.stored_bytes > self.max_bytes:
+            _, (_, _, dropped_content) = self._documents.popitem(last=False)
+            self.stored_bytes -= len(dropped_content)
+        return content
+
+    def parse(
+        self, file_path: Path, document_url: str, parser: etree.XMLParser | None = None
+    ) -> etree._ElementTree:
+        """
+        Parses a stored document under the given document URL.
+
+        The document URL determines how lxml resolves relative includes
+        and imports in the document.
+        """
+        return etree.ElementTree(
+            etree.fromstring(
+                self.read(file_path),
+                parser=parser or etree.XMLParser(),
+                base_url=document_url,
+            )
+        )
+
+
+# pylint: disable-next=R0903:too-few-public-methods
+class SchemaDocumentResolver(etree.Resolver):
+    """
+    Serves schema documents requested by lxml from a document store.
+
+    lxml asks the resolvers of the parser that parsed an XSD document
+    for each document the schema includes or imports. This resolver
+    answers requests for local files from a SchemaDocumentStore and
+    leaves all other requests to lxml's default resolution.
+    """
+
+    def __init__(
+        self,
+        document_store: SchemaDocumentStore,
+        xml_catalog: XmlCatalog | None = None,
+    ) -> None:
+        """
+        Initializes a SchemaDocumentResolver instance.
+
+        URLs mapped by ``xml_catalog`` are served from the local file
+        they are mapped to.
+        """
+        super().__init__()
+        self.document_store = document_store
+        self.xml_catalog = xml_catalog
+
+    def resolve(  # type: ignore[override]
+        self, system_url, public_id, context  # pylint: disable=W0613:unused-argument
+    ):
+        """
+        Returns the requested document if it is a readable local file.
+        """
+        if not system_url:
+            return None
+        mapped_path = self.xml_catalog.resolve(system_url) if self.xml_catalog else None
+        file_path = get_local_path(mapped_path or system_url)
+        if file_path is None:
+            return None
+        try:
+            content = self.document_store.read(file_path)
+        except OSError:
+            return None
+        return self.resolve_string(
+            content, context, base_url=str(file_path) if mapped_path else system_url
+        )
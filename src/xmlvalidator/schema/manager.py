@@ -26,7 +26,13 @@ schemas.
 """
 
 # Standard library imports.
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
+from typing import Generic, TypeVar
+from urllib.parse import unquote, urlsplit
+from urllib.request import url2pathname
 
 # Third party library imports.
 from lxml import etree
@@ -36,8 +42,291 @@ from xmlschema import XMLSchema
 # Local application imports.
 from ..paths import get_file_paths
 from ..results import ValidatorResult
+from ..verbosity import is_logged
+from .cache import SchemaDiskCache
+from .catalog import (
+    CatalogUriMapper,
+    SchemaDocumentResolver,
+    SchemaDocumentStore,
+    XmlCatalog,
+    resolve_schema_location,
+)
 
+# XSD elements through which a schema pulls in other schema files.
+XSD_REFERENCE_TAGS = tuple(
+    f"{{http://www.w3.org/2001/XMLSchema}}{tag}"
+    for tag in ("include", "import", "redefine", "override")
+)
+# Modification time, size and content hash of a file, or None if absent.
+FileState = tuple[int, int, str] | None
+# Rough ratio between the memory a compiled lxml schema takes up and the
+# size of its XSD source files, as measured with lxml 6.
+COMPILED_SCHEMA_SIZE_FACTOR = 20
+# The same ratio for XMLSchema objects, as measured with xmlschema 3.
+XMLSCHEMA_SIZE_FACTOR = 30
+# Default limits of each in-memory schema cache.
+DEFAULT_MAX_CACHED_SCHEMAS = 64
+DEFAULT_MAX_CACHED_SCHEMA_BYTES = 512 * 1024 * 1024
+# A compiled lxml schema or a built XMLSchema object.
+CompiledSchema = TypeVar("CompiledSchema")
 
+
+# pylint: disable-next=R0903:too-few-public-methods
+class SchemaCacheEntry(Generic[CompiledSchema]):
+    """
+    Holds a compiled schema, or its compile error, together with the
+    state of the files it was compiled from.
+
+    For the XSD file and each file it (transitively) includes or
+    imports, the entry records the modification time, the size and a
+    content hash. ``is_current()`` only calls ``stat()`` per file. The
+    content of a file is only hashed again when its modification time
+    or size changed, so that files that were merely touched do not
+    trigger a recompile.
+
+    ``checked_generation`` is the cache generation in which the entry
+    was last found current, see ``SchemaCache.start_generation()``.
+    """
+
+    def __init__(
+        self,
+        compiled: CompiledSchema | Exception,
+        schema_files: list[Path],
+        read_file: Callable[[Path], bytes] = Path.read_bytes,
+        size_factor: int = COMPILED_SCHEMA_SIZE_FACTOR,
+    ) -> None:
+        """
+        Initializes a SchemaCacheEntry instance.
+
+        ``read_file`` reads the schema files to hash their content. The
+        memory size of the compiled schema is estimated as
+        ``size_factor`` times the combined size of the schema files, and
+        as zero for a compile error.
+        """
+        self.compiled = compiled
+        self.checked_generation: int | None = None
+        self.file_states: dict[Path, FileState] = {
+            file_path: self._get_file_state(file_path, read_file)
+            for file_path in schema_files
+        }
+        self.estimated_bytes = size_factor * sum(
+            file_state[1] for file_state in self.file_states.values() if file_state
+        )
+        if isinstance(compiled, Exception):
+            self.estimated_bytes = 0
+
+    def is_current(self) -> bool:
+        """
+        Returns whether none of the schema files changed since compiling.
+        """
+        for file_path, file_state in self.file_states.items():
+            try:
+                stat_result = file_path.stat()
+            except OSError:
+                if file_state is None:
+                    continue
+                return False
+            if file_state is None:
+                return False
+            modified_at, size, content_hash = file_state
+            if (stat_result.st_mtime_ns, stat_result.st_size) == (modified_at, size):
+                continue
+            if (
+                stat_result.st_size != size
+                or self._hash_file(file_path) != content_hash
+            ):
+                return False
+            # Touched, but not changed: remember the new modification time.
+            self.file_states[file_path] = (
+                stat_result.st_mtime_ns,
+                size,
+                content_hash,
+            )
+        return True
+
+    @staticmethod
+    def _get_file_state(
+        file_path: Path, read_file: Callable[[Path], bytes]
+    ) -> FileState:
+        """
+        Returns the modification time, size and content hash of a file.
+        """
+        try:
+            stat_result = file_path.stat()
+            return (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                hashlib.sha256(read_file(file_path)).hexdigest(),
+            )
+        except OSError:
+            return None
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """
+        Returns the SHA-256 hash of a file's content.
+        """
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+# pylint: disable-next=R0902:too-many-instance-attributes
+class SchemaCache(Generic[CompiledSchema]):
+    """
+    Size-bounded, least-recently-used cache of compiled schemas.
+
+    Keys are the resolved XSD path plus the ``base_url`` the schema was
+    compiled with. The manager keeps one cache of compiled lxml schemas
+    and one of built XMLSchema objects.
+
+    The cache is bounded by a maximum number of entries and by the
+    combined estimated memory size of the compiled schemas. When
+    either limit is exceeded, the least recently used entries are
+    evicted. The most recently added entry is always kept, even if it
+    exceeds the size limit on its own.
+
+    Compile errors are cached like compiled schemas, so that a schema
+    that cannot be compiled is not compiled again for each lookup.
+
+    Lookups of entries whose schema files changed count as misses. The
+    cache counts hits, misses and evictions, see ``get_statistics()``.
+
+    Each lookup checks whether the entry's schema files changed, unless
+    a generation was started, see ``start_generation()``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_CACHED_SCHEMAS,
+        max_bytes: int = DEFAULT_MAX_CACHED_SCHEMA_BYTES,
+    ) -> None:
+        """
+        Initializes a SchemaCache instance.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError(
+                "Schema cache limits must be 1 or higher, got: "
+                f"{max_entries} entries, {max_bytes} bytes."
+            )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.estimated_bytes = 0
+        self.generation: int | None = None
+        self._generations = 0
+        self._entries: OrderedDict[
+            tuple[Path, str | None], SchemaCacheEntry[CompiledSchema]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached schemas.
+        """
+        return len(self._entries)
+
+    def get(
+        self, cache_key: tuple[Path, str | None]
+    ) -> SchemaCacheEntry[CompiledSchema] | None:
+        """
+        Returns the current cache entry for a key, or None.
+        """
+        cache_entry = self._entries.get(cache_key)
+        if cache_entry is None or not self._is_current(cache_entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(cache_key)
+        return cache_entry
+
+    def put(
+        self,
+        cache_key: tuple[Path, str | None],
+        cache_entry: SchemaCacheEntry[CompiledSchema],
+    ) -> None:
+        """
+        Adds or replaces an entry and evicts entries beyond the limits.
+        """
+        replaced_entry = self._entries.pop(cache_key, None)
+        if replaced_entry is not None:
+            self.estimated_bytes -= replaced_entry.estimated_bytes
+        cache_entry.checked_generation = self.generation
+        self._entries[cache_key] = cache_entry
+        self.estimated_bytes += cache_entry.estimated_bytes
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or self.estimated_bytes > self.max_bytes
+        ):
+            _, evicted_entry = self._entries.popitem(last=False)
+            self.estimated_bytes -= evicted_entry.estimated_bytes
+            self.evictions += 1
+
+    def get_errors(self) -> dict[tuple[Path, str | None], Exception]:
+        """
+        Returns the cached compile errors whose schema files did not
+        change since, by key, from least to most recently used.
+        """
+        return {
+            cache_key: cache_entry.compiled
+            for cache_key, cache_entry in self._entries.items()
+            if isinstance(cache_entry.compiled, Exception)
+            and self._is_current(cache_entry)
+        }
+
+    def start_generation(self) -> None:
+        """
+        Starts a new generation of lookups, e.g. for one validation run.
+
+        Within a generation, the schema files of each entry are checked
+        for changes only once, on the entry's first lookup, instead of
+        on every lookup. Entries added within the generation are not
+        checked at all. Changes made to schema files during a generation
+        are therefore only detected in the next one.
+        """
+        self._generations += 1
+        self.generation = self._generations
+
+    def end_generation(self) -> None:
+        """
+        Ends the current generation, so that each lookup checks again.
+        """
+        self.generation = None
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        Returns the cache counters, size and limits.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "failures": sum(
+                isinstance(cache_entry.compiled, Exception)
+                for cache_entry in self._entries.values()
+            ),
+            "estimated_bytes": self.estimated_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _is_current(self, cache_entry: SchemaCacheEntry[CompiledSchema]) -> bool:
+        """
+        Returns whether an entry is current, checking its schema files
+        at most once per generation.
+        """
+        if (
+            self.generation is not None
+            and cache_entry.checked_generation == self.generation
+        ):
+            return True
+        if not cache_entry.is_current():
+            return False
+        cache_entry.checked_generation = self.generation
+        return True
+
+
+# pylint: disable-next=R0902:too-many-instance-attributes
 class ValidatorSchemaManager:
     """
     Loads and stores the XSD schema used by validation workflows.
@@ -46,28 +335,118 @@ class ValidatorSchemaManager:
     Framework keyword facade. It is responsible for resolving initial
     schema paths, loading XMLSchema objects and deciding whether an
     existing schema can be reused.
+
+    The lxml validator does not need the XMLSchema object, and building
+    one for a large schema set takes far longer than compiling it with
+    lxml. A schema that lxml can compile can therefore be selected
+    lazily: its XMLSchema object is only built once ``schema`` is read,
+    e.g. for xmlschema diagnostics or metadata.
+
+    Built XMLSchema objects are cached in memory as well, so that files
+    that map to a schema that was used before do not build it again.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        schema_cache_dir: str | Path | None = None,
+        max_cached_schemas: int = DEFAULT_MAX_CACHED_SCHEMAS,
+        max_cached_schema_bytes: int = DEFAULT_MAX_CACHED_SCHEMA_BYTES,
+        xml_catalog: XmlCatalog | None = None,
+    ) -> None:
         """
         Initializes a ValidatorSchemaManager instance.
+
+        If ``schema_cache_dir`` is given, built XMLSchema objects are
+        persisted in that folder and reused by later runs, for as long
+        as none of the schema files change.
+
+        ``max_cached_schemas`` and ``max_cached_schema_bytes`` bound
+        each of the in-memory caches of compiled lxml schemas and of
+        built XMLSchema objects.
+
+        If ``xml_catalog`` is given, schema URLs are mapped to local
+        files through it, both by xmlschema and by lxml. Schemas then
+        never access the network: a remote include or import that the
+        catalog does not map makes loading the schema fail.
         """
-        self.schema: XMLSchema | None = None
+        self.xml_catalog = xml_catalog
+        self.schema_cache = (
+            SchemaDiskCache(
+                schema_cache_dir,
+                xml_catalog.get_fingerprint() if xml_catalog else "",
+            )
+            if schema_cache_dir
+            else None
+        )
+        self._schema: XMLSchema | None = None
+        self._schema_pending = False
         self.schema_path: Path | None = None
         self.schema_base_url: str | None = None
-        self._lxml_schema_cache: dict[tuple[Path, str | None], etree.XMLSchema] = {}
+        self._lxml_schema_cache: SchemaCache[etree.XMLSchema] = SchemaCache(
+            max_cached_schemas, max_cached_schema_bytes
+        )
+        self._xmlschema_cache: SchemaCache[XMLSchema] = SchemaCache(
+            max_cached_schemas, max_cached_schema_bytes
+        )
+        self._schema_documents = SchemaDocumentStore()
+
+    @property
+    def schema(self) -> XMLSchema | None:
+        """
+        The active XMLSchema object, built first if it was deferred.
+
+        None if no schema is active or building the deferred schema
+        failed.
+        """
+        if self._schema_pending:
+            self.load_deferred_schema()
+        return self._schema
+
+    @schema.setter
+    def schema(self, value: XMLSchema | None) -> None:
+        self._schema = value
+        self._schema_pending = False
 
     def reset_schema(self) -> None:
         """
-        Clears loaded schema state and compiled schema caches.
+        Clears the loaded schema state.
+
+        Compiled lxml schemas and built XMLSchema objects are kept: each
+        cache entry detects by itself whether its schema files changed.
         """
         self.schema = None
         self.schema_path = None
         self.schema_base_url = None
-        self._lxml_schema_cache.clear()
+
+    def start_schema_generation(self) -> None:
+        """
+        Starts a new generation of both in-memory schema caches, so that
+        the schema files of each cached schema are checked for changes
+        only once until ``end_schema_generation()``.
+
+        See ``SchemaCache.start_generation()``.
+        """
+        self._lxml_schema_cache.start_generation()
+        self._xmlschema_cache.start_generation()
+
+    def end_schema_generation(self) -> None:
+        """
+        Ends the generation of both in-memory schema caches.
+        """
+        self._lxml_schema_cache.end_generation()
+        self._xmlschema_cache.end_generation()
+
+    def has_schema(self) -> bool:
+        """
+        Returns whether a schema is active, built or deferred.
+        """
+        return self._schema is not None or self._schema_pending
 
     def ensure_schema(
-        self, xsd_path: Path | None = None, base_url: str | None = None
+        self,
+        xsd_path: Path | None = None,
+        base_url: str | None = None,
+        lazy: bool = False,
     ) -> ValidatorResult:
         """
         Ensures that a schema is available for validation.
@@ -75,19 +454,61 @@ class ValidatorSchemaManager:
         If no `xsd_path` is given but a schema is already loaded, the
         existing schema is reused. If a new path is passed, that schema
         is loaded and replaces the current one.
+
+        With ``lazy``, a schema that lxml can compile is only selected,
+        see ``defer_schema()``, and the result value is None unless its
+        XMLSchema object was already built. Schemas that lxml cannot
+        compile are still loaded right away.
         """
-        if not (self.schema or xsd_path):
+        if not (self.has_schema() or xsd_path):
             raise ValueError("No schema: provide an XSD path during keyword call(s).")
-        if self.schema and not xsd_path:
-            return ValidatorResult(success=True, value=self.schema)
-        if not self.schema and xsd_path:
-            logger.info(f"Setting schema file: {xsd_path}.", also_console=True)
-        if self.schema and xsd_path:
-            logger.info(f"\tUsing schema: {xsd_path}.", also_console=True)
+        if self.has_schema() and not xsd_path:
+            if lazy or not self._schema_pending:
+                return ValidatorResult(success=True, value=self._schema)
+            return self.load_deferred_schema()
+        if is_logged("per-file"):
+            if not self.has_schema() and xsd_path:
+                logger.info(f"Setting schema file: {xsd_path}.", also_console=True)
+            if self.has_schema() and xsd_path:
+                logger.info(f"\tUsing schema: {xsd_path}.", also_console=True)
         if xsd_path is None:
             raise ValueError("No schema: provide an XSD path during keyword call(s).")
+        if lazy and self.get_lxml_schema(xsd_path, base_url) is not None:
+            return self.defer_schema(xsd_path, base_url)
         return self.load_schema(xsd_path, base_url)
 
+    def defer_schema(
+        self, xsd_path: Path, base_url: str | None = None
+    ) -> ValidatorResult:
+        """
+        Selects an XSD file as the active schema, without building its
+        XMLSchema object yet.
+
+        The object is built once ``schema`` is read. If the same XSD
+        file and ``base_url`` are already active, the schema is kept.
+        The result value is the XMLSchema object if it is already built,
+        or else None.
+        """
+        if not self.is_loaded(xsd_path, base_url):
+            self._schema = None
+            self._schema_pending = True
+            self.schema_path = xsd_path.resolve()
+            self.schema_base_url = base_url
+        return ValidatorResult(success=True, value=self._schema)
+
+    def load_deferred_schema(self) -> ValidatorResult:
+        """
+        Builds the XMLSchema object of the active schema, if it was
+        deferred, and returns it.
+
+        Schema loading errors are captured and returned in a
+        ValidatorResult instead of being raised directly.
+        """
+        if self._schema is not None or self.schema_path is None:
+            return ValidatorResult(success=True, value=self._schema)
+        self._schema_pending = False
+        return self.load_schema(self.schema_path, self.schema_base_url)
+
     def load_schema(
         self, xsd_path: Path, base_url: str | None = None
     ) -> ValidatorResult:
@@ -100,13 +521,106 @@ class ValidatorSchemaManager:
         """
         try:
             resolved_xsd_path = xsd_path.resolve()
-            self.schema = XMLSchema(xsd_path, base_url=base_url)
+            self.schema = self._build_schema(xsd_path, base_url)
             self.schema_path = resolved_xsd_path
             self.schema_base_url = base_url
             return ValidatorResult(success=True, value=self.schema)
         except Exception as e:  # pylint: disable=W0718:broad-exception-caught
             return ValidatorResult(success=False, error={type(e).__name__: e})
 
+    def _build_schema(self, xsd_path: Path, base_url: str | None) -> XMLSchema:
+        """
+        Builds an XMLSchema object, or takes it from the in-memory or
+        the disk cache.
+
+        Built objects are memoized per resolved path and ``base_url``,
+        until one of the files they were built from changes. Build
+        errors are not memoized.
+        """
+        cache_key = (xsd_path.resolve(), base_url)
+        cache_entry = self._xmlschema_cache.get(cache_key)
+        if cache_entry is not None and not isinstance(cache_entry.compiled, Exception):
+            return cache_entry.compiled
+        schema = self._load_or_create_xmlschema(xsd_path, base_url)
+        self._xmlschema_cache.put(
+            cache_key,
+            SchemaCacheEntry(
+                schema,
+                self._get_xmlschema_files(cache_key[0], schema),
+                self._schema_documents.read,
+                XMLSCHEMA_SIZE_FACTOR,
+            ),
+        )
+        return schema
+
+    def _load_or_create_xmlschema(
+        self, xsd_path: Path, base_url: str | None
+    ) -> XMLSchema:
+        """
+        Builds an XMLSchema object, or takes it from the disk cache.
+        """
+        if self.schema_cache is None:
+            return self._create_xmlschema(xsd_path, base_url)
+        schema = self.schema_cache.load(xsd_path, base_url)
+        if schema is None:
+            schema = self._create_xmlschema(xsd_path, base_url)
+            self.schema_cache.store(xsd_path, base_url, schema)
+        return schema
+
+    def _create_xmlschema(self, xsd_path: Path, base_url: str | None) -> XMLSchema:
+        """
+        Builds an XMLSchema object, through the XML catalog if one is set.
+
+        With a catalog, only local resources may be accessed. If the
+        build fails while remote URLs were left unmapped, the error
+        names those URLs.
+        """
+        if self.xml_catalog is None:
+            return XMLSchema(xsd_path, base_url=base_url)
+        uri_mapper = CatalogUriMapper(self.xml_catalog)
+        try:
+            return XMLSchema(
+                xsd_path, base_url=base_url, uri_mapper=uri_mapper, allow="local"
+            )
+        except Exception as e:
+            if not uri_mapper.unmapped_urls:
+                raise
+            raise ValueError(
+                "Schema location(s) not mapped by the XML catalog: "
+                f"{', '.join(uri_mapper.unmapped_urls)}."
+            ) from e
+
+    @staticmethod
+    def _get_xmlschema_files(schema_path: Path, schema: XMLSchema) -> list[Path]:
+        """
+        Returns the XSD file plus all local files an XMLSchema object
+        was built from, without the XSD meta-schema.
+        """
+        schema_files = [schema_path]
+        for component_schema in schema.maps.iter_schemas():
+            if component_schema.maps is not schema.maps or not component_schema.url:
+                continue
+            url_parts = urlsplit(component_schema.url)
+            if url_parts.scheme not in ("", "file"):
+                continue
+            file_path = Path(url2pathname(unquote(url_parts.path)))
+            if file_path not in schema_files:
+                schema_files.append(file_path)
+        return schema_files
+
+    def is_loaded(self, xsd_path: Path, base_url: str | None = None) -> bool:
+        """
+        Returns whether the given XSD file is the active schema.
+
+        The schema only counts as loaded if it was also loaded with the
+        same ``base_url``. A deferred schema counts as loaded.
+        """
+        return (
+            self.has_schema()
+            and self.schema_path == xsd_path.resolve()
+            and self.schema_base_url == base_url
+        )
+
     def get_lxml_schema(
         self, xsd_path: Path | None = None, base_url: str | None = None
     ) -> etree.XMLSchema | None:
@@ -123,16 +637,143 @@ class ValidatorSchemaManager:
         schema_base_url = base_url if xsd_path else self.schema_base_url
         if schema_path is None:
             return None
+        try:
+            return self.compile_lxml_schema(schema_path, schema_base_url)
+        except (OSError, etree.LxmlError):
+            return None
 
-        cache_key = (schema_path, schema_base_url)
-        if cache_key not in self._lxml_schema_cache:
-            try:
-                self._lxml_schema_cache[cache_key] = etree.XMLSchema(
-                    etree.parse(str(schema_path))
+    def compile_lxml_schema(
+        self, xsd_path: Path, base_url: str | None = None
+    ) -> etree.XMLSchema:
+        """
+        Parses and compiles an XSD file with lxml, at most once.
+
+        The outcome is memoized per resolved path and ``base_url``. The
+        cache entry records the state of the XSD file and of all local
+        files it includes or imports, so the schema is compiled again
+        as soon as one of those files changes. Both the sanity check of
+        XSD files and ``get_lxml_schema()`` use this method, so each
+        schema is compiled once for both.
+
+        The memoized schemas are kept in a size-bounded LRU cache, see
+        ``SchemaCache``.
+
+        Parsing and compilation errors are memoized as well, under the
+        same invalidation rules, and raised again on each call, as the
+        sanity check reports them per file. A schema that lxml cannot
+        compile therefore costs one failed compile, not one per file
+        validated against it, see ``get_lxml_fallback_schemas()``.
+
+        Like with xmlschema, ``base_url`` is the location against which
+        relative includes and imports are resolved. lxml resolves them
+        against the URL of the XSD document itself, so the schema is
+        parsed as if it were located in the ``base_url`` folder.
+        """
+        schema_path = xsd_path.resolve()
+        cache_key = (schema_path, base_url)
+        cache_entry = self._lxml_schema_cache.get(cache_key)
+        if cache_entry is None:
+            cache_entry = self._create_lxml_schema_cache_entry(schema_path, base_url)
+            self._lxml_schema_cache.put(cache_key, cache_entry)
+        if isinstance(cache_entry.compiled, Exception):
+            # Drop the traceback of the previous raise, which would grow.
+            raise cache_entry.compiled.with_traceback(None)
+        return cache_entry.compiled
+
+    def get_lxml_schema_cache_statistics(self) -> dict[str, int]:
+        """
+        Returns the hit, miss and eviction counters of the compiled lxml
+        schema cache, plus its current size and limits.
+        """
+        return self._lxml_schema_cache.get_statistics()
+
+    def get_lxml_fallback_schemas(self) -> list[dict[str, str | None]]:
+        """
+        Returns the cached schemas that lxml could not compile.
+
+        Files are validated against these schemas with the (slower)
+        xmlschema validator instead. Each schema is described by its
+        ``xsd_path``, its ``base_url`` and the compile ``error``.
+        """
+        return [
+            {
+                "xsd_path": str(cache_key[0]),
+                "base_url": cache_key[1],
+                "error": f"{type(error).__name__}: {error}",
+            }
+            for cache_key, error in self._lxml_schema_cache.get_errors().items()
+        ]
+
+    def get_xmlschema_cache_statistics(self) -> dict[str, int]:
+        """
+        Returns the hit, miss and eviction counters of the built
+        XMLSchema object cache, plus its current size and limits.
+        """
+        return self._xmlschema_cache.get_statistics()
+
+    def _create_lxml_schema_cache_entry(
+        self, schema_path: Path, base_url: str | None
+    ) -> SchemaCacheEntry[etree.XMLSchema]:
+        """
+        Compiles an XSD file and records the files it was compiled from.
+
+        The XSD file and the local files it includes or imports are read
+        through the document store. The parser's resolver serves them
+        to lxml from there as well, so each file is read from disk once
+        and files shared by several schemas are not read again.
+        """
+        document_url = self._get_lxml_document_url(schema_path, base_url)
+        schema_files = [schema_path]
+        parser = etree.XMLParser()
+        parser.resolvers.add(
+            SchemaDocumentResolver(self._schema_documents, self.xml_catalog)
+        )
+        try:
+            tree = self._schema_documents.parse(schema_path, document_url, parser)
+            schema_files = self._find_schema_files(schema_path, tree, document_url)
+            compiled: etree.XMLSchema | Exception = etree.XMLSchema(tree)
+        except (OSError, etree.LxmlError) as e:
+            compiled = e
+        return SchemaCacheEntry(compiled, schema_files, self._schema_documents.read)
+
+    def _find_schema_files(
+        self, schema_path: Path, tree: etree._ElementTree, document_url: str
+    ) -> list[Path]:
+        """
+        Returns the XSD file plus all local files it (transitively)
+        includes, imports, redefines or overrides.
+        """
+        schema_files = [schema_path]
+        pending_documents = [(tree, document_url)]
+        while pending_documents:
+            tree, document_url = pending_documents.pop()
+            for element in tree.getroot().iterchildren(*XSD_REFERENCE_TAGS):
+                file_path = resolve_schema_location(
+                    element.get("schemaLocation"), document_url, self.xml_catalog
                 )
-            except (OSError, etree.LxmlError):
-                return None
-        return self._lxml_schema_cache[cache_key]
+                if file_path is None or file_path in schema_files:
+                    continue
+                schema_files.append(file_path)
+                try:
+                    pending_documents.append(
+                        (
+                            self._schema_documents.parse(file_path, str(file_path)),
+                            str(file_path),
+                        )
+                    )
+                except (OSError, etree.LxmlError):
+                    # Still tracked, so that fixing the file is detected.
+                    continue
+        return schema_files
+
+    @staticmethod
+    def _get_lxml_document_url(schema_path: Path, base_url: str | None) -> str:
+        """
+        Returns the document URL lxml resolves relative schema paths to.
+        """
+        if not base_url:
+            return str(schema_path)
+        return f"{base_url.rstrip('/')}/{schema_path.name}"
 
     def try_load_initial_schema(
         self, xsd_path: str | Path | None = None, base_url: str | None = None
@@ -27,12 +27,13 @@ from pathlib import Path
 from typing import Literal
 
 # Third party library imports.
-from lxml import etree
 from robot.api import logger
 
 # Local application imports.
-from ..namespaces import extract_namespaces, schema_matches_xml_namespaces
+from ..namespaces import SchemaNamespaceIndex, extract_namespaces
 from ..paths import get_file_paths
+from ..streaming import parse_streaming
+from ..verbosity import is_logged
 from .manager import ValidatorSchemaManager
 
 ValidationPlan = dict[Path, Path | BaseException | None]
@@ -76,6 +77,8 @@ class ValidatorSchemaResolver:
         xsd_search_strategy: Literal["by_namespace", "by_file_name"] | None = None,
         base_url: str | None = None,
         allow_declared_namespace_match: bool = False,
+        lazy_schema: bool = False,
+        allow_nested_namespace_match: bool = False,
     ) -> ValidationPlan:
         """
         Constructs a mapping between XML files and XSD schemas.
@@ -112,6 +115,11 @@ class ValidatorSchemaResolver:
 
         All decisions are covered by this method.
 
+        With ``lazy_schema``, a single schema is only selected if lxml
+        can compile it, and a deferred loaded schema stays deferred; its
+        XMLSchema object is built once needed, see
+        ``ValidatorSchemaManager.ensure_schema()``.
+
         This method expects `xml_paths` to contain at least one XML path.
         """
         # No XSD path: dynamic matching assumes XSD/XML file(s) live in one dir.
@@ -125,9 +133,11 @@ class ValidatorSchemaResolver:
                 xsd_search_strategy,
                 base_url,
                 allow_declared_namespace_match,
+                lazy_schema,
+                allow_nested_namespace_match,
             )
         # No XSD path and no dynamic strategy: use the existing schema.
-        self.schema_manager.ensure_schema(None, None)
+        self.schema_manager.ensure_schema(None, None, lazy=lazy_schema)
         return self._build_loaded_schema_plan(xml_paths)
 
     def _build_xsd_path_plan(  # pylint: disable=R0913,R0917
@@ -137,6 +147,8 @@ class ValidatorSchemaResolver:
         xsd_search_strategy: Literal["by_namespace", "by_file_name"] | None,
         base_url: str | None,
         allow_declared_namespace_match: bool,
+        lazy_schema: bool = False,
+        allow_nested_namespace_match: bool = False,
     ) -> ValidationPlan:
         """
         Builds a validation plan from an explicit or inferred XSD path.
@@ -145,7 +157,9 @@ class ValidatorSchemaResolver:
         xsd_paths, is_single_xsd_file = get_file_paths(xsd_path, "xsd")
         # Single schema: is loaded once and reused for all XMLs.
         if is_single_xsd_file:
-            result = self.schema_manager.ensure_schema(xsd_paths[0], base_url)
+            result = self.schema_manager.ensure_schema(
+                xsd_paths[0], base_url, lazy=lazy_schema
+            )
             # Raise if unable to load schema.
             if not result.success:
                 raise SystemError(f"Loading of schema failed: {result.error}.")
@@ -158,6 +172,7 @@ class ValidatorSchemaResolver:
             xsd_search_strategy if xsd_search_strategy else "by_namespace",
             base_url,
             allow_declared_namespace_match,
+            allow_nested_namespace_match,
         )
 
     @staticmethod
@@ -179,31 +194,41 @@ class ValidatorSchemaResolver:
         search_by: Literal["by_namespace", "by_file_name"] = "by_namespace",
         base_url: str | None = None,
         allow_declared_namespace_match: bool = False,
+        allow_nested_namespace_match: bool = False,
     ) -> ValidationPlan:
         """
         Finds matching XSD schemas for XML files.
 
         Supported strategies are namespace-based matching and file-name
-        based matching.
+        based matching. With ``allow_nested_namespace_match``, an XML
+        file whose root namespaces match no schema is matched by the
+        namespaces declared below its root as well.
         """
-        logger.info(
-            f"Mapping XML files to schemas {search_by.replace('_', ' ')}.",
-            also_console=True,
+        if is_logged("per-file"):
+            logger.info(
+                f"Mapping XML files to schemas {search_by.replace('_', ' ')}.",
+                also_console=True,
+            )
+        # Inspect each candidate schema once, instead of once per XML file.
+        namespace_index = (
+            self._build_schema_namespace_index(
+                xsd_file_paths, base_url, allow_declared_namespace_match
+            )
+            if search_by == "by_namespace"
+            else None
         )
         # Build one XML-to-XSD mapping entry per XML file.
         validations = {}
         for xml_file_path in xml_file_paths:
             # Prepare the mapping entry.
-            logger.info(f"\tSearching schema for: {xml_file_path.stem}.")
+            if is_logged("per-file"):
+                logger.info(f"\tSearching schema for: {xml_file_path.stem}.")
             validations[xml_file_path] = None
             # Delegate to the selected matching strategy.
-            if search_by == "by_namespace":
+            if namespace_index is not None:
                 validations[xml_file_path] = (
                     self._match_xml_file_to_schema_by_namespace(
-                        xml_file_path,
-                        xsd_file_paths,
-                        base_url,
-                        allow_declared_namespace_match,
+                        xml_file_path, namespace_index, allow_nested_namespace_match
                     )
                 )
             elif search_by == "by_file_name":
@@ -217,55 +242,82 @@ class ValidatorSchemaResolver:
                 raise ValueError(f"Unsupported search strategy: {search_by}.")
             # Convert an unsuccessful lookup into an explicit error marker.
             if not validations[xml_file_path]:
-                logger.info(f"\t\tNo valid XSD found for {xml_file_path}.")
+                if is_logged("per-file"):
+                    logger.info(f"\t\tNo valid XSD found for {xml_file_path}.")
                 validations[xml_file_path] = FileNotFoundError(
                     f"No matching XSD found for: {xml_file_path.stem}."
                 )
         return validations
 
-    def _match_xml_file_to_schema_by_namespace(
+    def _build_schema_namespace_index(
         self,
-        xml_file_path: Path,
         xsd_file_paths: list[Path],
         base_url: str | None,
         allow_declared_namespace_match: bool,
+    ) -> SchemaNamespaceIndex:
+        """
+        Loads each candidate XSD once and indexes its namespaces.
+
+        Schemas that fail to load are logged and left out of the index,
+        so XML files can still be matched against the remaining ones.
+        """
+        namespace_index = SchemaNamespaceIndex(allow_declared_namespace_match)
+        for xsd_file_path in xsd_file_paths:
+            if is_logged("per-file"):
+                logger.info(f"\tIndexing schema: {xsd_file_path}.")
+            # Load the schema.
+            result = self.schema_manager.load_schema(xsd_file_path, base_url=base_url)
+            if not result.success:
+                if is_logged("per-file"):
+                    logger.warn(
+                        f"Matching attempt failed due to exception: {result.error}."
+                    )
+                continue
+            # Register the schema's target, imported and declared namespaces.
+            namespace_index.add_schema(xsd_file_path, result.value)  # type: ignore
+        return namespace_index
+
+    @staticmethod
+    def _match_xml_file_to_schema_by_namespace(
+        xml_file_path: Path,
+        namespace_index: SchemaNamespaceIndex,
+        allow_nested_namespace_match: bool = False,
     ) -> Path | BaseException | None:
         """
         Matches a single XML file to an XSD file by namespace.
+
+        With ``allow_nested_namespace_match``, the nested namespace
+        declarations of an XML file whose root matches no schema are
+        streamed, up to the first one that an indexed schema matches.
         """
-        # Parse the XML and collect the namespaces declared on its root.
         try:
-            xml_root = etree.parse(  # pylint: disable=I1101:c-extension-no-member
-                str(xml_file_path),
-                parser=etree.XMLParser(),  # pylint: disable=I1101:c-extension-no-member
-            ).getroot()
-            xml_namespaces = extract_namespaces(xml_root, include_nested=False)
+            # Read the namespaces declared on the XML's root, not the whole XML.
+            xml_namespaces = extract_namespaces(xml_file_path, include_nested=False)
+            # Look up the first indexed schema that matches the XML namespace(s).
+            xsd_file_path = namespace_index.match(xml_namespaces)  # type: ignore
+            if not xsd_file_path and allow_nested_namespace_match:
+                xml_namespaces = extract_namespaces(
+                    xml_file_path,
+                    include_nested=True,
+                    stop_when=namespace_index.has_namespace,
+                )
+                xsd_file_path = namespace_index.match(xml_namespaces)  # type: ignore
+                # Without a match, the whole XML was read and is well-formed.
+                if not xsd_file_path:
+                    return None
+            # Only the root was read: report a malformed XML as such, not as
+            # unmatched, while still keeping memory use bounded.
+            if not xsd_file_path:
+                parse_streaming(xml_file_path)
+                return None
         # Return parse/access errors, so downstream reporting can log them.
         except Exception as err:  # pylint: disable=W0718:broad-exception-caught
-            logger.info("\t\tProcessing XML file failed.")
+            if is_logged("per-file"):
+                logger.info("\t\tProcessing XML file failed.")
             return err
-        # Test each candidate schema until one matches the XML namespace(s).
-        for xsd_file_path in xsd_file_paths:
-            logger.info(f"\t\tTesting schema: {xsd_file_path}.")
-            # Load the schema.
-            result = self.schema_manager.load_schema(xsd_file_path, base_url=base_url)
-            if not result.success:
-                logger.warn(
-                    f"Matching attempt failed due to exception: {result.error}."
-                )
-                continue
-            # Compare XML namespaces with the loaded schema's namespaces.
-            match = schema_matches_xml_namespaces(
-                result.value,  # type: ignore
-                xml_namespaces,  # type: ignore
-                allow_declared_namespace_match,
-            )
-            # Return a matching XSD's file path.
-            if match:
-                logger.info(f"\t\t\tMatch found with: {xsd_file_path}.")
-                return xsd_file_path
-        # No match found.
-        return None
+        if is_logged("per-file"):
+            logger.info(f"\t\t\tMatch found with: {xsd_file_path}.")
+        return xsd_file_path
 
     @staticmethod
     def _match_xml_file_to_schema_by_file_name(
@@ -276,10 +328,13 @@ class ValidatorSchemaResolver:
         """
         # Test each candidate schema until its stem matches the XML stem.
         for xsd_file_path in xsd_file_paths:
-            logger.info(f"\t\t\tTesting file name: {xsd_file_path}.")
+            if is_logged("per-file"):
+                logger.info(f"\t\t\tTesting file name: {xsd_file_path}.")
             if xsd_file_path.stem == xml_file_path.stem:
-                logger.info("\t\tFound match.")
+                if is_logged("per-file"):
+                    logger.info("\t\tFound match.")
                 return xsd_file_path
-            logger.info("\t\t\tNo match: trying next schema file.")
+            if is_logged("per-file"):
+                logger.info("\t\t\tNo match: trying next schema file.")
             continue
         return None
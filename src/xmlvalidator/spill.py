@@ -0,0 +1,174 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides a disk-backed store for the errors of long validation runs.
+
+The SpilledErrors class keeps the errors of a run in a JSON Lines file
+instead of in memory. Errors are written to the file as each file
+completes, so they survive a crash or timeout of the run, and memory
+use does not grow with the number of errors.
+"""
+
+# Standard library imports.
+import json
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, overload
+
+# Number of errors buffered in memory before they are written to disk.
+DEFAULT_SPILL_BUFFER_SIZE = 1000
+
+
+class SpilledErrors(Sequence[dict[str, Any]]):
+    """
+    A sequence of error dictionaries, stored in a JSON Lines file.
+
+    Appended errors are buffered and written to the file once the
+    buffer is full or ``flush()`` is called. Reading (iterating,
+    indexing or slicing) first flushes, and then reads the errors back
+    from the file. Only the file offset of each error is kept in
+    memory, to support indexing.
+
+    Facet values that JSON cannot represent are stored as strings, and
+    tuples are read back as lists.
+
+    The file is named ``errors_<timestamp>.jsonl``. It is created
+    when the first errors are written, and kept after the run, so that
+    the errors of an aborted run can be inspected, until ``discard()``
+    deletes it. Each instance writes to a file of its own.
+    """
+
+    def __init__(
+        self, spill_dir: str | Path, buffer_size: int = DEFAULT_SPILL_BUFFER_SIZE
+    ) -> None:
+        """
+        Initializes a SpilledErrors instance.
+
+        No file is created yet: ``path`` stays None until the first
+        errors are written.
+        """
+        self.spill_dir = Path(spill_dir)
+        self.path: Path | None = None
+        self.buffer_size = buffer_size
+        self.discarded = False
+        self._offsets = array("q")
+        self._buffer: list[bytes] = []
+        self._size = 0
+
+    def append(self, error: dict[str, Any]) -> None:
+        """
+        Adds an error, writing the buffered errors if the buffer is full.
+        """
+        line = json.dumps(error, ensure_ascii=False, default=str).encode() + b"\n"
+        self._offsets.append(self._size)
+        self._size += len(line)
+        self._buffer.append(line)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered errors to the file, creating it first if
+        needed.
+
+        Raises OSError if the file cannot be created or written.
+        """
+        if not self._buffer:
+            return
+        if self.path is None:
+            self.path = self._create_file()
+        with self.path.open("ab") as spill_file:
+            spill_file.writelines(self._buffer)
+        self._buffer.clear()
+
+    def discard(self) -> None:
+        """
+        Deletes the file and drops the buffered errors.
+
+        Reading the errors afterwards raises ValueError, instead of
+        silently returning no errors.
+        """
+        self._buffer.clear()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+        self.discarded = True
+
+    def _create_file(self) -> Path:
+        """
+        Creates and returns a new, empty spill file.
+
+        The file is created exclusively, so that an existing spill file
+        is never reused or truncated. A numeric suffix is added if
+        another file has the same timestamp.
+        """
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+        path = self.spill_dir / f"errors_{timestamp}.jsonl"
+        suffix = 1
+        while True:
+            try:
+                path.touch(exist_ok=False)
+                return path
+            except FileExistsError:
+                path = self.spill_dir / f"errors_{timestamp}_{suffix}.jsonl"
+                suffix += 1
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self._read(0, len(self))
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return list(self._read(start, stop))
+            return [self[position] for position in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("error index out of range")
+        return next(self._read(index, index + 1))
+
+    def _read(self, start: int, stop: int) -> Iterator[dict[str, Any]]:
+        """
+        Yields the errors from position ``start`` up to ``stop``.
+
+        Raises ValueError if the errors were discarded.
+        """
+        if self.discarded:
+            raise ValueError(
+                "The spilled errors were discarded, as a later validation run "
+                "reset the errors."
+            )
+        self.flush()
+        if start >= stop or self.path is None:
+            return
+        with self.path.open("rb") as spill_file:
+            spill_file.seek(self._offsets[start])
+            for _ in range(stop - start):
+                yield json.loads(spill_file.readline())
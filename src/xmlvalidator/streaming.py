@@ -0,0 +1,170 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides bounded-memory validation helpers for very large XML files.
+
+The streaming validation backend never holds a complete XML document in
+memory. Validity is decided by lxml, which validates the document while
+it is being parsed; the parsed elements are discarded as soon as they
+are complete. Only invalid files are validated a second time, by
+xmlschema in lazy mode, to collect the error details.
+
+The namespace declarations of large XML files are read the same way.
+"""
+
+# pylint: disable=I1101:c-extension-no-member
+
+# Standard library imports.
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+# Third party library imports.
+from lxml import etree
+from xmlschema import XMLResource, XMLSchema
+
+# Number of bytes fed to the parser at once.
+STREAMING_CHUNK_SIZE = 1024 * 1024
+
+
+def parse_streaming(
+    xml_file_path: Path,
+    lxml_schema: etree.XMLSchema | None = None,
+    chunk_size: int = STREAMING_CHUNK_SIZE,
+) -> None:
+    """
+    Parses an XML file, optionally validating it, without building the
+    full tree.
+
+    The file is fed to a pull parser in chunks. After each chunk, all
+    completed elements are removed from the partial tree, so memory use
+    is bounded by the chunk size and the depth of the document instead
+    of by its size. Raises XMLSyntaxError if the file is not
+    well-formed or, if ``lxml_schema`` is given, not valid.
+    """
+    root: etree._Element | None = None
+    with xml_file_path.open("rb") as file:
+        root_tag, chunk = _read_root_tag(file, chunk_size)
+        parser = etree.XMLPullParser(
+            events=("start",), tag=root_tag, schema=lxml_schema
+        )
+        while chunk:
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                root = element if root is None else root
+            if root is not None:
+                _discard_completed_elements(root)
+            chunk = file.read(chunk_size)
+    parser.close()
+
+
+def is_valid_streaming(
+    xml_file_path: Path,
+    lxml_schema: etree.XMLSchema,
+    chunk_size: int = STREAMING_CHUNK_SIZE,
+) -> bool:
+    """
+    Returns whether an XML file is valid, using ``parse_streaming()``.
+
+    Files that are not well-formed are reported as invalid.
+    """
+    try:
+        parse_streaming(xml_file_path, lxml_schema, chunk_size)
+    except etree.XMLSyntaxError:
+        return False
+    return True
+
+
+def iter_streaming_errors(xml_file_path: Path, schema: XMLSchema) -> Iterator[Any]:
+    """
+    Yields the validation errors of an XML file, using lazy xmlschema
+    validation.
+
+    xmlschema then reads the file in subtrees and prunes each subtree
+    once it has been validated. The errors carry the same facets as
+    those of ``XMLSchema.iter_errors()``, but their ``path`` points to
+    the lazily validated subtree that holds the invalid element.
+    """
+    yield from schema.iter_errors(XMLResource(str(xml_file_path), lazy=True))
+
+
+def iter_namespace_declarations(
+    xml_file_path: Path, chunk_size: int = STREAMING_CHUNK_SIZE
+) -> Iterator[tuple[str | None, str]]:
+    """
+    Yields the prefix and URI of each namespace declaration in an XML
+    file, in document order, without building the full tree.
+
+    The default namespace has the prefix None. Memory use is bounded
+    like with ``parse_streaming()``, and no more of the file is read
+    than the chunks needed for the declarations consumed so far, so
+    that consumers can stop early. Raises XMLSyntaxError if the file
+    turns out not to be well-formed before the consumer stops.
+    """
+    root: etree._Element | None = None
+    with xml_file_path.open("rb") as file:
+        root_tag, chunk = _read_root_tag(file, chunk_size)
+        # Element events are only needed to get hold of the root.
+        parser = etree.XMLPullParser(events=("start-ns", "start"), tag=root_tag)
+        while chunk:
+            parser.feed(chunk)
+            for event, item in parser.read_events():
+                if event == "start":
+                    root = item if root is None else root
+                    continue
+                prefix, uri = item
+                yield prefix or None, uri
+            if root is not None:
+                _discard_completed_elements(root)
+            chunk = file.read(chunk_size)
+    parser.close()
+
+
+def _read_root_tag(file: BinaryIO, chunk_size: int) -> tuple[str, bytes]:
+    """
+    Reads an open XML file up to the start tag of its root element.
+
+    Returns the root's tag, which lets the caller's parser report only
+    the root's start event, and the bytes read so far, which the caller
+    feeds to that parser before reading on. The file is thus read once.
+
+    Raises XMLSyntaxError if the file holds no element.
+    """
+    parser = etree.XMLPullParser(events=("start",))
+    chunks: list[bytes] = []
+    while chunk := file.read(chunk_size):
+        chunks.append(chunk)
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            return element.tag, b"".join(chunks)
+    parser.close()
+    raise etree.XMLSyntaxError("Document is empty", 4, 1, 1)  # type: ignore
+
+
+def _discard_completed_elements(root: etree._Element) -> None:
+    """
+    Removes all completed elements from a partially parsed tree.
+
+    The element that is still being parsed, and its ancestors, always
+    are the last children along the tree's right edge. All their
+    preceding siblings are complete and can be dropped.
+    """
+    element = root
+    while len(element):
+        del element[:-1]
+        element = element[-1]
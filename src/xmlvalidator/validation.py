@@ -23,11 +23,15 @@ Provides single-file XML validation execution.
 The XmlValidationRunner class validates one XML file against either an
 already-loaded schema or a schema loaded specifically for that file.
 For XSD validation errors it prefers lxml's C-backed validator and falls
-back to xmlschema-based error collection when needed.
+back to xmlschema-based error collection when needed. The streaming
+backend validates very large files with bounded memory instead.
 """
 
 # Standard library imports.
-import re
+import threading
+from collections.abc import Callable, Generator, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -37,13 +41,33 @@ from robot.api import Failure, logger
 
 # Local application imports.
 from .files import sanity_check_files
-from .results import ValidatorResultRecorder
+from .lxml_errors import DEFAULT_REASON_REGISTRY, LxmlErrorLocator
+from .results import ErrorLimits, ValidatorResult, ValidatorResultRecorder
+from .schema.cache import SchemaDiskCache
+from .schema.catalog import XmlCatalog
 from .schema.manager import ValidatorSchemaManager
+from .streaming import is_valid_streaming, iter_streaming_errors
+from .verbosity import is_logged
 
 # Define type and allowed values for user-provided validation backend.
-ValidationBackend = Literal["auto", "lxml", "xmlschema"]
+ValidationBackend = Literal["auto", "lxml", "streaming", "xmlschema"]
 # Runtime counterpart used to validate user-provided backend values.
-VALIDATION_BACKENDS = {"auto", "lxml", "xmlschema"}
+VALIDATION_BACKENDS = {"auto", "lxml", "streaming", "xmlschema"}
+# Define type and allowed values for the kind of worker pool.
+Parallelism = Literal["processes", "threads"]
+# Runtime counterpart used to validate user-provided parallelism values.
+PARALLELISM_MODES = {"processes", "threads"}
+# Outcome of validating one XML file: validity plus collected errors.
+ValidationOutcome = tuple[bool, list[dict[str, Any]] | None]
+# Picklable description of one planned file validation for pool workers:
+# XML path, XSD path, base_url, error facets, pre_parse,
+# skip_none_error_facets, validation backend and the maximum number of
+# errors to collect.
+ValidationTask = tuple[
+    Path, Path, str | None, list[str], bool, bool, ValidationBackend, int | None
+]
+# Facet value types that are passed unchanged from pool workers.
+PICKLE_SAFE_FACET_TYPES = (str, int, float, bool, type(None))
 
 
 class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
@@ -73,7 +97,20 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
             )
         return cast(ValidationBackend, validation_backend)
 
-    def run_validation_plan(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
+    @staticmethod
+    def validate_parallelism(parallelism: str) -> Parallelism:
+        """
+        Validates and normalizes the selected kind of worker pool.
+        """
+        if parallelism not in PARALLELISM_MODES:
+            raise ValueError(
+                "Unsupported parallelism: "
+                f"{parallelism}. Expected one of: "
+                f"{', '.join(sorted(PARALLELISM_MODES))}."
+            )
+        return cast(Parallelism, parallelism)
+
+    def run_validation_plan(  # pylint: disable=R0913:too-many-arguments, R0914:too-many-locals, R0917:too-many-positional-arguments
         self,
         validations: dict[Path, Path | BaseException | None],
         result_recorder: ValidatorResultRecorder,
@@ -83,6 +120,11 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
         pre_parse: bool = True,
         skip_none_error_facets: bool = False,
         validation_backend: ValidationBackend = "auto",
+        workers: int = 1,
+        parallelism: Parallelism = "processes",
+        max_errors_per_file: int | None = None,
+        max_errors_total: int | None = None,
+        stop_on_first_invalid: bool = False,
     ) -> None:
         """
         Executes a prepared XML-to-XSD validation plan.
@@ -95,11 +137,104 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
 
         This method validates every planned XML file and records the
         result in the provided result recorder.
+
+        With ``workers`` greater than one, the XML files are validated
+        in a pool of workers. ``parallelism`` selects worker processes
+        or worker threads. Threads avoid process start-up and pickling
+        costs and still run in parallel, because lxml releases the GIL
+        while parsing and validating. Each worker compiles and caches
+        its own schemas. Results are recorded and logged by the calling
+        process, in plan order, so reporting does not depend on which
+        worker finished first.
+
+        ``max_errors_per_file`` and ``max_errors_total`` cap the number
+        of reported errors. Error collection stops early once a file
+        exceeds its cap. Pool workers cap each file at the limit that
+        applies when the run starts; the remaining total is applied
+        when their results are recorded. For each file whose errors
+        were truncated, a note is recorded.
+
+        With ``stop_on_first_invalid``, the plan is aborted after the
+        first invalid file, in plan order. Outstanding pool work is
+        cancelled and the files that were not validated are recorded
+        as skipped.
+
+        The schema files of each cached schema are checked for changes
+        once per plan, not once per XML file, see
+        ``ValidatorSchemaManager.start_schema_generation()``.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be 1 or higher, got: {workers}.")
+        parallelism = self.validate_parallelism(parallelism)
+        error_limits = ErrorLimits(max_errors_per_file, max_errors_total)
+        self.schema_manager.start_schema_generation()
+        try:
+            if workers > 1 and len(validations) > 1:
+                outcomes = self._validate_plan_in_pool(
+                    validations,
+                    base_url,
+                    error_facets or default_error_facets or [],
+                    pre_parse,
+                    skip_none_error_facets,
+                    validation_backend,
+                    workers,
+                    parallelism,
+                    error_limits,
+                )
+            else:
+                outcomes = self._validate_plan_sequentially(
+                    validations,
+                    base_url,
+                    error_facets,
+                    default_error_facets,
+                    pre_parse,
+                    skip_none_error_facets,
+                    validation_backend,
+                    error_limits,
+                )
+            # Process the validation results.
+            validated_files = 0
+            for xml_file_path, (is_valid, errors) in outcomes:
+                validated_files += 1
+                if is_valid:
+                    result_recorder.add_valid_file(xml_file_path)
+                    continue
+                errors, truncation_note = error_limits.apply(errors or [])
+                result_recorder.add_invalid_file(xml_file_path)
+                result_recorder.add_file_errors(xml_file_path, errors)
+                result_recorder.log_file_errors(errors)
+                if truncation_note:
+                    result_recorder.add_truncation_note(xml_file_path, truncation_note)
+                if stop_on_first_invalid:
+                    break
+            # Closing the outcomes cancels the work still pending in a pool.
+            outcomes.close()
+        finally:
+            self.schema_manager.end_schema_generation()
+        skipped_files = list(validations)[validated_files:]
+        if skipped_files:
+            result_recorder.add_skipped_files(skipped_files)
+
+    def _validate_plan_sequentially(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
+        self,
+        validations: dict[Path, Path | BaseException | None],
+        base_url: str | None,
+        error_facets: list[str] | None,
+        default_error_facets: list[str] | None,
+        pre_parse: bool,
+        skip_none_error_facets: bool,
+        validation_backend: ValidationBackend,
+        error_limits: ErrorLimits | None = None,
+    ) -> Generator[tuple[Path, ValidationOutcome], None, None]:
+        """
+        Validates each planned XML file in the calling process.
+
+        The error limit of each file is determined when it is validated,
+        so it accounts for the errors recorded for the files before it.
         """
         # Validate each XML file with the corresponding schema.
         for xml_file_path, xsd_file_path in validations.items():
-            # The actual validation.
-            is_valid, errors = self.validate_xml(
+            yield xml_file_path, self.validate_xml(
                 xml_file_path,
                 xsd_file_path=xsd_file_path,
                 base_url=base_url,
@@ -108,14 +243,170 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
                 pre_parse=pre_parse,
                 skip_none_error_facets=skip_none_error_facets,
                 validation_backend=validation_backend,
+                max_errors=(
+                    error_limits.get_collection_limit() if error_limits else None
+                ),
             )
-            # Process the validation results.
-            if is_valid:
-                result_recorder.add_valid_file(xml_file_path)
-            else:
-                result_recorder.add_invalid_file(xml_file_path)
-                result_recorder.add_file_errors(xml_file_path, errors)
-                result_recorder.log_file_errors(errors)  # type: ignore
+
+    def _validate_plan_in_pool(  # pylint: disable=R0913:too-many-arguments, R0914:too-many-locals, R0917:too-many-positional-arguments
+        self,
+        validations: dict[Path, Path | BaseException | None],
+        base_url: str | None,
+        facets: list[str],
+        pre_parse: bool,
+        skip_none_error_facets: bool,
+        validation_backend: ValidationBackend,
+        workers: int,
+        parallelism: Parallelism,
+        error_limits: ErrorLimits,
+    ) -> Generator[tuple[Path, ValidationOutcome], None, None]:
+        """
+        Validates the planned XML files in a pool of worker processes
+        or worker threads.
+
+        Upstream resolution errors are reported by the calling process.
+        All other files are turned into picklable tasks. Entries that
+        reuse the loaded schema are bound to that schema's file path,
+        so each worker can load it by itself.
+        """
+        tasks = self._build_validation_tasks(
+            validations,
+            base_url,
+            facets,
+            pre_parse,
+            skip_none_error_facets,
+            self.validate_validation_backend(validation_backend),
+            error_limits.get_collection_limit(),
+        )
+        if tasks is None:
+            # A schema object without a source file cannot be shared.
+            if is_logged("per-file"):
+                logger.info(
+                    "Loaded schema has no file path: validating sequentially.",
+                    also_console=True,
+                )
+            yield from self._validate_plan_sequentially(
+                validations,
+                base_url,
+                facets,
+                None,
+                pre_parse,
+                skip_none_error_facets,
+                validation_backend,
+                error_limits,
+            )
+            return
+        if is_logged("per-file"):
+            logger.info(
+                f"Validating {len(tasks)} XML files with {workers} worker "
+                f"{parallelism}.",
+                also_console=True,
+            )
+        executor, worker_function = self._create_worker_pool(
+            workers,
+            parallelism,
+            self.schema_manager.schema_cache,
+            self.schema_manager.xml_catalog,
+        )
+        try:
+            # The map preserves task order, whatever order workers finish in.
+            outcomes = executor.map(
+                worker_function,
+                tasks,
+                chunksize=max(1, len(tasks) // (workers * 4)),
+            )
+            for xml_file_path, xsd_file_path in validations.items():
+                if is_logged("per-file"):
+                    logger.info(
+                        f"Validating '{xml_file_path.name}'.", also_console=True
+                    )
+                if isinstance(xsd_file_path, BaseException):
+                    yield xml_file_path, self._get_resolution_error(
+                        xsd_file_path, facets
+                    )
+                else:
+                    yield xml_file_path, next(outcomes)  # pylint: disable=R1708
+        finally:
+            # Tasks not started yet are cancelled if the caller stops
+            # consuming the outcomes early.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _create_worker_pool(
+        workers: int,
+        parallelism: Parallelism,
+        schema_cache: SchemaDiskCache | None = None,
+        xml_catalog: XmlCatalog | None = None,
+    ) -> tuple[Executor, Callable[[ValidationTask], ValidationOutcome]]:
+        """
+        Creates the worker pool plus the function its workers execute.
+
+        Workers share the on-disk schema cache and the XML catalog, if
+        configured.
+        """
+        schema_cache_dir = schema_cache.cache_dir if schema_cache else None
+        if parallelism == "threads":
+            return (
+                ThreadPoolExecutor(
+                    max_workers=workers,
+                    initializer=_initialize_worker,
+                    initargs=(schema_cache_dir, xml_catalog),
+                ),
+                _validate_xml_in_worker,
+            )
+        return (
+            ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_worker,
+                initargs=(schema_cache_dir, xml_catalog),
+            ),
+            _validate_xml_in_worker_process,
+        )
+
+    def _build_validation_tasks(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
+        self,
+        validations: dict[Path, Path | BaseException | None],
+        base_url: str | None,
+        facets: list[str],
+        pre_parse: bool,
+        skip_none_error_facets: bool,
+        validation_backend: ValidationBackend,
+        max_errors: int | None = None,
+    ) -> list[ValidationTask] | None:
+        """
+        Converts the validation plan into tasks for pool workers.
+
+        Plan entries holding a resolution error are skipped, because
+        they need no validation. Returns None if the plan reuses a
+        loaded schema that was not loaded from a file.
+        """
+        if None in validations.values():
+            # Reusing the loaded schema requires one to be selected. The
+            # workers build their own schema objects from its file.
+            self.schema_manager.ensure_schema(None, None, lazy=True)
+            if self.schema_manager.schema_path is None:
+                return None
+        tasks: list[ValidationTask] = []
+        for xml_file_path, xsd_file_path in validations.items():
+            if isinstance(xsd_file_path, BaseException):
+                continue
+            task_base_url = base_url
+            if xsd_file_path is None:
+                xsd_file_path = self.schema_manager.schema_path
+                task_base_url = self.schema_manager.schema_base_url
+            tasks.append(
+                (
+                    xml_file_path,
+                    xsd_file_path,  # type: ignore
+                    task_base_url,
+                    facets,
+                    pre_parse,
+                    skip_none_error_facets,
+                    validation_backend,
+                    max_errors,
+                )
+            )
+        return tasks
 
     def validate_xml(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
         self,
@@ -127,21 +418,129 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
         pre_parse: bool = True,
         skip_none_error_facets: bool = False,
         validation_backend: ValidationBackend = "auto",
-    ) -> tuple[bool, list[dict[str, Any]] | None]:
+        max_errors: int | None = None,
+    ) -> ValidationOutcome:
         """
         Validates an XML file against the active or provided XSD schema.
+
+        If ``max_errors`` is given, at most that many XSD violations are
+        collected.
         """
         # Log informative.
-        logger.info(f"Validating '{xml_file_path.name}'.", also_console=True)
+        if is_logged("per-file"):
+            logger.info(f"Validating '{xml_file_path.name}'.", also_console=True)
+        facets = error_facets or default_error_facets or []
         # Check upstream XSD matching led to an err pertaining to the XML.
         if isinstance(xsd_file_path, BaseException):
-            return False, [
-                {
-                    facet: str(xsd_file_path) if facet == "reason" else ""
-                    for facet in (error_facets or default_error_facets or [])
-                }
-            ]
+            return self._get_resolution_error(xsd_file_path, facets)
         # Sanity check the target (XML/XSD) files.
+        sanity_check_result = self._sanity_check_planned_files(
+            xml_file_path,
+            xsd_file_path,
+            base_url,
+            pre_parse,
+            skip_none_error_facets,
+            validation_backend == "streaming",
+        )
+        if not sanity_check_result.success:
+            # Abort validation if one or more sanity checks failed.
+            return False, sanity_check_result.error
+        # Ensure a valid schema is loaded, or selected for lxml.
+        loading_result = self.schema_manager.ensure_schema(
+            xsd_file_path, base_url, lazy=validation_backend != "xmlschema"
+        )
+        if not loading_result.success:
+            # Abort the validation if schema loading failed.
+            if is_logged("per-file"):
+                logger.warn("Schema loading failed.")
+            return False, loading_result.error
+        return self._validate_against_schema(
+            xml_file_path,
+            loading_result.value,
+            self._get_lxml_schema(xsd_file_path, base_url, validation_backend),
+            base_url,
+            facets,
+            skip_none_error_facets,
+            validation_backend,
+            sanity_check_result.value,
+            max_errors,
+            pre_parse,
+        )
+
+    def validate_xml_quietly(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
+        self,
+        xml_file_path: Path,
+        xsd_file_path: Path,
+        base_url: str | None,
+        facets: list[str],
+        pre_parse: bool = True,
+        skip_none_error_facets: bool = False,
+        validation_backend: ValidationBackend = "auto",
+        max_errors: int | None = None,
+    ) -> ValidationOutcome:
+        """
+        Validates an XML file against a given XSD file without logging.
+
+        This is the variant of ``validate_xml()`` that runs outside the
+        Robot Framework process, e.g. in pool workers. It never writes
+        to the Robot log and reuses the loaded schema as long as the
+        same XSD file and base_url are requested.
+        """
+        sanity_check_result = self._sanity_check_planned_files(
+            xml_file_path,
+            xsd_file_path,
+            base_url,
+            pre_parse,
+            skip_none_error_facets,
+            validation_backend == "streaming",
+        )
+        if not sanity_check_result.success:
+            return False, sanity_check_result.error
+        lxml_schema = self._get_lxml_schema(xsd_file_path, base_url, validation_backend)
+        if lxml_schema is not None:
+            loading_result = self.schema_manager.defer_schema(xsd_file_path, base_url)
+        elif self.schema_manager.is_loaded(xsd_file_path, base_url):
+            loading_result = self.schema_manager.load_deferred_schema()
+        else:
+            loading_result = self.schema_manager.load_schema(xsd_file_path, base_url)
+        if not loading_result.success:
+            return False, loading_result.error
+        return self._validate_against_schema(
+            xml_file_path,
+            loading_result.value,
+            lxml_schema,
+            base_url,
+            facets,
+            skip_none_error_facets,
+            validation_backend,
+            sanity_check_result.value,
+            max_errors,
+            pre_parse,
+        )
+
+    def _sanity_check_planned_files(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
+        self,
+        xml_file_path: Path,
+        xsd_file_path: Path | None,
+        base_url: str | None,
+        pre_parse: bool,
+        skip_none_error_facets: bool,
+        stream_xml_file: bool = False,
+    ) -> ValidatorResult:
+        """
+        Sanity checks the XML file and its XSD file, if one is given.
+
+        On success, the result value holds the XML tree parsed during
+        the checks (or None if ``pre_parse`` is False), so validation
+        can reuse it instead of parsing the XML file again. The XSD file
+        is compiled through the schema manager, which compiles it only
+        once for all files that are validated against it.
+
+        With ``stream_xml_file``, the XML file only gets the file-level
+        checks, and the result value is always None. Its well-formedness
+        is checked while it is validated, see
+        ``_validate_against_schema()``, so that it is read only once.
+        """
         sanity_check_result = sanity_check_files(
             [
                 file_path
@@ -151,18 +550,71 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
             base_url=base_url,
             parse_files=pre_parse,
             skip_none_error_facets=skip_none_error_facets,
+            schema_compiler=self.schema_manager.compile_lxml_schema,
+            parse_xml_files=not stream_xml_file,
         )
         if not sanity_check_result.success:
-            # Abort validation if one or more sanity checks failed.
-            return False, sanity_check_result.error
-        # Ensure a valid schema is loaded.
-        loading_result = self.schema_manager.ensure_schema(xsd_file_path, base_url)
-        if not loading_result.success:
-            # Abort the validation if schema loading failed.
-            logger.warn("Schema loading failed.")
-            return False, loading_result.error
+            return sanity_check_result
+        documents = sanity_check_result.value or {}
+        return ValidatorResult(success=True, value=documents.get(xml_file_path))
+
+    @staticmethod
+    def _get_resolution_error(
+        error: BaseException, facets: list[str]
+    ) -> ValidationOutcome:
+        """
+        Converts an upstream schema-resolution error into an outcome.
+        """
+        return False, [
+            {facet: str(error) if facet == "reason" else "" for facet in facets}
+        ]
+
+    def _validate_against_schema(  # pylint: disable=R0913:too-many-arguments, R0914:too-many-locals, R0917:too-many-positional-arguments
+        self,
+        xml_file_path: Path,
+        schema: Any,
+        lxml_schema: etree.XMLSchema | None,
+        base_url: str | None,
+        facets: list[str],
+        skip_none_error_facets: bool,
+        validation_backend: ValidationBackend,
+        document: etree._ElementTree | None = None,
+        max_errors: int | None = None,
+        pre_parse: bool = False,
+    ) -> ValidationOutcome:
+        """
+        Validates an XML file against an already loaded schema.
+
+        If ``document`` is given, it is the already parsed XML file and
+        the lxml backend validates it directly. If ``max_errors`` is
+        given, at most that many errors are collected.
+
+        With the streaming backend, ``pre_parse`` has the sanity check
+        of the XML file's well-formedness done here. lxml's streaming
+        validation proves valid files well-formed, so only files that
+        it rejects are parsed again, to tell malformed from invalid.
+
+        ``schema`` is None if its XMLSchema object was deferred. It is
+        then only built if xmlschema has to collect the errors.
+        ``lxml_schema`` is the schema as compiled by lxml, as looked up
+        by the caller with ``_get_lxml_schema()``, or None.
+        """
         validation_backend = self.validate_validation_backend(validation_backend)
-        lxml_schema = self._get_lxml_schema(xsd_file_path, base_url, validation_backend)
+        if validation_backend == "streaming" and lxml_schema is not None:
+            # Only invalid files need the XMLSchema object, see below.
+            if is_valid_streaming(xml_file_path, lxml_schema):
+                return True, None
+            lxml_schema = None
+        if validation_backend == "streaming" and pre_parse:
+            sanity_check_result = sanity_check_files(
+                [xml_file_path],
+                base_url=base_url,
+                parse_files=True,
+                skip_none_error_facets=skip_none_error_facets,
+                stream_xml_files=True,
+            )
+            if not sanity_check_result.success:
+                return False, sanity_check_result.error
         if validation_backend == "lxml" and lxml_schema is None:
             return False, [
                 {
@@ -171,17 +623,35 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
                         if facet == "reason"
                         else ""
                     )
-                    for facet in (error_facets or default_error_facets or [])
+                    for facet in facets
                 }
             ]
+        # Build the deferred XMLSchema object if xmlschema is needed.
+        if schema is None and lxml_schema is None:
+            loading_result = self.schema_manager.load_deferred_schema()
+            if not loading_result.success:
+                return False, loading_result.error
+            schema = loading_result.value
         # Validate the XML and collect details for each XSD violation.
+        if validation_backend == "streaming":
+            errors = self._collect_streaming_validation_errors(
+                xml_file_path,
+                schema,
+                lxml_schema,
+                facets,
+                skip_none_error_facets,
+                max_errors,
+            )
+            return (True, None) if len(errors) == 0 else (False, errors)
         errors = self._collect_validation_errors(
             xml_file_path,
-            loading_result.value,
+            schema,
             lxml_schema,
-            error_facets,
-            default_error_facets,
+            facets,
+            None,
             skip_none_error_facets,
+            document,
+            max_errors,
         )
         # Determine validity based on the presence of errors.
         return (True, None) if len(errors) == 0 else (False, errors)
@@ -209,6 +679,8 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
         error_facets: list[str] | None = None,
         default_error_facets: list[str] | None = None,
         skip_none_error_facets: bool = False,
+        document: etree._ElementTree | None = None,
+        max_errors: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Collects configured error details for each XSD validation error.
@@ -236,12 +708,77 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
         CSV output a stable shape: each requested facet is present for
         each collected validation error. If ``skip_none_error_facets`` is
         ``True``, requested facets without a value are omitted instead.
+
+        If the XML file was already parsed, e.g. by the pre-parse sanity
+        check, the tree can be passed as ``document``. The lxml path
+        then validates that tree instead of parsing the file again.
+
+        If ``max_errors`` is given, at most that many errors are
+        collected. xmlschema then stops validating once it has reported
+        that many errors.
         """
         facets = error_facets or default_error_facets or []
         if lxml_schema is not None:
             return XmlValidationRunner._collect_lxml_validation_errors(
-                xml_file_path, lxml_schema, facets, skip_none_error_facets
+                xml_file_path,
+                lxml_schema,
+                facets,
+                skip_none_error_facets,
+                document,
+                max_errors,
             )
+        return XmlValidationRunner._get_xmlschema_error_details(
+            schema.iter_errors(xml_file_path),
+            facets,
+            skip_none_error_facets,
+            max_errors,
+        )
+
+    @staticmethod
+    def _collect_streaming_validation_errors(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
+        xml_file_path: Path,
+        schema: Any,
+        lxml_schema: etree.XMLSchema | None,
+        facets: list[str],
+        skip_none_error_facets: bool = False,
+        max_errors: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Collects validation errors with bounded memory use, for XML
+        files too large to hold in memory.
+
+        lxml first validates the file while parsing it in chunks,
+        discarding each completed element. Only if that finds the file
+        invalid (or if lxml could not compile the schema), xmlschema
+        validates the file again in lazy mode to collect the error
+        details. Valid files, the common case, are thus validated at
+        lxml speed.
+
+        The facets are those of the xmlschema backend. Note that in lazy
+        mode, xmlschema reports the ``path`` of the subtree that holds
+        the invalid element.
+        """
+        if lxml_schema is not None and is_valid_streaming(xml_file_path, lxml_schema):
+            return []
+        return XmlValidationRunner._get_xmlschema_error_details(
+            iter_streaming_errors(xml_file_path, schema),
+            facets,
+            skip_none_error_facets,
+            max_errors,
+        )
+
+    @staticmethod
+    def _get_xmlschema_error_details(
+        errors: Iterable[Any],
+        facets: list[str],
+        skip_none_error_facets: bool,
+        max_errors: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Copies the requested facets of xmlschema validation errors.
+
+        Stops consuming ``errors`` after ``max_errors`` errors, if given.
+        """
         return [
             {
                 # Collect the details/facets for each XSD violation.
@@ -255,22 +792,32 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
                 if (not skip_none_error_facets or getattr(err, facet, None) is not None)
             }
             # Generate an err obj (with err details) per encountered violation.
-            for err in schema.iter_errors(xml_file_path)
+            for err in islice(errors, max_errors)
         ]
 
     @staticmethod
-    def _collect_lxml_validation_errors(
+    def _collect_lxml_validation_errors(  # pylint: disable=R0913:too-many-arguments, R0917:too-many-positional-arguments
         xml_file_path: Path,
         schema: etree.XMLSchema,
         facets: list[str],
         skip_none_error_facets: bool = False,
+        document: etree._ElementTree | None = None,
+        max_errors: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Collects validation errors using lxml's C-backed XSD validator.
+
+        The XML file is only parsed if no ``document`` is passed in.
+        Error locations are resolved through one LxmlErrorLocator, so
+        many errors among many siblings are resolved in linear time.
+        If ``max_errors`` is given, only the details of the first that
+        many errors in lxml's error log are collected.
         """
-        document = etree.parse(str(xml_file_path))
+        if document is None:
+            document = etree.parse(str(xml_file_path))
         if schema.validate(document):
             return []
+        error_locator = LxmlErrorLocator(document)
         return [
             {
                 facet: value if value is not None else "Unavailable"
@@ -278,127 +825,53 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
                 if (
                     (
                         value := XmlValidationRunner._get_lxml_error_facet(
-                            error, facet, document
+                            error, facet, error_locator
                         )
                     )
                     is not None
                     or not skip_none_error_facets
                 )
             }
-            for error in schema.error_log
+            for error in islice(schema.error_log, max_errors)
         ]
 
     @staticmethod
     def _get_lxml_error_facet(
-        error: etree._LogEntry, facet: str, document: etree._ElementTree
+        error: etree._LogEntry, facet: str, error_locator: LxmlErrorLocator
     ) -> Any:
         """
         Maps requested error facets to lxml error-log attributes.
         """
         if facet == "path":
-            return XmlValidationRunner._get_lxml_error_path(error, document)
+            return XmlValidationRunner._get_lxml_error_path(error, error_locator)
         if facet == "reason":
-            return XmlValidationRunner._get_lxml_error_reason(error, document)
+            return XmlValidationRunner._get_lxml_error_reason(error, error_locator)
         if facet == "line_number":
             return error.line
         return getattr(error, facet, None)
 
     @staticmethod
     def _get_lxml_error_path(
-        error: etree._LogEntry, document: etree._ElementTree
+        error: etree._LogEntry, error_locator: LxmlErrorLocator
     ) -> str | None:
         """
         Converts lxml's structural XPath into a readable element path.
         """
         if not error.path:
             return None
-        try:
-            matches = document.xpath(error.path)
-        except etree.XPathError:
-            return error.path
-        if not matches:
-            return error.path
-        return XmlValidationRunner._build_readable_element_path(matches[0])
-
-    @staticmethod
-    def _build_readable_element_path(element: etree._Element) -> str:
-        """
-        Builds a slash-separated path from an lxml element.
-        """
-        path_parts = [
-            etree.QName(ancestor).localname for ancestor in element.iterancestors()
-        ]
-        path_parts.reverse()
-        path_parts.append(etree.QName(element).localname)
-        return "/" + "/".join(path_parts)
+        return error_locator.get_readable_path(error.path)
 
     @staticmethod
     def _get_lxml_error_reason(
-        error: etree._LogEntry, document: etree._ElementTree
+        error: etree._LogEntry, error_locator: LxmlErrorLocator
     ) -> str:
         """
-        Converts common lxml validation messages to familiar wording.
+        Converts common lxml validation messages to familiar wording,
+        using the rewriters of the default reason registry.
         """
-        message = error.message
-        invalid_value_match = re.match(
-            r"Element '([^']+)': '([^']+)' is not a valid value of "
-            r"the atomic type '([^']+)'\.",
-            message,
-        )
-        if invalid_value_match:
-            _, value, value_type = invalid_value_match.groups()
-            if value_type in {"xs:int", "xs:integer"}:
-                return f"invalid literal for int() with base 10: '{value}'"
-            if value_type == "xs:decimal":
-                return f"invalid value '{value}' for xs:decimal"
-            if value_type == "xs:ID":
-                return "value doesn't match any pattern of ['[\\\\i-[:]][\\\\c-[:]]*']"
-
-        unexpected_child_match = re.match(
-            r"Element '([^']+)': This element is not expected\."
-            r"(?: Expected is \( ([^)]+) \)\.)?",
-            message,
+        return DEFAULT_REASON_REGISTRY.get_reason(
+            error.message, lambda: error_locator.get_position(error.path)
         )
-        if unexpected_child_match:
-            child_tag, expected_tag = unexpected_child_match.groups()
-            position = XmlValidationRunner._get_lxml_error_position(error, document)
-            reason = (
-                f"Unexpected child with tag '{child_tag}' " f"at position {position}."
-            )
-            if expected_tag:
-                reason = f"{reason} Tag '{expected_tag.strip()}' expected."
-            return reason
-
-        pattern_match = re.match(
-            r"Element '([^']+)': \[facet 'pattern'\] The value '([^']+)' "
-            r"is not accepted by the pattern '([^']+)'\.",
-            message,
-        )
-        if pattern_match:
-            _, _, pattern = pattern_match.groups()
-            pattern = pattern.replace("\\", "\\\\")
-            return f"value doesn't match any pattern of ['{pattern}']"
-
-        return message
-
-    @staticmethod
-    def _get_lxml_error_position(
-        error: etree._LogEntry, document: etree._ElementTree
-    ) -> int:
-        """
-        Returns the one-based element position among siblings.
-        """
-        try:
-            matches = document.xpath(error.path)
-        except etree.XPathError:
-            return 1
-        if not matches:
-            return 1
-        element = matches[0]
-        parent = element.getparent()
-        if parent is None:
-            return 1
-        return list(parent).index(element) + 1
 
     @staticmethod
     def finalize_validation_run(
@@ -407,7 +880,7 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
         result_recorder: ValidatorResultRecorder,
         reporting_options: tuple[bool | None, bool | None, bool | None],
         fail_on_errors: bool,
-    ) -> tuple[list[dict[str, Any]], str | None]:
+    ) -> tuple[Sequence[dict[str, Any]], str | None]:
         """
         Finalizes a completed validation run.
 
@@ -431,14 +904,81 @@ class XmlValidationRunner:  # pylint: disable=R0903:too-few-public-methods
         else:
             csv_path = None
         # Write errors to the log file as a table if requested.
-        if error_table and result_recorder.errors_by_file:
+        if error_table and result_recorder.errors_by_file and is_logged("per-file"):
             result_recorder.write_error_table_to_log(
                 result_recorder.errors_by_file,
             )
         # Log a summary of the test run.
         result_recorder.log_summary()
         if fail_on_errors and result_recorder.errors_by_file:
-            raise Failure(
-                f"{len(result_recorder.errors_by_file)} errors have been detected."
+            error_count = len(result_recorder.errors_by_file) - len(
+                result_recorder.truncated_files
             )
+            truncation = (
+                " Errors of "
+                f"{len(result_recorder.truncated_files)} file(s) were truncated."
+                if result_recorder.truncated_files
+                else ""
+            )
+            raise Failure(f"{error_count} errors have been detected.{truncation}")
         return (result_recorder.errors_by_file, csv_path if csv_path else None)
+
+
+# Per-worker validation state: one runner per worker thread or process.
+_worker_state = threading.local()
+
+
+def _initialize_worker(
+    schema_cache_dir: Path | None, xml_catalog: XmlCatalog | None = None
+) -> None:
+    """
+    Stores the worker's settings when a pool worker starts.
+    """
+    _worker_state.schema_cache_dir = schema_cache_dir
+    _worker_state.xml_catalog = xml_catalog
+
+
+def _validate_xml_in_worker(task: ValidationTask) -> ValidationOutcome:
+    """
+    Validates one planned XML file inside a pool worker.
+
+    Each worker thread (or the single thread of a worker process)
+    creates its own XmlValidationRunner and ValidatorSchemaManager on
+    first use. Compiled schemas are therefore cached per worker for the
+    lifetime of the pool and never shared between concurrently running
+    validations. lxml's default parser is thread-local as well, so each
+    worker also parses with its own parser instance.
+    """
+    runner = getattr(_worker_state, "runner", None)
+    if runner is None:
+        runner = XmlValidationRunner(
+            ValidatorSchemaManager(
+                getattr(_worker_state, "schema_cache_dir", None),
+                xml_catalog=getattr(_worker_state, "xml_catalog", None),
+            )
+        )
+        # The worker, like its pool, only lives for one validation plan.
+        runner.schema_manager.start_schema_generation()
+        _worker_state.runner = runner
+    return runner.validate_xml_quietly(*task)
+
+
+def _validate_xml_in_worker_process(task: ValidationTask) -> ValidationOutcome:
+    """
+    Validates one planned XML file inside a pool worker process.
+
+    Facet values that are not plain scalars are converted to strings,
+    because they must be pickled back to the calling process.
+    """
+    is_valid, errors = _validate_xml_in_worker(task)
+    if errors:
+        errors = [
+            {
+                facet: (
+                    value if isinstance(value, PICKLE_SAFE_FACET_TYPES) else str(value)
+                )
+                for facet, value in error.items()
+            }
+            for error in errors
+        ]
+    return is_valid, errors
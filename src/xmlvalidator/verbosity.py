@@ -0,0 +1,88 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the verbosity setting that controls what a validation run
+writes to the Robot Framework log.
+
+Each log message of a validation run belongs to a verbosity level. A
+message is only logged if the verbosity of the running validation is
+that level or a more verbose one. From least to most verbose:
+
+- ``silent``: nothing is logged.
+- ``summary``: one aggregated summary per run.
+- ``per-file``: also the progress and outcome of each file, plus the
+  error table.
+- ``per-error``: also the details of each error (the default).
+"""
+
+# Standard library imports.
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Literal, cast
+
+# Define type and allowed values for the user-provided verbosity.
+Verbosity = Literal["silent", "summary", "per-file", "per-error"]
+# Runtime counterpart, ordered from least to most verbose.
+VERBOSITY_LEVELS = ("silent", "summary", "per-file", "per-error")
+# Verbosity used outside of validation runs.
+DEFAULT_VERBOSITY: Verbosity = "per-error"
+
+# The verbosity of the running validation.
+_current_verbosity: ContextVar[Verbosity] = ContextVar(
+    "verbosity", default=DEFAULT_VERBOSITY
+)
+
+
+def validate_verbosity(verbosity: str) -> Verbosity:
+    """
+    Validates and normalizes a user-provided verbosity.
+    """
+    if verbosity not in VERBOSITY_LEVELS:
+        raise ValueError(
+            f"Unsupported verbosity: {verbosity}. Expected one of: "
+            f"{', '.join(VERBOSITY_LEVELS)}."
+        )
+    return cast(Verbosity, verbosity)
+
+
+def get_verbosity() -> Verbosity:
+    """
+    Returns the verbosity of the running validation.
+    """
+    return _current_verbosity.get()
+
+
+def is_logged(level: Verbosity) -> bool:
+    """
+    Returns whether messages of the given level are logged at the
+    verbosity of the running validation.
+    """
+    return VERBOSITY_LEVELS.index(get_verbosity()) >= VERBOSITY_LEVELS.index(level)
+
+
+@contextmanager
+def use_verbosity(verbosity: Verbosity) -> Iterator[None]:
+    """
+    Applies a verbosity to everything logged within the context.
+    """
+    token = _current_verbosity.set(validate_verbosity(verbosity))
+    try:
+        yield
+    finally:
+        _current_verbosity.reset(token)
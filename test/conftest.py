@@ -53,6 +53,9 @@ def setup_test_files():
     Ensures cleanup after the test.
     """
     TEST_DIR.mkdir(parents=True, exist_ok=True)
+    # Track every created file, as tests advance the inner generator only
+    # once with next(), which never runs the cleanup after its yield.
+    created_paths: list[Path] = []
 
     def _create_files(
         xml_content: str,
@@ -88,12 +91,11 @@ def setup_test_files():
         else:
             # Facilitate expecting a missing file.
             xsd_path = None
+        created_paths.extend(path for path in (xml_path, xsd_path) if path)
         # Yield file paths to the test function.
         yield xml_path, xsd_path
-        # Cleanup after the test.
-        if xml_path and xml_path.exists():
-            xml_path.unlink(missing_ok=True)
-        if xsd_path and xsd_path.exists():
-            xsd_path.unlink(missing_ok=True)
-    # Return the function reference.
-    return _create_files
+    # Yield the function reference.
+    yield _create_files
+    # Cleanup after the test.
+    for path in created_paths:
+        path.unlink(missing_ok=True)
@@ -23,6 +23,7 @@ See for an overview of all tests the file test/_doc/unit/overview.html.
 
 # Standard library imports.
 from pathlib import Path
+from unittest.mock import MagicMock
 
 # Third-party library imports.
 import pytest
@@ -79,6 +80,29 @@ def test_sanity_check_files_accepts_valid_xml_and_xsd(setup_test_files):
     # Ensure there are no errors.
     assert result.error is None or len(result.error) == 0
 
+def test_sanity_check_files_returns_parsed_xml_trees(setup_test_files):
+    """
+    Test that sanity_check_files() returns the parsed XML trees, keyed
+    by file path, so that validation can reuse them.
+
+    Priority: H
+    """
+    xsd_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+        <xs:element name="note" type="xs:string"/>
+    </xs:schema>"""
+    xml_file, xsd_file = next(
+        setup_test_files("<note>Hello</note>", xsd_content)
+        )
+    # With parsing enabled, only the XML tree is returned.
+    result = sanity_check_files([xml_file, xsd_file], parse_files=True)
+    assert result.success is True
+    assert list(result.value) == [xml_file]
+    assert result.value[xml_file].getroot().tag == "note"
+    # Without parsing, no trees are returned.
+    result = sanity_check_files([xml_file, xsd_file], parse_files=False)
+    assert result.value == {}
+
 def test_sanity_check_files_reports_malformed_xml(setup_test_files):
     """
     Test that sanity_check_files() correctly detects a malformed XML
@@ -480,6 +504,57 @@ def test_check_file_path_reports_empty_file(tmp_path):
         f"Expected 'ValueError'; got '{error['Error type']}'."
     )
 
+def test_sanity_check_files_compiles_xsd_with_schema_compiler(setup_test_files):
+    """
+    Test that sanity_check_files() leaves XSD compilation to the given
+    schema compiler and reports the errors it raises.
+
+    Priority: H
+    """
+    xml_file, xsd_file = next(setup_test_files("<note />", "<note />"))
+    schema_compiler = MagicMock(
+        side_effect=etree.XMLSchemaParseError("Document is not a schema.")
+    )
+    # Call `sanity_check_files()` with a (failing) schema compiler.
+    result = sanity_check_files(
+        [xml_file, xsd_file],
+        base_url="base",
+        parse_files=True,
+        schema_compiler=schema_compiler
+    )
+    # Expect the compiler to be called for the XSD file only.
+    schema_compiler.assert_called_once_with(xsd_file, "base")
+    # Expect the compiler's error to be reported for the XSD file.
+    assert result.success is False
+    assert len(result.error) == 1
+    assert result.error[0]["file"] == str(xsd_file)
+    assert result.error[0]["Error type"] == "XMLSchemaParseError"
+
+def test_sanity_check_files_can_leave_xml_parsing_out(setup_test_files):
+    """
+    Test that sanity_check_files() with `parse_xml_files=False` parses
+    XSD files, but only runs the file-level checks on XML files.
+
+    Priority: M
+    """
+    xml_file, xsd_file = next(setup_test_files("<note>", "<note />"))
+    schema_compiler = MagicMock()
+    # The malformed XML file is not parsed, the XSD file is compiled.
+    result = sanity_check_files(
+        [xml_file, xsd_file],
+        parse_files=True,
+        schema_compiler=schema_compiler,
+        parse_xml_files=False
+    )
+    assert result.success is True
+    assert result.value == {}
+    schema_compiler.assert_called_once_with(xsd_file, None)
+    # The file-level checks still apply to the XML file.
+    xml_file.write_text("", encoding="utf-8")
+    result = sanity_check_files([xml_file], parse_files=True, parse_xml_files=False)
+    assert result.success is False
+    assert result.error[0]["reason"] == "File is empty."
+
 
 # _parse_file_for_sanity_check()
 
@@ -495,12 +570,12 @@ def test_parse_file_for_sanity_check_does_nothing_when_disabled(tmp_path):
     xml_file = tmp_path / "invalid.xml"
     xml_file.write_text("<root>", encoding="utf-8")
     # Call the helper with parsing disabled.
-    _parse_file_for_sanity_check(
+    assert _parse_file_for_sanity_check(
         xml_file,
         ".xml",
         None,
         False
-    )
+    ) is None
 
 def test_parse_file_for_sanity_check_parses_valid_xml(tmp_path):
     """
@@ -513,12 +588,15 @@ def test_parse_file_for_sanity_check_parses_valid_xml(tmp_path):
     xml_file = tmp_path / "valid.xml"
     xml_file.write_text("<root />", encoding="utf-8")
     # Call the helper with parsing enabled.
-    _parse_file_for_sanity_check(
+    tree = _parse_file_for_sanity_check(
         xml_file,
         ".xml",
         None,
         True
     )
+    # Expect the parsed tree to be returned.
+    assert tree is not None
+    assert tree.getroot().tag == "root"
 
 def test_parse_file_for_sanity_check_raises_for_invalid_xml(tmp_path):
     """
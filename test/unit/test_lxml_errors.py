@@ -0,0 +1,255 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Contains unit tests for the src/xmlvalidator/lxml_errors.py module.
+
+See for an overview of all tests the file test/_doc/unit/overview.html.
+"""
+
+# pylint: disable=I1101:c-extension-no-member
+
+# Standard library imports.
+from unittest.mock import patch
+
+# Third-party library imports.
+import pytest
+from lxml import etree
+
+# Local application imports.
+from xmlvalidator.lxml_errors import (
+    DEFAULT_REASON_REGISTRY, LxmlErrorLocator, LxmlReasonRegistry
+)
+
+BATCH_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"{namespace}>
+    <xs:element name="batch">
+        <xs:complexType>
+            <xs:sequence>
+                <xs:element name="record" maxOccurs="unbounded">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="amount" type="xs:int" maxOccurs="2"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:sequence>
+        </xs:complexType>
+    </xs:element>
+</xs:schema>"""
+
+BATCH_XML = """<{prefix}batch{namespace}>
+    <{prefix}record><{prefix}amount>1</{prefix}amount></{prefix}record>
+    <!-- A comment counts as a sibling position. -->
+    <{prefix}record><{prefix}amount>1</{prefix}amount><{prefix}amount>x</{prefix}amount></{prefix}record>
+    <{prefix}record><{prefix}total>1</{prefix}total></{prefix}record>
+    <{prefix}record><{prefix}amount>y</{prefix}amount></{prefix}record>
+</{prefix}batch>"""
+
+
+def _validate_batch(namespace_declaration, prefix=""):
+    """
+    Validates the batch document and returns it with its error log.
+    """
+    schema_namespace = (
+        ' targetNamespace="urn:batch" elementFormDefault="qualified"'
+        if namespace_declaration
+        else ""
+    )
+    schema = etree.XMLSchema(
+        etree.fromstring(BATCH_XSD.format(namespace=schema_namespace).encode())
+    )
+    document = etree.ElementTree(
+        etree.fromstring(
+            BATCH_XML.format(prefix=prefix, namespace=namespace_declaration).encode()
+        )
+    )
+    assert not schema.validate(document)
+    return document, list(schema.error_log)
+
+
+# get_readable_path() / get_position()
+
+
+@pytest.mark.parametrize(
+    "namespace_declaration, prefix",
+    [("", ""), (' xmlns="urn:batch"', ""), (' xmlns:b="urn:batch"', "b:")],
+)
+def test_locator_matches_xpath_evaluation(namespace_declaration, prefix):
+    """
+    Test that the locator resolves lxml error paths to the same
+    elements, readable paths and positions as evaluating them as XPath.
+
+    Priority: H
+    """
+    document, errors = _validate_batch(namespace_declaration, prefix)
+    error_locator = LxmlErrorLocator(document)
+
+    for error in errors:
+        try:
+            matches = document.xpath(error.path)
+        except etree.XPathError:
+            matches = []
+        expected_element = matches[0] if matches else None
+        assert error_locator.find_element(error.path) is expected_element
+        if expected_element is None:
+            assert error_locator.get_readable_path(error.path) == error.path
+            assert error_locator.get_position(error.path) == 1
+        else:
+            parent = expected_element.getparent()
+            assert error_locator.get_position(error.path) == (
+                list(parent).index(expected_element) + 1
+            )
+    assert len(errors) == 3
+
+def test_locator_builds_readable_paths_and_positions():
+    """
+    Test that the locator returns local-name paths without positions
+    and counts comments as siblings.
+
+    Priority: H
+    """
+    document, _ = _validate_batch(' xmlns="urn:batch"')
+    error_locator = LxmlErrorLocator(document)
+
+    assert error_locator.get_readable_path("/*/*[2]/*[2]") == "/batch/record/amount"
+    assert error_locator.get_position("/*/*[2]") == 3
+    assert error_locator.get_position("/*") == 1
+    assert error_locator.get_readable_path("/*/*[9]") == "/*/*[9]"
+
+def test_locator_walks_simple_paths_without_xpath():
+    """
+    Test that unprefixed element paths are walked without evaluating
+    XPath, and that each distinct path is resolved once.
+
+    Priority: M
+    """
+    document, errors = _validate_batch("")
+    error_locator = LxmlErrorLocator(document)
+
+    with patch.object(
+        LxmlErrorLocator, "_evaluate_xpath"
+    ) as evaluate_mock, patch.object(
+        LxmlErrorLocator, "_resolve_path", autospec=True,
+        side_effect=LxmlErrorLocator._resolve_path  # pylint: disable=W0212
+    ) as resolve_mock:
+        for error in errors * 2:
+            error_locator.get_readable_path(error.path)
+
+    evaluate_mock.assert_not_called()
+    assert resolve_mock.call_count == len({error.path for error in errors})
+
+
+# LxmlReasonRegistry
+
+
+@pytest.mark.parametrize(
+    "message, expected_reason",
+    [
+        (
+            "Element 'amount': 'x' is not a valid value of the atomic type "
+            "'xs:int'.",
+            "invalid literal for int() with base 10: 'x'",
+        ),
+        (
+            "Element 'price': 'x' is not a valid value of the atomic type "
+            "'xs:decimal'.",
+            "invalid value 'x' for xs:decimal",
+        ),
+        (
+            "Element 'when': 'x' is not a valid value of the atomic type "
+            "'xs:date'.",
+            "Element 'when': 'x' is not a valid value of the atomic type "
+            "'xs:date'.",
+        ),
+        (
+            "Element 'total': This element is not expected. Expected is "
+            "( amount ).",
+            "Unexpected child with tag 'total' at position 3. "
+            "Tag 'amount' expected.",
+        ),
+        (
+            "Element 'code': [facet 'pattern'] The value 'x' is not accepted "
+            "by the pattern '\\d+'.",
+            "value doesn't match any pattern of ['\\\\d+']",
+        ),
+        ("Element 'a': Missing child element(s).", "Element 'a': Missing child element(s)."),
+    ]
+)
+def test_default_registry_rewrites_known_messages(message, expected_reason):
+    """
+    Test that the built-in rewriters produce xmlschema's wording and
+    that other messages are kept as-is.
+
+    Priority: H
+    """
+    registry = LxmlReasonRegistry(DEFAULT_REASON_REGISTRY.rewriters)
+
+    assert registry.get_reason(message, lambda: 3) == expected_reason
+
+def test_registry_rewrites_each_distinct_message_once():
+    """
+    Test that reasons are memoized per distinct message, while
+    positional rewriters still get the position of each error.
+
+    Priority: M
+    """
+    registry = LxmlReasonRegistry(DEFAULT_REASON_REGISTRY.rewriters)
+    rewritten_values = []
+
+    def rewrite_value(match):
+        rewritten_values.append(match.group(1))
+        return f"bad value {match.group(1)}"
+
+    registry.register(r"Value '([^']+)' is bad\.", rewrite_value, marker="is bad")
+    message = "Element 'total': This element is not expected."
+
+    reasons = [registry.get_reason("Value 'x' is bad.") for _ in range(3)]
+    positions = [registry.get_reason(message, lambda p=p: p) for p in (1, 2)]
+
+    assert reasons == ["bad value x"] * 3
+    assert rewritten_values == ["x"]
+    assert positions == [
+        "Unexpected child with tag 'total' at position 1.",
+        "Unexpected child with tag 'total' at position 2.",
+    ]
+
+def test_registry_prefers_registered_rewriters():
+    """
+    Test that registered rewriters take precedence over the built-in
+    ones, also for messages that were memoized before, and that a
+    rewriter returning None falls through to the next one.
+
+    Priority: H
+    """
+    registry = LxmlReasonRegistry(DEFAULT_REASON_REGISTRY.rewriters)
+    message = (
+        "Element 'amount': 'x' is not a valid value of the atomic type 'xs:int'."
+    )
+    assert registry.get_reason(message) == (
+        "invalid literal for int() with base 10: 'x'"
+    )
+
+    registry.register(r"Element '([^']+)'", lambda match: None)
+    assert registry.get_reason(message) == (
+        "invalid literal for int() with base 10: 'x'"
+    )
+
+    registry.register(
+        r"Element '([^']+)': '([^']+)' is not a valid value",
+        lambda match, position: f"{match.group(1)} #{position} is invalid",
+        needs_position=True,
+    )
+    assert registry.get_reason(message, lambda: 4) == "amount #4 is invalid"
+    assert len(DEFAULT_REASON_REGISTRY.rewriters) == 3
@@ -23,6 +23,7 @@ See for an overview of all tests the file test/_doc/unit/overview.html.
 # pylint: disable=C0302:too-many-lines
 
 # Standard library imports.
+from pathlib import Path
 from xml.etree.ElementTree import ParseError
 
 # Third-party library imports.
@@ -33,10 +34,14 @@ from xmlschema import XMLSchema
 # Local application imports.
 from xmlvalidator import namespaces as namespaces_module
 from xmlvalidator.namespaces import (
+    SchemaNamespaceIndex,
     _prepare_schema_namespace_matches,
     extract_namespaces,
+    peek_root_namespaces,
     schema_matches_xml_namespaces,
+    stream_nested_namespaces,
 )
+from xmlvalidator.streaming import STREAMING_CHUNK_SIZE
 
 
 class SchemaNamespaceStub:  # pylint: disable=R0903:too-few-public-methods
@@ -416,6 +421,199 @@ def test_extract_namespaces_redundant_declarations(setup_test_files):
         f"Expected dict {expected_dict}, but got {extracted_namespaces_dict}."
         )
 
+def test_extract_namespaces_nested_includes_inherited_namespaces():
+    """
+    Test that extract_namespaces() with `include_nested` keeps the
+    namespaces that a non-root element inherits from its ancestors.
+
+    Priority: H
+    """
+    xml_root = etree.fromstring(
+        '<a xmlns="urn:a" xmlns:p="urn:p"><b xmlns:q="urn:q"><c/></b></a>'
+    )
+    element = xml_root[0]
+
+    assert extract_namespaces(element, include_nested=True, return_dict=True) == {
+        None: "urn:a", "p": "urn:p", "q": "urn:q"
+    }
+
+def test_extract_namespaces_from_file_path_reads_root_namespaces(setup_test_files):
+    """
+    Test that extract_namespaces() accepts an XML file path and then
+    returns the root's namespaces, or all namespaces with
+    `include_nested`.
+
+    Priority: H
+    """
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <root xmlns="http://example.com/default" xmlns:ns1="http://example.com/ns1">
+        <child xmlns:ns2="http://example.com/ns2"/>
+    </root>"""
+    xml_file, _ = next(setup_test_files(xml_content, None))
+
+    assert extract_namespaces(xml_file, return_dict=True) == {
+        None: "http://example.com/default", "ns1": "http://example.com/ns1"
+    }
+    assert extract_namespaces(str(xml_file), include_nested=True) == {
+        "http://example.com/default",
+        "http://example.com/ns1",
+        "http://example.com/ns2",
+    }
+
+def test_extract_namespaces_from_file_path_stops_nested_streaming(setup_test_files):
+    """
+    Test that extract_namespaces() passes `stop_when` on when it streams
+    the nested namespaces of an XML file, so the chunks after the
+    stopping declaration are not read.
+
+    Priority: M
+    """
+    # Malformed beyond the first chunk, after the stopping namespace.
+    xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+    <root xmlns:ns1="http://example.com/ns1">
+        <child xmlns:ns2="http://example.com/ns2"/>
+        <filler>{" " * STREAMING_CHUNK_SIZE}</filler>
+        <later><</later>"""
+    xml_file, _ = next(setup_test_files(xml_content, None))
+
+    assert extract_namespaces(
+        xml_file,
+        include_nested=True,
+        stop_when=lambda namespace: namespace == "http://example.com/ns2",
+    ) == {"http://example.com/ns1", "http://example.com/ns2"}
+
+
+# peek_root_namespaces()
+
+
+def test_peek_root_namespaces_stops_after_root_start_tag(setup_test_files):
+    """
+    Test that peek_root_namespaces() returns the namespaces declared on
+    the root element without parsing the remainder of the file.
+
+    Priority: H
+    """
+    # Malformed after the root's start tag, which is never reached.
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <!-- Comment before the root. -->
+    <root xmlns="http://example.com/default" xmlns:ns1="http://example.com/ns1">
+        <child xmlns:ns2="http://example.com/ns2">
+    """
+    xml_file, _ = next(setup_test_files(xml_content, None))
+
+    assert peek_root_namespaces(xml_file) == {
+        None: "http://example.com/default", "ns1": "http://example.com/ns1"
+    }
+
+def test_peek_root_namespaces_matches_nsmap_without_namespaces(setup_test_files):
+    """
+    Test that peek_root_namespaces() returns an empty dictionary for a
+    root element without namespace declarations.
+
+    Priority: M
+    """
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <root><child xmlns:ns1="http://example.com/ns1"/></root>"""
+    xml_file, _ = next(setup_test_files(xml_content, None))
+
+    assert peek_root_namespaces(xml_file) == {}
+
+def test_peek_root_namespaces_raises_for_malformed_root(setup_test_files):
+    """
+    Test that peek_root_namespaces() raises an XMLSyntaxError when the
+    root's start tag is malformed.
+
+    Priority: M
+    """
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <root xmlns:ns1="http://example.com/ns1" <child/></root>"""
+    xml_file, _ = next(setup_test_files(xml_content, None))
+
+    with pytest.raises(etree.XMLSyntaxError, match="error parsing attribute name"):
+        peek_root_namespaces(xml_file)
+
+
+# stream_nested_namespaces()
+
+
+def test_stream_nested_namespaces_matches_tree_extraction(setup_test_files):
+    """
+    Test that stream_nested_namespaces() extracts the same namespaces
+    from a file as extract_namespaces() does from its parsed tree.
+
+    Priority: H
+    """
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <root xmlns="http://example.com/root" xmlns:ns1="http://example.com/ns1">
+        <child xmlns:ns2="http://example.com/ns2">
+            <grandchild xmlns="http://example.com/child"/>
+        </child>
+        <ns1:other/>
+    </root>"""
+    xml_file, _ = next(setup_test_files(xml_content, None))
+    xml_root = etree.parse(str(xml_file), parser=etree.XMLParser()).getroot()
+
+    assert stream_nested_namespaces(xml_file) == extract_namespaces(
+        xml_root, include_nested=True, return_dict=True
+    ) == {
+        None: "http://example.com/child",
+        "ns1": "http://example.com/ns1",
+        "ns2": "http://example.com/ns2",
+    }
+
+def test_stream_nested_namespaces_stops_when_condition_is_met(setup_test_files):
+    """
+    Test that stream_nested_namespaces() stops at the first namespace
+    for which the stop condition holds, without reading on.
+
+    Priority: H
+    """
+    # Malformed after the namespace that stops the extraction.
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <root xmlns:ns1="http://example.com/ns1">
+        <child xmlns:ns2="http://example.com/ns2"/>
+        <later xmlns:ns3="http://example.com/ns3">"""
+    xml_file, _ = next(setup_test_files(xml_content, None))
+    seen_namespaces = []
+
+    def stop_when(namespace):
+        seen_namespaces.append(namespace)
+        return namespace == "http://example.com/ns2"
+
+    assert stream_nested_namespaces(xml_file, stop_when) == {
+        "ns1": "http://example.com/ns1", "ns2": "http://example.com/ns2"
+    }
+    assert seen_namespaces == ["http://example.com/ns1", "http://example.com/ns2"]
+    with pytest.raises(etree.XMLSyntaxError):
+        stream_nested_namespaces(xml_file)
+
+def test_stream_nested_namespaces_stops_at_indexed_schema_namespace(
+    setup_test_files, monkeypatch
+):
+    """
+    Test that stream_nested_namespaces() can stop once it has seen a
+    namespace that a schema in a SchemaNamespaceIndex matches.
+
+    Priority: M
+    """
+    monkeypatch.setattr(namespaces_module.logger, "info", lambda *_, **__: None)
+    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <envelope xmlns="http://example.com/envelope">
+        <payload xmlns="http://example.com/payload"/>
+        <trailer xmlns="http://example.com/trailer"/>
+    </envelope>"""
+    xml_file, _ = next(setup_test_files(xml_content, None))
+    namespace_index = SchemaNamespaceIndex()
+    namespace_index.add_schema(
+        Path("payload.xsd"),
+        SchemaNamespaceStub(target_namespace="http://example.com/payload")
+    )
+
+    namespaces = stream_nested_namespaces(xml_file, namespace_index.has_namespace)
+
+    assert namespaces == {None: "http://example.com/payload"}
+    assert namespace_index.match(set(namespaces.values())) == Path("payload.xsd")
+
 
 # schema_matches_xml_namespaces()
 
@@ -1226,3 +1424,84 @@ def test_prepare_schema_namespace_matches_handles_missing_or_none_imports():
         set(),
         set()
     )
+
+
+# SchemaNamespaceIndex
+
+
+def test_schema_namespace_index_matches_first_added_schema(monkeypatch):
+    """
+    Test that SchemaNamespaceIndex.match() returns the first added
+    schema when several schemas match the XML namespaces, regardless
+    of the kind of match.
+
+    Priority: H
+    """
+    monkeypatch.setattr(namespaces_module.logger, "info", lambda *_, **__: None)
+    namespace_index = SchemaNamespaceIndex()
+    namespace_index.add_schema(
+        Path("first.xsd"),
+        SchemaNamespaceStub(
+            target_namespace="http://example.com/first",
+            imports={"http://example.com/shared": None}
+        )
+    )
+    namespace_index.add_schema(
+        Path("second.xsd"),
+        SchemaNamespaceStub(target_namespace="http://example.com/shared")
+    )
+
+    assert namespace_index.match({"http://example.com/shared"}) == Path("first.xsd")
+    assert namespace_index.match({"http://example.com/other"}) is None
+
+def test_schema_namespace_index_applies_declared_namespace_rule(monkeypatch):
+    """
+    Test that SchemaNamespaceIndex only indexes declared namespaces
+    when declared namespace matching is allowed.
+
+    Priority: H
+    """
+    monkeypatch.setattr(namespaces_module.logger, "info", lambda *_, **__: None)
+    schema = SchemaNamespaceStub(
+        target_namespace="http://example.com/schema",
+        namespaces={"decl": "http://example.com/declared"}
+    )
+    strict_index = SchemaNamespaceIndex()
+    strict_index.add_schema(Path("schema.xsd"), schema)
+    lenient_index = SchemaNamespaceIndex(allow_declared_namespace_match=True)
+    lenient_index.add_schema(Path("schema.xsd"), schema)
+
+    assert strict_index.match({"http://example.com/declared"}) is None
+    assert lenient_index.match(
+        {"http://example.com/declared"}
+    ) == Path("schema.xsd")
+
+def test_schema_namespace_index_logs_highest_precedence_match(monkeypatch):
+    """
+    Test that SchemaNamespaceIndex.match() reports a target namespace
+    match over an imported namespace match of the same schema.
+
+    Priority: M
+    """
+    messages = []
+    monkeypatch.setattr(
+        namespaces_module.logger, "info",
+        lambda message, *_, **__: messages.append(message)
+    )
+    namespace_index = SchemaNamespaceIndex()
+    namespace_index.add_schema(
+        Path("schema.xsd"),
+        SchemaNamespaceStub(
+            target_namespace="http://example.com/target",
+            imports={"http://example.com/imported": None}
+        )
+    )
+
+    namespace_index.match(
+        {"http://example.com/imported", "http://example.com/target"}
+    )
+
+    assert (
+        "Schema matched by target namespace: 'http://example.com/target'."
+        in messages
+    )
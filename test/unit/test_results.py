@@ -23,11 +23,21 @@ See for an overview of all tests the file test/_doc/unit/overview.html.
 
 # Standard library imports.
 import csv
+import json
+import os
+import re
+import subprocess
+import sys
 from pathlib import Path
 
+# Third-party library imports.
+import pytest
+
 # Local application imports.
+from xmlvalidator import error_table as error_table_module
 from xmlvalidator import results as results_module
 from xmlvalidator.results import ValidatorResult, ValidatorResultRecorder
+from xmlvalidator.verbosity import use_verbosity
 
 # ValidatorResultRecorder.__init__()
 
@@ -43,6 +53,8 @@ def test_validator_result_recorder_initializes_empty_state():
     # Expected outcome: all mutable recorder state starts empty/reset.
     assert not recorder.errors_by_file
     assert recorder.validation_summary == {"valid": [], "invalid": []}
+    assert not recorder.truncated_files
+    assert not recorder.skipped_files
     assert recorder.error_table_id == 0
 
 
@@ -159,6 +171,66 @@ def test_add_file_errors_records_list_of_error_dictionaries():
     ]
 
 
+# add_truncation_note()
+
+
+def test_add_truncation_note_records_note_row_and_file(monkeypatch):
+    """
+    Test that add_truncation_note() records the note as an extra error
+    entry, tracks the file and logs the note.
+
+    Priority: M
+    """
+    warning_messages = []
+    monkeypatch.setattr(
+        results_module.logger,
+        "warn",
+        lambda message, **_: warning_messages.append(message)
+    )
+    recorder = ValidatorResultRecorder()
+    # Call the method under test.
+    recorder.add_truncation_note(Path("big.xml"), "Error limit reached.")
+    # Expected outcome: the note is recorded like an error's reason.
+    assert recorder.errors_by_file == [
+        {"file_name": "big.xml", "reason": "Error limit reached."}
+    ]
+    assert recorder.truncated_files == ["big.xml"]
+    assert warning_messages == ["\t\tError limit reached."]
+
+
+# add_skipped_files()
+
+
+def test_add_skipped_files_records_and_logs_file_names(monkeypatch):
+    """
+    Test that add_skipped_files() records the skipped files, logs
+    their names and adds them to the summary.
+
+    Priority: M
+    """
+    warning_messages = []
+    monkeypatch.setattr(
+        results_module.logger,
+        "warn",
+        lambda message, **_: warning_messages.append(message)
+    )
+    recorder = ValidatorResultRecorder()
+    recorder.validation_summary = {"valid": [], "invalid": ["bad.xml"]}
+    # Call the method under test.
+    recorder.add_skipped_files([Path("a.xml"), Path("b.xml")])
+    # Expected outcome: the files are recorded, logged and summarized.
+    assert recorder.skipped_files == ["a.xml", "b.xml"]
+    assert warning_messages == [
+        "Stopped at the first invalid file: skipped 2 file(s): a.xml, b.xml."
+    ]
+    assert recorder._get_summary() == {
+        "Total_files validated": 1,
+        "Valid files": 0,
+        "Invalid files": 1,
+        "Skipped files": 2
+    }
+
+
 # log_file_errors()
 
 
@@ -223,6 +295,56 @@ def test_log_summary_logs_summary_counts(monkeypatch):
     ]
 
 
+def test_log_summary_logs_one_message_in_summary_mode(monkeypatch):
+    """
+    Test that log_summary() logs one aggregated message, including the
+    error count, with the summary verbosity.
+
+    Priority: M
+    """
+    info_messages = []
+    monkeypatch.setattr(
+        results_module.logger,
+        "info",
+        lambda message, **_: info_messages.append(message)
+    )
+    recorder = ValidatorResultRecorder()
+    recorder.validation_summary = {"valid": ["a.xml"], "invalid": ["b.xml"]}
+    recorder.errors_by_file = [{"file_name": "b.xml"}, {"file_name": "b.xml"}]
+    # Call the method under test.
+    with use_verbosity("summary"):
+        recorder.log_summary()
+    # Expected outcome: one message holding all counts.
+    assert info_messages == [
+        "Total_files validated: 2, Valid files: 1, Invalid files: 1, Errors: 2."
+    ]
+
+def test_recorder_logs_nothing_when_silent(monkeypatch):
+    """
+    Test that the recorder still records results, but logs nothing,
+    with the silent verbosity.
+
+    Priority: M
+    """
+    messages = []
+    monkeypatch.setattr(
+        results_module.logger, "info", lambda message, **_: messages.append(message)
+    )
+    monkeypatch.setattr(
+        results_module.logger, "warn", lambda message, **_: messages.append(message)
+    )
+    recorder = ValidatorResultRecorder()
+    # Call the methods under test.
+    with use_verbosity("silent"):
+        recorder.add_valid_file(Path("a.xml"))
+        recorder.add_invalid_file(Path("b.xml"))
+        recorder.log_file_errors([{"reason": "Wrong type."}])
+        recorder.log_summary()
+    # Expected outcome: results are recorded without any log output.
+    assert recorder.validation_summary == {"valid": ["a.xml"], "invalid": ["b.xml"]}
+    assert not messages
+
+
 # _get_summary()
 
 
@@ -287,6 +409,10 @@ def test_write_error_table_to_log_ignores_empty_errors(monkeypatch):
     # Expected outcome: no table is written and the id counter is unchanged.
     assert recorder.error_table_id == 0
     assert log_messages == ["No errors to write to log file."]
+    # Expected outcome: below per-file verbosity, nothing is logged.
+    with use_verbosity("summary"):
+        recorder.write_error_table_to_log([])
+    assert log_messages == ["No errors to write to log file."]
 
 
 def test_write_error_table_to_log_writes_filterable_html_table(monkeypatch):
@@ -340,6 +466,166 @@ def test_write_error_table_to_log_adds_style_only_for_first_table(monkeypatch):
     assert recorder.STYLE_AND_FILTER_SCRIPT not in html_messages[1]
 
 
+def test_write_error_table_to_log_renders_all_columns(monkeypatch):
+    """
+    Test that write_error_table_to_log() renders a column per key,
+    escapes values and leaves missing values empty.
+
+    Priority: M
+    """
+    # Collect HTML messages produced by the method under test.
+    html_messages = []
+    monkeypatch.setattr(
+        results_module.logger,
+        "info",
+        lambda message, **_: html_messages.append(message)
+    )
+    recorder = ValidatorResultRecorder()
+    errors = [
+        {"file_name": "a.xml", "reason": "Tag '<b>' & more."},
+        {"file_name": "b.xml", "line": 3},
+    ]
+    # Call the method under test.
+    recorder.write_error_table_to_log(errors)
+    # Expected outcome: the table has the markup the table style targets.
+    assert (
+        '<table class="dataframe"><thead><tr style="text-align: right;">'
+        "<th>file_name</th><th>reason</th><th>line</th></tr></thead><tbody>"
+        "<tr><td>a.xml</td><td>Tag '&lt;b&gt;' &amp; more.</td><td></td></tr>"
+        "<tr><td>b.xml</td><td></td><td>3</td></tr>"
+        "</tbody></table>"
+    ) in html_messages[0]
+
+
+
+def test_write_error_table_to_log_caps_table_rows(monkeypatch):
+    """
+    Test that write_error_table_to_log() only renders the first
+    max_error_table_rows errors and states how many were left out.
+
+    Priority: M
+    """
+    # Collect HTML messages produced by the method under test.
+    html_messages = []
+    monkeypatch.setattr(
+        results_module.logger,
+        "info",
+        lambda message, **_: html_messages.append(message)
+    )
+    recorder = ValidatorResultRecorder(max_error_table_rows=2)
+    errors = [{"file_name": f"{number}.xml"} for number in range(5)]
+    # Call the method under test.
+    recorder.write_error_table_to_log(errors)
+    # Expected outcome: two rows plus a note on the three others.
+    assert html_messages[0].count("<tr>") == 2
+    assert "Showing the first 2 of 5 errors" in html_messages[0]
+
+
+def test_write_error_table_to_log_embeds_json_rows(monkeypatch):
+    """
+    Test that write_error_table_to_log() embeds the rows as JSON in
+    json mode, and only adds the render script to the first table.
+
+    Priority: M
+    """
+    # Collect HTML messages produced by the method under test.
+    html_messages = []
+    monkeypatch.setattr(
+        results_module.logger,
+        "info",
+        lambda message, **_: html_messages.append(message)
+    )
+    recorder = ValidatorResultRecorder(error_table="json", max_error_table_rows=1)
+    errors = [
+        {"file_name": "a.xml", "reason": "Bad </script> value."},
+        {"file_name": "b.xml", "line": 3},
+    ]
+    # Call the method under test twice.
+    recorder.write_error_table_to_log(errors)
+    recorder.write_error_table_to_log(errors)
+    # Expected outcome: escaped JSON rows, capped, with the total.
+    data = re.search(
+        r'class="json_table_data">(.*?)</script>', html_messages[0]
+    ).group(1)
+    assert json.loads(data) == {
+        "total": 2,
+        "rows": [["a.xml", "Bad </script> value."]],
+    }
+    assert "<th>file_name</th><th>reason</th>" in html_messages[0]
+    assert "renderJsonTable('0')" in html_messages[0]
+    assert error_table_module.JSON_TABLE_STYLE_AND_SCRIPT in html_messages[0]
+    assert error_table_module.JSON_TABLE_STYLE_AND_SCRIPT not in html_messages[1]
+
+
+def test_validator_result_recorder_rejects_invalid_table_settings():
+    """
+    Test that ValidatorResultRecorder rejects unsupported error table
+    settings.
+
+    Priority: M
+    """
+    with pytest.raises(ValueError, match="Unsupported error table mode: pdf"):
+        ValidatorResultRecorder(error_table="pdf")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="max_error_table_rows must be 1"):
+        ValidatorResultRecorder(max_error_table_rows=0)
+
+
+def test_recorder_spills_errors_to_disk_per_file(monkeypatch, tmp_path):
+    """
+    Test that a recorder with an error spill folder writes each file's
+    errors to disk as they are added, and exports them from there.
+
+    Priority: H
+    """
+    # Suppress logger output during the unit test.
+    monkeypatch.setattr(results_module.logger, "info", lambda *_, **__: None)
+    monkeypatch.setattr(results_module.logger, "warn", lambda *_, **__: None)
+    recorder = ValidatorResultRecorder(error_spill_dir=tmp_path / "spill")
+    # Call the methods under test.
+    recorder.add_file_errors(Path("a.xml"), [{"reason": "Bad value."}])
+    recorder.add_truncation_note(Path("a.xml"), "Error limit reached.")
+    spill_path = recorder.errors_by_file.path
+    # Expected outcome: the errors are on disk before the run ends.
+    assert spill_path.read_text(encoding="utf-8").splitlines() == [
+        '{"file_name": "a.xml", "reason": "Bad value."}',
+        '{"file_name": "a.xml", "reason": "Error limit reached."}',
+    ]
+    csv_path = recorder.write_errors_to_csv(
+        recorder.errors_by_file, tmp_path / "input.xml", file_name_column="file_name"
+    )
+    assert Path(csv_path).read_text(encoding="utf-8").splitlines() == [
+        "file_name,reason",
+        "a.xml,Bad value.",
+        "a.xml,Error limit reached.",
+    ]
+    recorder.reset()
+    assert len(recorder.errors_by_file) == 0
+    assert recorder.errors_by_file.path is None
+    assert not spill_path.exists()
+
+def test_importing_library_does_not_import_pandas():
+    """
+    Test that importing the library does not import pandas, which would
+    add to the startup time of every test run.
+
+    Priority: M
+    """
+    # Import the library in a fresh interpreter.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, xmlvalidator; print('pandas' in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(results_module.__file__).parents[1])},
+        text=True,
+    )
+    # Expected outcome: pandas was not imported.
+    assert result.stdout.strip() == "False"
+
+
 # write_errors_to_csv()
 
 
@@ -367,6 +653,10 @@ def test_write_errors_to_csv_ignores_empty_errors(monkeypatch):
     assert result == ''
     assert not output_csv_path.exists()
     assert log_messages == ["No errors to write to CSV."]
+    # Expected outcome: below per-file verbosity, nothing is logged.
+    with use_verbosity("summary"):
+        recorder.write_errors_to_csv([], output_dir / "input.xml")
+    assert log_messages == ["No errors to write to CSV."]
 
 
 def test_write_errors_to_csv_writes_file_and_moves_file_name_first(
@@ -463,6 +753,35 @@ def test_write_errors_to_csv_handles_different_error_keys(monkeypatch):
         }
     ]
 
+def test_write_errors_to_csv_writes_expected_bytes(monkeypatch):
+    """
+    Test that write_errors_to_csv() quotes values like pandas did and
+    writes None and missing values as empty cells.
+
+    Priority: M
+    """
+    # Suppress logger output during the unit test.
+    monkeypatch.setattr(results_module.logger, "info", lambda *_, **__: None)
+    recorder = ValidatorResultRecorder()
+    output_dir = Path("results/unit-test-output")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    errors = [
+        {"reason": 'Value "x", not int.', "file_name": "a.xml", "line": 3},
+        {"file_name": "b.xml", "reason": None, "valid": False},
+    ]
+    # Call the method under test.
+    csv_path = recorder.write_errors_to_csv(
+        errors,
+        output_dir / "input.xml",
+        file_name_column="file_name"
+    )
+    # Expected outcome: the exact CSV content.
+    assert Path(csv_path).read_bytes() == (
+        "file_name,reason,line,valid\n"
+        'a.xml,"Value ""x"", not int.",3,\n'
+        "b.xml,,,False\n"
+    ).replace("\n", os.linesep).encode("utf-8")
+
 
 # reset()
 
@@ -479,12 +798,16 @@ def test_reset_clears_all_recorder_state():
         "valid": ["valid.xml"],
         "invalid": ["invalid.xml"]
     }
+    recorder.truncated_files = ["invalid.xml"]
+    recorder.skipped_files = ["skipped.xml"]
     recorder.error_table_id = 3
     # Call the method under test.
     recorder.reset()
     # Expected outcome: all recorder state is restored to defaults.
     assert not recorder.errors_by_file
     assert recorder.validation_summary == {"valid": [], "invalid": []}
+    assert not recorder.truncated_files
+    assert not recorder.skipped_files
     assert recorder.error_table_id == 0
 
 
@@ -0,0 +1,135 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Contains unit tests for the src/xmlvalidator/schema/cache.py module.
+
+See for an overview of all tests the file test/_doc/unit/overview.html.
+"""
+
+# Third-party library imports.
+from xmlschema import XMLSchema
+
+# Local application imports.
+from xmlvalidator.schema.cache import SchemaDiskCache
+
+
+def _write_schema_with_include(tmp_path):
+    """
+    Writes a main XSD file that includes a second XSD file.
+    """
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "types.xsd").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:simpleType name="code"><xs:restriction base="xs:int"/></xs:simpleType>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    xsd_file = schema_dir / "main.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:include schemaLocation="types.xsd"/>
+            <xs:element name="root" type="code"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    return xsd_file
+
+
+# load() / store()
+
+
+def test_load_returns_stored_schema_in_later_run(tmp_path):
+    """
+    Test that a schema stored by one cache instance is loaded by a new
+    instance on the same folder, as a later test run would.
+
+    Priority: H
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    assert SchemaDiskCache(cache_dir).store(xsd_file, None, XMLSchema(xsd_file))
+    schema = SchemaDiskCache(cache_dir).load(xsd_file)
+
+    assert isinstance(schema, XMLSchema)
+    assert schema.is_valid("<root>1</root>")
+    assert not schema.is_valid("<root>one</root>")
+
+def test_load_returns_none_when_nothing_was_stored(tmp_path):
+    """
+    Test that load() returns None for an XSD file that was not cached,
+    or that was cached with another base_url.
+
+    Priority: M
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    schema_cache = SchemaDiskCache(tmp_path / "cache")
+
+    assert schema_cache.load(xsd_file) is None
+    schema_cache.store(xsd_file, None, XMLSchema(xsd_file))
+    assert schema_cache.load(xsd_file, str(xsd_file.parent)) is None
+
+def test_load_returns_none_after_included_file_changed(tmp_path):
+    """
+    Test that a change to an included XSD file invalidates the cached
+    schema of the including XSD file.
+
+    Priority: H
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    schema_cache = SchemaDiskCache(tmp_path / "cache")
+    schema_cache.store(xsd_file, None, XMLSchema(xsd_file))
+
+    included_file = xsd_file.parent / "types.xsd"
+    included_file.write_text(
+        included_file.read_text(encoding="utf-8").replace("xs:int", "xs:string"),
+        encoding="utf-8"
+    )
+
+    assert schema_cache.load(xsd_file) is None
+
+def test_load_returns_none_for_unreadable_cache_entry(tmp_path):
+    """
+    Test that a corrupt cache entry counts as a cache miss.
+
+    Priority: M
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    schema_cache = SchemaDiskCache(tmp_path / "cache")
+    schema_cache.store(xsd_file, None, XMLSchema(xsd_file))
+    for pickle_file in schema_cache.cache_dir.glob("*.pickle"):
+        pickle_file.write_bytes(b"not a pickle")
+
+    assert schema_cache.load(xsd_file) is None
+
+def test_store_skips_schema_without_source_file(tmp_path):
+    """
+    Test that a schema that was not read from a local file is not
+    stored.
+
+    Priority: M
+    """
+    schema = XMLSchema(
+        """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root" type="xs:string"/>
+        </xs:schema>"""
+    )
+    schema_cache = SchemaDiskCache(tmp_path / "cache")
+
+    assert schema_cache.store(tmp_path / "schema.xsd", None, schema) is False
+    assert not list(schema_cache.cache_dir.iterdir())
@@ -0,0 +1,369 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Contains unit tests for the src/xmlvalidator/schema/catalog.py module.
+
+See for an overview of all tests the file test/_doc/unit/overview.html.
+"""
+
+# pylint: disable=I1101:c-extension-no-member
+
+# Standard library imports.
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+# Third-party library imports.
+from lxml import etree
+
+# Local application imports.
+from xmlvalidator.schema.catalog import (
+    SchemaDocumentResolver,
+    SchemaDocumentStore,
+    XmlCatalog,
+    get_local_path,
+    resolve_schema_location,
+)
+from xmlvalidator.schema.manager import ValidatorSchemaManager
+
+TYPES_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:simpleType name="code"><xs:restriction base="xs:int"/></xs:simpleType>
+</xs:schema>"""
+
+MAIN_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:include schemaLocation="../common/types.xsd"/>
+    <xs:element name="{element}" type="code"/>
+</xs:schema>"""
+
+REMOTE_IMPORT_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           xmlns:t="urn:types" targetNamespace="urn:main">
+    <xs:import namespace="urn:types"
+               schemaLocation="http://example.invalid/schemas/types.xsd"/>
+    <xs:element name="root" type="t:code"/>
+</xs:schema>"""
+
+TYPES_NS_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:types">
+    <xs:simpleType name="code"><xs:restriction base="xs:int"/></xs:simpleType>
+</xs:schema>"""
+
+CATALOG_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+    <uri name="http://example.invalid/xml.xsd" uri="local/xml.xsd"/>
+    <rewriteURI uriStartString="http://example.invalid/" rewritePrefix="mirror/"/>
+    <nextCatalog catalog="more/catalog.xml"/>
+</catalog>"""
+
+NEXT_CATALOG_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+    <system systemId="http://example.invalid/a.dtd" uri="a.dtd"/>
+    <rewriteURI uriStartString="http://example.invalid/deep/" rewritePrefix="deep/"/>
+</catalog>"""
+
+
+# get_local_path() / resolve_schema_location()
+
+
+def test_get_local_path_accepts_paths_and_file_urls(tmp_path):
+    """
+    Test that get_local_path() returns paths for plain file paths and
+    file URLs, and None for remote URLs.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "schema.xsd"
+
+    assert get_local_path(str(xsd_file)) == xsd_file.resolve()
+    assert get_local_path(xsd_file.as_uri()) == xsd_file.resolve()
+    assert get_local_path("https://example.com/schema.xsd") is None
+
+def test_resolve_schema_location_resolves_against_document_url(tmp_path):
+    """
+    Test that resolve_schema_location() resolves relative locations
+    against the folder of the including document.
+
+    Priority: H
+    """
+    document_url = str(tmp_path / "schemas" / "main.xsd")
+
+    assert resolve_schema_location(
+        "../common/types.xsd", document_url
+    ) == (tmp_path / "common" / "types.xsd").resolve()
+    assert resolve_schema_location(
+        "http://www.w3.org/2001/xml.xsd", document_url
+    ) is None
+    assert resolve_schema_location("types.xsd", "https://example.com/a.xsd") is None
+    assert resolve_schema_location(None, document_url) is None
+
+
+def test_resolve_schema_location_maps_remote_locations_through_catalog(tmp_path):
+    """
+    Test that resolve_schema_location() maps remote locations, and
+    relative locations within remote documents, through a catalog.
+
+    Priority: H
+    """
+    xml_catalog = XmlCatalog.from_value({"http://example.invalid/": str(tmp_path)})
+    document_url = str(tmp_path / "main.xsd")
+
+    assert resolve_schema_location(
+        "http://example.invalid/types.xsd", document_url, xml_catalog
+    ) == (tmp_path / "types.xsd").resolve()
+    assert resolve_schema_location(
+        "common/types.xsd", "http://example.invalid/main.xsd", xml_catalog
+    ) == (tmp_path / "common" / "types.xsd").resolve()
+    assert resolve_schema_location(
+        "http://elsewhere.invalid/types.xsd", document_url, xml_catalog
+    ) is None
+
+
+# XmlCatalog
+
+
+def test_xml_catalog_reads_oasis_catalog_files(tmp_path):
+    """
+    Test that XmlCatalog.from_file() reads uri, system, rewriteURI and
+    nextCatalog entries, relative to the catalog file that holds them.
+
+    Priority: H
+    """
+    (tmp_path / "more").mkdir()
+    (tmp_path / "catalog.xml").write_text(CATALOG_XML, encoding="utf-8")
+    (tmp_path / "more" / "catalog.xml").write_text(
+        NEXT_CATALOG_XML, encoding="utf-8"
+    )
+
+    xml_catalog = XmlCatalog.from_file(tmp_path / "catalog.xml")
+
+    assert xml_catalog.resolve("http://example.invalid/xml.xsd") == str(
+        tmp_path / "local" / "xml.xsd"
+    )
+    assert xml_catalog.resolve("http://example.invalid/a.dtd") == str(
+        tmp_path / "more" / "a.dtd"
+    )
+    # The longest matching prefix wins, whichever catalog defines it.
+    assert xml_catalog.resolve("http://example.invalid/deep/b.xsd") == (
+        f"{tmp_path / 'more' / 'deep'}/b.xsd"
+    )
+    assert xml_catalog.resolve("http://example.invalid/c.xsd") == (
+        f"{tmp_path / 'mirror'}/c.xsd"
+    )
+    assert xml_catalog.resolve("http://other.invalid/c.xsd") is None
+
+def test_xml_catalog_ignores_entries_missing_required_attributes(tmp_path):
+    """
+    Test that XmlCatalog.from_file() skips system, rewriteURI and
+    rewriteSystem entries that lack their target attribute, instead of
+    failing to load the catalog.
+
+    Priority: M
+    """
+    (tmp_path / "catalog.xml").write_text(
+        """<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+            <system systemId="http://example.invalid/no-uri.xsd"/>
+            <rewriteURI uriStartString="http://example.invalid/rewrite/"/>
+            <rewriteSystem systemIdStartString="http://example.invalid/system/"/>
+            <uri name="http://example.invalid/types.xsd" uri="local/types.xsd"/>
+        </catalog>""",
+        encoding="utf-8"
+    )
+
+    xml_catalog = XmlCatalog.from_file(tmp_path / "catalog.xml")
+
+    assert xml_catalog.resolve("http://example.invalid/no-uri.xsd") is None
+    assert xml_catalog.resolve("http://example.invalid/rewrite/a.xsd") is None
+    assert xml_catalog.resolve("http://example.invalid/system/a.xsd") is None
+    assert xml_catalog.resolve("http://example.invalid/types.xsd") == str(
+        tmp_path / "local" / "types.xsd"
+    )
+
+def test_xml_catalog_from_dictionary_and_fingerprint(tmp_path):
+    """
+    Test that a catalog is built from a dictionary, and that its
+    fingerprint changes with its mappings.
+
+    Priority: M
+    """
+    xml_catalog = XmlCatalog.from_value(
+        {"http://example.invalid/types.xsd": str(tmp_path / "types.xsd")}
+    )
+    other_catalog = XmlCatalog.from_value(
+        {"http://example.invalid/types.xsd": str(tmp_path / "other.xsd")}
+    )
+
+    assert xml_catalog.resolve("http://example.invalid/types.xsd") == str(
+        (tmp_path / "types.xsd").resolve()
+    )
+    assert XmlCatalog.from_value(xml_catalog) is xml_catalog
+    assert xml_catalog.get_fingerprint() != other_catalog.get_fingerprint()
+
+def test_schemas_load_remote_imports_from_catalog_without_network(tmp_path):
+    """
+    Test that both xmlschema and lxml load a remote import from the
+    local file the catalog maps it to.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "main.xsd"
+    xsd_file.write_text(REMOTE_IMPORT_XSD, encoding="utf-8")
+    (tmp_path / "types.xsd").write_text(TYPES_NS_XSD, encoding="utf-8")
+    schema_manager = ValidatorSchemaManager(
+        xml_catalog=XmlCatalog.from_value(
+            {"http://example.invalid/schemas/": str(tmp_path)}
+        )
+    )
+
+    result = schema_manager.load_schema(xsd_file)
+    lxml_schema = schema_manager.get_lxml_schema()
+
+    assert result.success
+    assert result.value.is_valid('<root xmlns="urn:main">1</root>')
+    assert lxml_schema is not None
+    assert not lxml_schema.validate(etree.fromstring('<root xmlns="urn:main">x</root>'))
+
+def test_schemas_fail_fast_on_remote_imports_missing_from_catalog(tmp_path):
+    """
+    Test that, with a catalog, a remote import that the catalog does
+    not map fails without network access and names the URL.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "main.xsd"
+    xsd_file.write_text(REMOTE_IMPORT_XSD, encoding="utf-8")
+    schema_manager = ValidatorSchemaManager(xml_catalog=XmlCatalog())
+
+    with patch("urllib.request.urlopen") as urlopen_mock:
+        result = schema_manager.load_schema(xsd_file)
+        lxml_schema = schema_manager.get_lxml_schema(xsd_file)
+
+    assert not result.success
+    assert "http://example.invalid/schemas/types.xsd" in str(result.error["ValueError"])
+    assert lxml_schema is None
+    urlopen_mock.assert_not_called()
+
+
+# SchemaDocumentStore
+
+
+def test_document_store_reads_unchanged_files_once(tmp_path):
+    """
+    Test that the document store serves unchanged files from memory
+    and reads a file again once it changed.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "types.xsd"
+    xsd_file.write_text(TYPES_XSD, encoding="utf-8")
+    document_store = SchemaDocumentStore()
+
+    with patch.object(
+        Path, "read_bytes", autospec=True, side_effect=Path.read_bytes
+    ) as read_bytes_mock:
+        document_store.read(xsd_file)
+        document_store.read(xsd_file)
+        assert read_bytes_mock.call_count == 1
+        xsd_file.write_text(TYPES_XSD.replace("xs:int", "xs:long"), encoding="utf-8")
+        modified_at = xsd_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(xsd_file, ns=(modified_at, modified_at))
+        assert b"xs:long" in document_store.read(xsd_file)
+        assert read_bytes_mock.call_count == 2
+
+def test_document_store_drops_least_recently_used_documents(tmp_path):
+    """
+    Test that the document store stays within its byte limit.
+
+    Priority: M
+    """
+    document_store = SchemaDocumentStore(max_bytes=15)
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.xsd").write_bytes(b"0123456789")
+        document_store.read(tmp_path / f"{name}.xsd")
+
+    assert document_store.stored_bytes == 10
+
+
+# SchemaDocumentResolver
+
+
+def test_resolver_serves_includes_shared_by_schemas_from_memory(tmp_path):
+    """
+    Test that compiling several schemas that include the same file,
+    from outside their own folder, reads that file from disk once.
+
+    Priority: H
+    """
+    (tmp_path / "common").mkdir()
+    (tmp_path / "schemas").mkdir()
+    types_file = tmp_path / "common" / "types.xsd"
+    types_file.write_text(TYPES_XSD, encoding="utf-8")
+    xsd_files = []
+    for element in ("first", "second"):
+        xsd_file = tmp_path / "schemas" / f"{element}.xsd"
+        xsd_file.write_text(MAIN_XSD.format(element=element), encoding="utf-8")
+        xsd_files.append(xsd_file)
+    schema_manager = ValidatorSchemaManager()
+    read_paths = []
+    original_read_bytes = Path.read_bytes
+
+    def record_read_bytes(file_path):
+        read_paths.append(file_path)
+        return original_read_bytes(file_path)
+
+    with patch.object(Path, "read_bytes", autospec=True, side_effect=record_read_bytes):
+        lxml_schemas = [
+            schema_manager.get_lxml_schema(xsd_file) for xsd_file in xsd_files
+        ]
+
+    assert all(lxml_schema is not None for lxml_schema in lxml_schemas)
+    assert lxml_schemas[1].validate(etree.fromstring("<second>1</second>"))
+    assert read_paths.count(types_file.resolve()) == 1
+
+def test_resolver_leaves_remote_and_missing_documents_to_lxml(tmp_path):
+    """
+    Test that the resolver does not answer requests for remote URLs
+    or for files that cannot be read.
+
+    Priority: M
+    """
+    resolver = SchemaDocumentResolver(SchemaDocumentStore())
+
+    assert resolver.resolve("https://example.com/a.xsd", None, None) is None
+    assert resolver.resolve(str(tmp_path / "missing.xsd"), None, None) is None
+    assert resolver.resolve("", None, None) is None
+
+def test_resolver_serves_documents_mapped_by_catalog(tmp_path):
+    """
+    Test that the resolver serves remote URLs mapped by a catalog from
+    their local file.
+
+    Priority: H
+    """
+    (tmp_path / "types.xsd").write_text(TYPES_XSD, encoding="utf-8")
+    resolver = SchemaDocumentResolver(
+        SchemaDocumentStore(),
+        XmlCatalog.from_value({"http://example.invalid/": str(tmp_path)}),
+    )
+
+    with patch.object(resolver, "resolve_string") as resolve_string_mock:
+        resolver.resolve("http://example.invalid/types.xsd", None, "context")
+
+    resolve_string_mock.assert_called_once_with(
+        TYPES_XSD.encode(),
+        "context",
+        base_url=str((tmp_path / "types.xsd").resolve()),
+    )
@@ -18,7 +18,11 @@ Contains unit tests for the src/xmlvalidator/schema/manager.py module.
 See for an overview of all tests the file test/_doc/unit/overview.html.
 """
 
+# pylint: disable=W0212:protected-access
+
 # Standard library imports.
+import os
+import traceback
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -29,7 +33,7 @@ from xmlschema.validators import XsdValidator
 
 # Local application imports.
 from xmlvalidator.results import ValidatorResult
-from xmlvalidator.schema.manager import ValidatorSchemaManager
+from xmlvalidator.schema.manager import SchemaCache, ValidatorSchemaManager
 
 schema_manager_module = __import__(
     "xmlvalidator.schema.manager",
@@ -143,6 +147,58 @@ def test_ensure_schema_load_failure():
             "Setting schema file: invalid.xsd.", also_console=True
             )
 
+def test_ensure_schema_lazy_defers_xmlschema_build(tmp_path):
+    """
+    Test that ensure_schema() with lazy=True only selects a schema that
+    lxml can compile, and that reading schema builds it.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "schema.xsd"
+    xsd_file.write_text(
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        '<xs:element name="note" type="xs:string"/></xs:schema>',
+        encoding="utf-8",
+    )
+    with patch.object(xml_validator_module.logger, "info"):
+        schema_manager = ValidatorSchemaManager()
+        with patch.object(
+            schema_manager,
+            "_create_xmlschema",
+            wraps=schema_manager._create_xmlschema
+        ) as mock_create_xmlschema:
+            result = schema_manager.ensure_schema(xsd_file, lazy=True)
+            # Expected outcome: the schema is selected, but not built.
+            assert result.success is True
+            assert result.value is None
+            assert schema_manager.is_loaded(xsd_file)
+            assert schema_manager.ensure_schema(lazy=True).value is None
+            mock_create_xmlschema.assert_not_called()
+            # Reading the schema builds it, once.
+            schema = schema_manager.schema
+            assert schema is not None
+            assert schema_manager.ensure_schema().value is schema
+            assert schema_manager.ensure_schema(xsd_file, lazy=True).value is schema
+            mock_create_xmlschema.assert_called_once()
+
+def test_ensure_schema_lazy_loads_schema_lxml_cannot_compile():
+    """
+    Test that ensure_schema() with lazy=True still loads a schema right
+    away if lxml cannot compile it.
+
+    Priority: M
+    """
+    with patch.object(
+        ValidatorSchemaManager, "load_schema",
+        return_value=ValidatorResult(success=False, error="Schema load error")
+    ) as mock_load_schema, patch.object(
+        xml_validator_module.logger, "info"
+    ):
+        schema_manager = ValidatorSchemaManager()
+        result = schema_manager.ensure_schema(Path("missing.xsd"), lazy=True)
+        mock_load_schema.assert_called_once_with(Path("missing.xsd"), None)
+        assert result.success is False
+
 
 # load_schema()
 
@@ -195,6 +251,132 @@ def test_load_schema_valid_xsd():
         assert result.success is True
         assert result.value is mock_schema_instance
 
+def test_load_schema_reuses_schema_from_disk_cache(tmp_path):
+    """
+    Test that load_schema() stores built schemas in the schema cache
+    folder and that a later manager loads them without rebuilding.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "schema.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root" type="xs:string"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    cache_dir = tmp_path / "cache"
+    assert ValidatorSchemaManager(cache_dir).load_schema(xsd_file).success
+
+    with patch.object(schema_manager_module, "XMLSchema") as mock_xmlschema:
+        schema_manager = ValidatorSchemaManager(cache_dir)
+        result = schema_manager.load_schema(xsd_file)
+
+    mock_xmlschema.assert_not_called()
+    assert result.success is True
+    assert schema_manager.is_loaded(xsd_file)
+    assert result.value.is_valid("<root>text</root>")
+
+def test_load_schema_builds_each_schema_once_across_switches(tmp_path):
+    """
+    Test that load_schema() builds each XMLSchema object once, also
+    when the loaded schemas alternate, and counts the cache hits.
+
+    Priority: H
+    """
+    xsd_files = []
+    for name in ("a", "b", "c"):
+        xsd_file = tmp_path / f"{name}.xsd"
+        xsd_file.write_text(
+            f"""<?xml version="1.0" encoding="UTF-8"?>
+            <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:element name="{name}" type="xs:string"/>
+            </xs:schema>""",
+            encoding="utf-8"
+        )
+        xsd_files.append(xsd_file)
+    schema_manager = ValidatorSchemaManager()
+
+    with patch.object(
+        schema_manager, "_create_xmlschema", wraps=schema_manager._create_xmlschema
+    ) as mock_create_xmlschema:
+        for index in range(30):
+            result = schema_manager.load_schema(xsd_files[index % 3])
+            assert result.success is True
+
+    assert mock_create_xmlschema.call_count == 3
+    assert schema_manager.schema_path == xsd_files[2].resolve()
+    statistics = schema_manager.get_xmlschema_cache_statistics()
+    assert statistics["hits"] == 27
+    assert statistics["misses"] == 3
+    assert statistics["entries"] == 3
+
+def test_load_schema_rebuilds_schema_when_included_file_changes(tmp_path):
+    """
+    Test that a cached XMLSchema object is built again once a file that
+    the schema includes changes, and that another base_url gets an
+    object of its own.
+
+    Priority: H
+    """
+    included_file = tmp_path / "included.xsd"
+    included_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root" type="xs:string"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    xsd_file = tmp_path / "schema.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:include schemaLocation="included.xsd"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    schema_manager = ValidatorSchemaManager()
+    first_schema = schema_manager.load_schema(xsd_file).value
+
+    assert schema_manager.load_schema(xsd_file).value is first_schema
+
+    included_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root" type="xs:int"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    second_schema = schema_manager.load_schema(xsd_file).value
+
+    assert second_schema is not first_schema
+    assert not second_schema.is_valid("<root>text</root>")
+    assert schema_manager.load_schema(xsd_file, str(tmp_path)).value is not (
+        second_schema
+    )
+
+
+# is_loaded()
+
+
+def test_is_loaded_compares_schema_path_and_base_url(tmp_path):
+    """
+    Test that is_loaded() only reports the active schema for the same
+    XSD file and base_url.
+
+    Priority: M
+    """
+    xsd_file = tmp_path / "schema.xsd"
+    schema_manager = ValidatorSchemaManager()
+    schema_manager.schema = MagicMock()
+    schema_manager.schema_path = xsd_file.resolve()
+    schema_manager.schema_base_url = "base"
+
+    assert schema_manager.is_loaded(xsd_file, "base") is True
+    assert schema_manager.is_loaded(xsd_file, None) is False
+    assert schema_manager.is_loaded(tmp_path / "other.xsd", "base") is False
+
 
 # get_lxml_schema()
 
@@ -244,9 +426,369 @@ def test_get_lxml_schema_returns_none_for_invalid_lxml_schema(tmp_path):
 
     assert schema_manager.get_lxml_schema(xsd_file) is None
 
-def test_reset_schema_clears_schema_state_and_lxml_cache(tmp_path):
+def test_get_lxml_schema_shares_compiled_schema_with_sanity_check(tmp_path):
     """
-    Test that reset_schema() clears loaded schema state and lxml cache.
+    Test that get_lxml_schema() returns the schema compiled earlier by
+    compile_lxml_schema(), e.g. during the XSD sanity check.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "schema.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root" type="xs:string"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    schema_manager = ValidatorSchemaManager()
+
+    compiled_schema = schema_manager.compile_lxml_schema(xsd_file)
+
+    assert schema_manager.get_lxml_schema(xsd_file) is compiled_schema
+
+
+# compile_lxml_schema()
+
+
+def _write_schema_with_include(tmp_path):
+    """
+    Writes a main XSD file that includes a second XSD file.
+    """
+    (tmp_path / "types.xsd").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:simpleType name="code"><xs:restriction base="xs:int"/></xs:simpleType>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    xsd_file = tmp_path / "main.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:include schemaLocation="types.xsd"/>
+            <xs:element name="root" type="code"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    return xsd_file
+
+def test_compile_lxml_schema_recompiles_after_included_file_change(tmp_path):
+    """
+    Test that compile_lxml_schema() reuses the compiled schema until
+    the XSD file or a file it includes changes.
+
+    Priority: H
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    schema_manager = ValidatorSchemaManager()
+
+    first_schema = schema_manager.compile_lxml_schema(xsd_file)
+    assert schema_manager.compile_lxml_schema(xsd_file) is first_schema
+    # Change the included type.
+    included_file = tmp_path / "types.xsd"
+    included_file.write_text(
+        included_file.read_text(encoding="utf-8").replace("xs:int", "xs:string"),
+        encoding="utf-8"
+    )
+    modified_at = included_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(included_file, ns=(modified_at, modified_at))
+
+    second_schema = schema_manager.compile_lxml_schema(xsd_file)
+    assert second_schema is not first_schema
+    assert second_schema.validate(
+        schema_manager_module.etree.fromstring("<root>abc</root>")
+    )
+    assert len(schema_manager._lxml_schema_cache) == 1 # pylint: disable=W0212
+
+def test_compile_lxml_schema_keeps_schema_of_touched_files(tmp_path):
+    """
+    Test that compile_lxml_schema() does not recompile when schema
+    files were touched without changing their content.
+
+    Priority: M
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    schema_manager = ValidatorSchemaManager()
+    first_schema = schema_manager.compile_lxml_schema(xsd_file)
+
+    for file_path in (xsd_file, tmp_path / "types.xsd"):
+        modified_at = file_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(file_path, ns=(modified_at, modified_at))
+
+    assert schema_manager.compile_lxml_schema(xsd_file) is first_schema
+
+def test_compile_lxml_schema_checks_files_once_per_schema_generation(tmp_path):
+    """
+    Test that compile_lxml_schema() only detects schema file changes
+    made during a schema generation in the next generation.
+
+    Priority: H
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    schema_manager = ValidatorSchemaManager()
+    schema_manager.start_schema_generation()
+    first_schema = schema_manager.compile_lxml_schema(xsd_file)
+    included_file = tmp_path / "types.xsd"
+    included_file.write_text(
+        included_file.read_text(encoding="utf-8").replace("xs:int", "xs:string"),
+        encoding="utf-8"
+    )
+    modified_at = included_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(included_file, ns=(modified_at, modified_at))
+
+    with patch.object(
+        schema_manager_module.SchemaCacheEntry,
+        "is_current",
+        side_effect=AssertionError
+    ):
+        assert schema_manager.compile_lxml_schema(xsd_file) is first_schema
+    schema_manager.end_schema_generation()
+    assert schema_manager.compile_lxml_schema(xsd_file) is not first_schema
+
+def test_compile_lxml_schema_recompiles_when_missing_include_appears(tmp_path):
+    """
+    Test that a schema that failed to compile because of a missing
+    include is compiled again once the included file exists.
+
+    Priority: M
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    included_file = tmp_path / "types.xsd"
+    included_content = included_file.read_text(encoding="utf-8")
+    included_file.unlink()
+    schema_manager = ValidatorSchemaManager()
+
+    assert schema_manager.get_lxml_schema(xsd_file) is None
+    included_file.write_text(included_content, encoding="utf-8")
+
+    assert schema_manager.get_lxml_schema(xsd_file) is not None
+
+def test_compile_lxml_schema_memoizes_and_raises_errors(tmp_path):
+    """
+    Test that compile_lxml_schema() compiles an invalid XSD file once
+    and raises the memoized error on each call.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "invalid_schema.xsd"
+    xsd_file.write_text("<root />", encoding="utf-8")
+    schema_manager = ValidatorSchemaManager()
+
+    with patch.object(
+        schema_manager_module.etree,
+        "XMLSchema",
+        wraps=schema_manager_module.etree.XMLSchema
+    ) as xml_schema_mock:
+        for _ in range(2):
+            with pytest.raises(schema_manager_module.etree.XMLSchemaParseError):
+                schema_manager.compile_lxml_schema(xsd_file)
+
+    xml_schema_mock.assert_called_once()
+
+def test_compile_lxml_schema_raises_memoized_error_with_fresh_traceback(tmp_path):
+    """
+    Test that raising a memoized compile error again does not make its
+    traceback grow with each call.
+
+    Priority: M
+    """
+    xsd_file = tmp_path / "invalid_schema.xsd"
+    xsd_file.write_text("<root />", encoding="utf-8")
+    schema_manager = ValidatorSchemaManager()
+    traceback_depths = []
+
+    for _ in range(3):
+        with pytest.raises(schema_manager_module.etree.XMLSchemaParseError) as e:
+            schema_manager.compile_lxml_schema(xsd_file)
+        traceback_depths.append(len(traceback.extract_tb(e.value.__traceback__)))
+
+    assert traceback_depths[1] == traceback_depths[2]
+
+def test_compile_lxml_schema_resolves_includes_against_base_url(tmp_path):
+    """
+    Test that compile_lxml_schema() resolves relative includes against
+    the base_url folder, as xmlschema does.
+
+    Priority: H
+    """
+    (tmp_path / "includes").mkdir()
+    (tmp_path / "includes" / "types.xsd").write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:simpleType name="code"><xs:restriction base="xs:int"/></xs:simpleType>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    (tmp_path / "schemas").mkdir()
+    xsd_file = tmp_path / "schemas" / "main.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:include schemaLocation="includes/types.xsd"/>
+            <xs:element name="root" type="code"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    schema_manager = ValidatorSchemaManager()
+
+    assert schema_manager.get_lxml_schema(xsd_file) is None
+    assert schema_manager.get_lxml_schema(xsd_file, str(tmp_path)) is not None
+
+def test_get_lxml_schema_cache_statistics_counts_hits_and_misses(tmp_path):
+    """
+    Test that the lxml schema cache counts hits and misses, including
+    a miss for a schema whose file changed.
+
+    Priority: M
+    """
+    xsd_file = _write_schema_with_include(tmp_path)
+    schema_manager = ValidatorSchemaManager()
+
+    schema_manager.get_lxml_schema(xsd_file)
+    schema_manager.get_lxml_schema(xsd_file)
+    xsd_file.write_text(
+        xsd_file.read_text(encoding="utf-8").replace('"root"', '"rooted"'),
+        encoding="utf-8"
+    )
+    schema_manager.get_lxml_schema(xsd_file)
+    statistics = schema_manager.get_lxml_schema_cache_statistics()
+
+    assert statistics["hits"] == 1
+    assert statistics["misses"] == 2
+    assert statistics["evictions"] == 0
+    assert statistics["entries"] == 1
+    assert statistics["estimated_bytes"] > 0
+
+
+# get_lxml_fallback_schemas()
+
+
+def test_get_lxml_fallback_schemas_lists_schemas_lxml_cannot_compile(tmp_path):
+    """
+    Test that get_lxml_fallback_schemas() lists each schema whose lxml
+    compile failed until its file is fixed, and that the statistics
+    count the failure.
+
+    Priority: H
+    """
+    valid_xsd_file = _write_schema_with_include(tmp_path)
+    invalid_xsd_file = tmp_path / "invalid_schema.xsd"
+    invalid_xsd_file.write_text("<root />", encoding="utf-8")
+    schema_manager = ValidatorSchemaManager()
+
+    for _ in range(3):
+        assert schema_manager.get_lxml_schema(valid_xsd_file) is not None
+        assert schema_manager.get_lxml_schema(invalid_xsd_file, "base") is None
+    fallback_schemas = schema_manager.get_lxml_fallback_schemas()
+    statistics = schema_manager.get_lxml_schema_cache_statistics()
+
+    assert len(fallback_schemas) == 1
+    assert fallback_schemas[0]["xsd_path"] == str(invalid_xsd_file.resolve())
+    assert fallback_schemas[0]["base_url"] == "base"
+    assert fallback_schemas[0]["error"].startswith("XMLSchemaParseError: ")
+    assert statistics["misses"] == 2
+    assert statistics["failures"] == 1
+
+    invalid_xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root" type="xs:string"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+
+    assert schema_manager.get_lxml_fallback_schemas() == []
+
+
+# SchemaCache
+
+
+def test_schema_cache_evicts_least_recently_used_entry():
+    """
+    Test that the cache evicts the least recently used entry once the
+    maximum number of entries is exceeded.
+
+    Priority: H
+    """
+    schema_cache = SchemaCache(max_entries=2)
+    entries = [MagicMock(estimated_bytes=10) for _ in range(3)]
+    schema_cache.put((Path("a.xsd"), None), entries[0])
+    schema_cache.put((Path("b.xsd"), None), entries[1])
+    # Use 'a', so that 'b' becomes the least recently used entry.
+    assert schema_cache.get((Path("a.xsd"), None)) is entries[0]
+
+    schema_cache.put((Path("c.xsd"), None), entries[2])
+
+    assert schema_cache.get((Path("b.xsd"), None)) is None
+    assert schema_cache.get((Path("a.xsd"), None)) is entries[0]
+    assert schema_cache.get_statistics()["evictions"] == 1
+    assert schema_cache.get_statistics()["estimated_bytes"] == 20
+
+def test_schema_cache_evicts_entries_beyond_byte_limit():
+    """
+    Test that the cache evicts entries beyond the estimated byte limit,
+    but always keeps the entry that was added last.
+
+    Priority: H
+    """
+    schema_cache = SchemaCache(max_bytes=100)
+    schema_cache.put((Path("a.xsd"), None), MagicMock(estimated_bytes=60))
+    schema_cache.put((Path("b.xsd"), None), MagicMock(estimated_bytes=60))
+
+    assert len(schema_cache) == 1
+    assert schema_cache.get((Path("a.xsd"), None)) is None
+
+    schema_cache.put((Path("c.xsd"), None), MagicMock(estimated_bytes=500))
+
+    assert len(schema_cache) == 1
+    assert schema_cache.get_statistics()["evictions"] == 2
+    assert schema_cache.get_statistics()["estimated_bytes"] == 500
+
+def test_schema_cache_rejects_invalid_limits():
+    """
+    Test that the cache rejects limits lower than one.
+
+    Priority: M
+    """
+    with pytest.raises(ValueError, match="Schema cache limits must be 1 or higher"):
+        SchemaCache(max_entries=0)
+
+def test_schema_cache_checks_entries_once_per_generation():
+    """
+    Test that the cache checks whether an entry's schema files changed
+    on each lookup, but only on the first lookup within a generation.
+
+    Priority: H
+    """
+    schema_cache = SchemaCache()
+    entry = MagicMock(estimated_bytes=10)
+    entry.is_current.return_value = True
+    schema_cache.put((Path("a.xsd"), None), entry)
+    for _ in range(3):
+        assert schema_cache.get((Path("a.xsd"), None)) is entry
+    assert entry.is_current.call_count == 3
+
+    entry.is_current.reset_mock()
+    for _ in range(2):
+        schema_cache.start_generation()
+        for _ in range(3):
+            assert schema_cache.get((Path("a.xsd"), None)) is entry
+    assert entry.is_current.call_count == 2
+    # Entries added within a generation are not checked in that one.
+    added_entry = MagicMock(estimated_bytes=10)
+    schema_cache.put((Path("b.xsd"), None), added_entry)
+    assert schema_cache.get((Path("b.xsd"), None)) is added_entry
+    added_entry.is_current.assert_not_called()
+
+    schema_cache.end_generation()
+    schema_cache.get((Path("a.xsd"), None))
+    assert entry.is_current.call_count == 3
+
+def test_reset_schema_clears_schema_state_and_keeps_lxml_cache(tmp_path):
+    """
+    Test that reset_schema() clears loaded schema state, but keeps the
+    compiled lxml schemas, which invalidate themselves.
 
     Priority: H
     """
@@ -262,11 +804,11 @@ def test_reset_schema_clears_schema_state_and_lxml_cache(tmp_path):
     schema_manager.schema = MagicMock()
     schema_manager.schema_path = xsd_file
     schema_manager.schema_base_url = "base"
-    schema_manager.get_lxml_schema(xsd_file)
+    lxml_schema = schema_manager.get_lxml_schema(xsd_file)
 
     schema_manager.reset_schema()
 
     assert schema_manager.schema is None
     assert schema_manager.schema_path is None
     assert schema_manager.schema_base_url is None
-    assert not schema_manager._lxml_schema_cache # pylint: disable=W0212
+    assert schema_manager.get_lxml_schema(xsd_file) is lxml_schema
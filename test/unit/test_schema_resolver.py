@@ -30,9 +30,11 @@ import pytest
 from lxml import etree
 
 # Local application imports.
+from xmlvalidator.namespaces import SchemaNamespaceIndex
 from xmlvalidator.results import ValidatorResult
 from xmlvalidator.schema.manager import ValidatorSchemaManager
 from xmlvalidator.schema.resolver import ValidatorSchemaResolver
+from xmlvalidator.streaming import STREAMING_CHUNK_SIZE
 
 schema_resolver_module = __import__(
     "xmlvalidator.schema.resolver",
@@ -121,6 +123,7 @@ def test_build_validation_plan_namespace_matching_success():
             xsd_files,
             "by_namespace",
             None,
+            False,
             False
         )
         # Ensure returned result matches the expected mapping.
@@ -162,7 +165,7 @@ def test_build_validation_plan_namespace_matching_failure():
             xsd_search_strategy="by_namespace"
         )
         mock_match_xml_files_to_schemas.assert_called_once_with(
-            xml_files, xsd_files, "by_namespace", None, False
+            xml_files, xsd_files, "by_namespace", None, False, False
         )
         # Each result should be a FileNotFoundError instance.
         for xml_file in xml_files:
@@ -200,7 +203,7 @@ def test_build_validation_plan_filename_matching_success():
             xsd_search_strategy="by_file_name"
         )
         mock_match_xml_files_to_schemas.assert_called_once_with(
-            xml_files, xsd_files, "by_file_name", None, False
+            xml_files, xsd_files, "by_file_name", None, False, False
         )
         assert result == expected_validations
 
@@ -239,7 +242,7 @@ def test_build_validation_plan_filename_matching_failure():
             xsd_search_strategy="by_file_name"
         )
         mock_match_xml_files_to_schemas.assert_called_once_with(
-            xml_files, xsd_files, "by_file_name", None, False
+            xml_files, xsd_files, "by_file_name", None, False, False
         )
         for xml_file in xml_files:
             assert isinstance(result[xml_file], FileNotFoundError)
@@ -304,7 +307,7 @@ def test_build_xsd_path_plan_single_schema_reuses_loaded_schema():
             False
         )
 
-    mock_ensure_schema.assert_called_once_with(xsd_file, None)
+    mock_ensure_schema.assert_called_once_with(xsd_file, None, lazy=False)
     assert result == {
         xml_files[0]: None,
         xml_files[1]: None
@@ -345,16 +348,11 @@ def test_match_xml_files_to_schemas_namespace_matching_success():
     """
     xml_file = Path("test.xml")
     xsd_file = Path("schema.xsd")
-    # Simulate the XML root element's namespace.
-    mock_xml_root = MagicMock()
-    mock_xml_root.nsmap = {"ns": "http://example.com/schema"}
     mock_schema = MagicMock()
     mock_schema.target_namespace = "http://example.com/schema"
     mock_schema.imports = {}
     mock_schema.namespaces = {}
     with patch.object(
-        schema_resolver_module.etree, "parse"
-    ) as mock_parse, patch.object(
         ValidatorSchemaManager, "load_schema",
         return_value=ValidatorResult(success=True, value=mock_schema)
     ), patch.object(
@@ -363,8 +361,6 @@ def test_match_xml_files_to_schemas_namespace_matching_success():
     ), patch.object(
         xml_validator_module.logger, "info"
     ):
-        # Configure XML parse mock to return the mocked root.
-        mock_parse.return_value.getroot.return_value = mock_xml_root
         resolver = ValidatorSchemaResolver(ValidatorSchemaManager())
         result = resolver.match_xml_files_to_schemas(
             xml_file_paths=[xml_file],
@@ -385,25 +381,21 @@ def test_match_xml_files_to_schemas_namespace_matching_failure():
     xml_file = Path("test.xml")
     xsd_file = Path("schema.xsd")
 
-    # XML has a non-matching namespace.
-    mock_xml_root = MagicMock()
-    mock_xml_root.nsmap = {"ns": "http://example.com/non_matching"}
     mock_schema = MagicMock()
     mock_schema.target_namespace = "http://example.com/schema"
     mock_schema.imports = {}
     mock_schema.namespaces = {}
     with patch.object(
-        schema_resolver_module.etree, "parse"
-    ) as mock_parse, patch.object(
         ValidatorSchemaManager, "load_schema",
         return_value=ValidatorResult(success=True, value=mock_schema)
     ), patch.object(
         schema_resolver_module, "extract_namespaces",
         return_value={"http://example.com/non_matching"}
+    ), patch.object(
+        schema_resolver_module, "parse_streaming"
     ), patch.object(
         xml_validator_module.logger, "info"
     ):
-        mock_parse.return_value.getroot.return_value = mock_xml_root
         resolver = ValidatorSchemaResolver(ValidatorSchemaManager())
         result = resolver.match_xml_files_to_schemas(
             xml_file_paths=[xml_file],
@@ -462,7 +454,7 @@ def test_match_xml_files_to_schemas_invalid_xml():
     xml_file = Path("invalid.xml")
     xsd_file = Path("schema.xsd")
     with patch.object(
-        schema_resolver_module.etree, "parse",
+        schema_resolver_module, "extract_namespaces",
         side_effect=etree.XMLSyntaxError(
             "Invalid XML", "<string>", 0, 0, filename="invalid.xml"
         )
@@ -488,7 +480,7 @@ def test_match_xml_files_to_schemas_invalid_xsd():
     xml_file = Path("valid.xml")
     xsd_file = Path("invalid_schema.xsd")
     with patch.object(
-        schema_resolver_module.etree, "parse",
+        schema_resolver_module, "extract_namespaces",
         side_effect=OSError("Error reading file 'valid.xml'")
     ), patch.object(
         xml_validator_module.logger, "info"
@@ -517,37 +509,196 @@ def test_match_xml_file_to_schema_by_namespace_success():
     """
     xml_file = Path("customer.xml")
     xsd_file = Path("customer.xsd")
-    schema_manager = ValidatorSchemaManager()
-    resolver = ValidatorSchemaResolver(schema_manager)
+    namespace_index = MagicMock()
+    namespace_index.match.return_value = xsd_file
 
     with patch.object(
-        schema_resolver_module.etree,
-        "parse"
-    ) as mock_parse, patch.object(
         schema_resolver_module,
         "extract_namespaces",
         return_value={"http://example.com/customer"}
-    ), patch.object(
-        schema_manager,
-        "load_schema",
-        return_value=ValidatorResult(success=True, value=MagicMock())
-    ), patch.object(
-        schema_resolver_module,
-        "schema_matches_xml_namespaces",
-        return_value=True
-    ), patch.object(
+    ) as mock_extract_namespaces, patch.object(
         xml_validator_module.logger,
         "info"
     ):
-        mock_parse.return_value.getroot.return_value = MagicMock()
-        result = resolver._match_xml_file_to_schema_by_namespace(
+        result = ValidatorSchemaResolver._match_xml_file_to_schema_by_namespace(
             xml_file,
-            [xsd_file],
-            None,
-            False
+            namespace_index
         )
 
     assert result == xsd_file
+    mock_extract_namespaces.assert_called_once_with(xml_file, include_nested=False)
+    namespace_index.match.assert_called_once_with({"http://example.com/customer"})
+
+def test_match_xml_file_to_schema_by_namespace_reports_malformed_unmatched_xml(
+    tmp_path
+):
+    """
+    Test that _match_xml_file_to_schema_by_namespace() returns the parse
+    error of an XML file whose root matches no schema, but that is
+    malformed after its root's start tag.
+
+    Priority: M
+    """
+    xml_file = tmp_path / "malformed.xml"
+    xml_file.write_text("<Employee><Employee>", encoding="utf-8")
+    namespace_index = MagicMock()
+    namespace_index.match.return_value = None
+
+    with patch.object(xml_validator_module.logger, "info"):
+        result = ValidatorSchemaResolver._match_xml_file_to_schema_by_namespace(
+            xml_file,
+            namespace_index
+        )
+
+    assert isinstance(result, etree.XMLSyntaxError)
+    assert "Premature end of data" in str(result)
+    namespace_index.match.assert_called_once_with(set())
+
+@pytest.mark.parametrize(
+    "allow_nested_namespace_match, expected_match", [(False, False), (True, True)]
+)
+def test_match_xml_file_to_schema_by_namespace_matches_nested_namespace(
+    tmp_path, allow_nested_namespace_match, expected_match
+):
+    """
+    Test that _match_xml_file_to_schema_by_namespace() only matches an
+    XML file by a namespace declared below its root if allowed, and then
+    stops reading at that declaration, so a malformed tail raises no
+    error.
+
+    Priority: H
+    """
+    xml_file = tmp_path / "envelope.xml"
+    xml_file.write_text(
+        '<envelope xmlns="http://example.com/envelope">'
+        '<payload xmlns="http://example.com/payload"/>'
+        f"<filler>{' ' * STREAMING_CHUNK_SIZE}</filler><trailer><</trailer>",
+        encoding="utf-8"
+    )
+    xsd_file = Path("payload.xsd")
+    mock_schema = MagicMock()
+    mock_schema.target_namespace = "http://example.com/payload"
+    mock_schema.imports = {}
+    mock_schema.namespaces = {}
+    namespace_index = SchemaNamespaceIndex()
+    namespace_index.add_schema(xsd_file, mock_schema)
+
+    with patch.object(xml_validator_module.logger, "info"):
+        result = ValidatorSchemaResolver._match_xml_file_to_schema_by_namespace(
+            xml_file,
+            namespace_index,
+            allow_nested_namespace_match
+        )
+
+    # Expected outcome: without nested matching, the file is read in full.
+    if expected_match:
+        assert result == xsd_file
+    else:
+        assert isinstance(result, etree.XMLSyntaxError)
+
+def test_match_xml_file_to_schema_by_namespace_nested_without_match(tmp_path):
+    """
+    Test that _match_xml_file_to_schema_by_namespace() returns None for
+    a well-formed XML file whose nested namespaces match no schema
+    either, without reading the file a second time.
+
+    Priority: M
+    """
+    xml_file = tmp_path / "envelope.xml"
+    xml_file.write_text(
+        '<envelope xmlns="http://example.com/envelope">'
+        '<payload xmlns="http://example.com/payload"/></envelope>',
+        encoding="utf-8"
+    )
+    namespace_index = SchemaNamespaceIndex()
+
+    with patch.object(
+        schema_resolver_module, "parse_streaming"
+    ) as mock_parse_streaming, patch.object(
+        xml_validator_module.logger, "info"
+    ):
+        result = ValidatorSchemaResolver._match_xml_file_to_schema_by_namespace(
+            xml_file,
+            namespace_index,
+            allow_nested_namespace_match=True
+        )
+
+    assert result is None
+    mock_parse_streaming.assert_not_called()
+
+
+# _build_schema_namespace_index()
+
+
+def test_build_schema_namespace_index_loads_each_schema_once():
+    """
+    Test that namespace matching loads each candidate XSD only once,
+    regardless of the number of XML files that must be matched.
+
+    Priority: H
+    """
+    xml_files = [Path(f"test{i}.xml") for i in range(5)]
+    xsd_files = [Path("schema1.xsd"), Path("schema2.xsd")]
+    schemas = {
+        xsd_files[0]: MagicMock(
+            target_namespace="http://example.com/one", imports={}, namespaces={}
+        ),
+        xsd_files[1]: MagicMock(
+            target_namespace="http://example.com/two", imports={}, namespaces={}
+        ),
+    }
+    schema_manager = ValidatorSchemaManager()
+    with patch.object(
+        schema_manager, "load_schema",
+        side_effect=lambda xsd_path, base_url=None: ValidatorResult(
+            success=True, value=schemas[xsd_path]
+        )
+    ) as mock_load_schema, patch.object(
+        schema_resolver_module, "extract_namespaces",
+        return_value={"http://example.com/two"}
+    ), patch.object(
+        xml_validator_module.logger, "info"
+    ):
+        resolver = ValidatorSchemaResolver(schema_manager)
+        result = resolver.match_xml_files_to_schemas(
+            xml_file_paths=xml_files,
+            xsd_file_paths=xsd_files,
+            search_by="by_namespace"
+        )
+
+    assert mock_load_schema.call_count == len(xsd_files)
+    assert all(result[xml_file] == xsd_files[1] for xml_file in xml_files)
+
+def test_build_schema_namespace_index_skips_schemas_that_fail_to_load():
+    """
+    Test that _build_schema_namespace_index() logs a warning for an XSD
+    that cannot be loaded and keeps indexing the remaining schemas.
+
+    Priority: M
+    """
+    xsd_files = [Path("broken.xsd"), Path("valid.xsd")]
+    valid_schema = MagicMock(
+        target_namespace="http://example.com/valid", imports={}, namespaces={}
+    )
+    schema_manager = ValidatorSchemaManager()
+    with patch.object(
+        schema_manager, "load_schema",
+        side_effect=[
+            ValidatorResult(success=False, error={"XMLSchemaParseError": "bad"}),
+            ValidatorResult(success=True, value=valid_schema),
+        ]
+    ), patch.object(
+        xml_validator_module.logger, "info"
+    ), patch.object(
+        xml_validator_module.logger, "warn"
+    ) as mock_warn:
+        resolver = ValidatorSchemaResolver(schema_manager)
+        namespace_index = resolver._build_schema_namespace_index(
+            xsd_files, None, False
+        )
+
+    assert namespace_index.xsd_file_paths == [xsd_files[1]]
+    mock_warn.assert_called_once()
 
 
 # _match_xml_file_to_schema_by_file_name()
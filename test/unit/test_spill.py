@@ -0,0 +1,134 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Contains unit tests for the src/xmlvalidator/spill.py module.
+
+See for an overview of all tests the file test/_doc/unit/overview.html.
+"""
+
+# Standard library imports.
+import importlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+# Third-party library imports.
+import pytest
+
+# Local application imports.
+from xmlvalidator.spill import SpilledErrors
+
+spill_module = importlib.import_module("xmlvalidator.spill")
+
+
+# SpilledErrors
+
+
+def test_spilled_errors_buffers_until_flushed(tmp_path):
+    """
+    Test that SpilledErrors writes buffered errors to its JSON Lines
+    file once the buffer is full or when flushed.
+
+    Priority: H
+    """
+    spilled_errors = SpilledErrors(tmp_path / "spill", buffer_size=2)
+    spilled_errors.append({"reason": "a"})
+    # Expected outcome: the file is only created once errors are written.
+    assert spilled_errors.path is None
+    assert not (tmp_path / "spill").exists()
+    spilled_errors.append({"reason": "b"})
+    spilled_errors.append({"reason": "c"})
+    assert len(spilled_errors.path.read_text(encoding="utf-8").splitlines()) == 2
+    spilled_errors.flush()
+    # Expected outcome: one JSON object per line, in order.
+    assert [
+        json.loads(line)
+        for line in spilled_errors.path.read_text(encoding="utf-8").splitlines()
+    ] == [{"reason": "a"}, {"reason": "b"}, {"reason": "c"}]
+
+def test_spilled_errors_reads_errors_back(tmp_path):
+    """
+    Test that SpilledErrors supports iteration, indexing and slicing,
+    reading the errors back from its file.
+
+    Priority: H
+    """
+    spilled_errors = SpilledErrors(tmp_path)
+    errors = [{"line": number, "reason": f"Error {number} ü"} for number in range(5)]
+    for error in errors:
+        spilled_errors.append(error)
+    # Expected outcome: the errors read back equal the appended ones.
+    assert len(spilled_errors) == 5
+    assert list(spilled_errors) == errors
+    assert spilled_errors[3] == errors[3]
+    assert spilled_errors[-1] == errors[-1]
+    assert spilled_errors[1:3] == errors[1:3]
+    assert spilled_errors[::2] == errors[::2]
+    assert spilled_errors[:None] == errors
+    with pytest.raises(IndexError):
+        spilled_errors[5]  # pylint: disable=W0104:pointless-statement
+
+def test_spilled_errors_stores_unsupported_values_as_strings(tmp_path):
+    """
+    Test that SpilledErrors stores values that JSON cannot represent
+    as strings.
+
+    Priority: M
+    """
+    spilled_errors = SpilledErrors(tmp_path)
+    spilled_errors.append({"path": Path("a.xml"), "position": (1, 2)})
+    assert spilled_errors[0] == {"path": "a.xml", "position": [1, 2]}
+
+def test_spilled_errors_never_reuses_an_existing_file(monkeypatch, tmp_path):
+    """
+    Test that each SpilledErrors instance writes to a file of its own,
+    also when two instances get the same timestamp.
+
+    Priority: H
+    """
+    fixed_now = datetime(2026, 1, 2, 3, 4, 5, 6)
+    monkeypatch.setattr(
+        spill_module, "datetime", type("FixedDatetime", (), {"now": lambda: fixed_now})
+    )
+    first = SpilledErrors(tmp_path)
+    first.append({"reason": "a"})
+    first.flush()
+    second = SpilledErrors(tmp_path)
+    second.append({"reason": "b"})
+    second.flush()
+    # Expected outcome: the second instance left the first file alone.
+    assert first.path.name == "errors_2026-01-02_03-04-05-000006.jsonl"
+    assert second.path.name == "errors_2026-01-02_03-04-05-000006_1.jsonl"
+    assert list(first) == [{"reason": "a"}]
+    assert list(second) == [{"reason": "b"}]
+
+def test_spilled_errors_discard_deletes_file(tmp_path):
+    """
+    Test that discard() deletes the file, and that reading discarded
+    errors raises instead of returning no errors.
+
+    Priority: H
+    """
+    spilled_errors = SpilledErrors(tmp_path)
+    spilled_errors.append({"reason": "a"})
+    spilled_errors.flush()
+    spill_path = spilled_errors.path
+    spilled_errors.discard()
+    # Expected outcome: no file is left, and reading fails clearly.
+    assert not spill_path.exists()
+    with pytest.raises(ValueError, match="spilled errors were discarded"):
+        list(spilled_errors)
+    with pytest.raises(ValueError, match="spilled errors were discarded"):
+        spilled_errors[0]
@@ -0,0 +1,254 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Contains unit tests for the src/xmlvalidator/streaming.py module.
+
+See for an overview of all tests the file test/_doc/unit/overview.html.
+"""
+
+# pylint: disable=I1101:c-extension-no-member
+
+# Standard library imports.
+from pathlib import Path
+from unittest.mock import patch
+
+# Third-party library imports.
+import pytest
+from lxml import etree
+from xmlschema import XMLSchema
+
+# Local application imports.
+from xmlvalidator import streaming as streaming_module
+from xmlvalidator.streaming import (
+    is_valid_streaming,
+    iter_namespace_declarations,
+    iter_streaming_errors,
+    parse_streaming,
+)
+
+BATCH_XSD = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:element name="batch">
+        <xs:complexType>
+            <xs:sequence>
+                <xs:element name="record" maxOccurs="unbounded">
+                    <xs:complexType>
+                        <xs:sequence>
+                            <xs:element name="amount" type="xs:int"/>
+                        </xs:sequence>
+                    </xs:complexType>
+                </xs:element>
+            </xs:sequence>
+        </xs:complexType>
+    </xs:element>
+</xs:schema>"""
+
+
+def _write_batch(tmp_path, amounts):
+    """
+    Writes a batch XML file with one record per amount.
+    """
+    xml_file = tmp_path / "batch.xml"
+    records = "".join(
+        f"<record><amount>{amount}</amount></record>\n" for amount in amounts
+    )
+    xml_file.write_text(f"<batch>\n{records}</batch>", encoding="utf-8")
+    return xml_file
+
+
+# parse_streaming() / is_valid_streaming()
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1024 * 1024])
+def test_is_valid_streaming_decides_validity_for_any_chunk_size(tmp_path, chunk_size):
+    """
+    Test that is_valid_streaming() finds valid and invalid files,
+    wherever the chunk boundaries fall.
+
+    Priority: H
+    """
+    lxml_schema = etree.XMLSchema(etree.fromstring(BATCH_XSD.encode()))
+    valid_file = _write_batch(tmp_path, range(50))
+
+    assert is_valid_streaming(valid_file, lxml_schema, chunk_size)
+    invalid_file = _write_batch(tmp_path, [*range(49), "x"])
+    assert not is_valid_streaming(invalid_file, lxml_schema, chunk_size)
+
+def test_parse_streaming_discards_completed_elements(tmp_path):
+    """
+    Test that parse_streaming() keeps only the elements still being
+    parsed, so that memory use does not grow with the file size.
+
+    Priority: H
+    """
+    xml_file = _write_batch(tmp_path, range(500))
+    kept_children = []
+    original_discard = (
+        streaming_module._discard_completed_elements  # pylint: disable=W0212
+    )
+
+    def record_discard(root):
+        original_discard(root)
+        kept_children.append(len(root))
+
+    with patch.object(
+        streaming_module, "_discard_completed_elements", side_effect=record_discard
+    ):
+        parse_streaming(xml_file, chunk_size=256)
+
+    assert len(kept_children) > 10
+    assert max(kept_children) == 1
+
+def test_parse_streaming_raises_for_malformed_xml(tmp_path):
+    """
+    Test that parse_streaming() raises XMLSyntaxError for files that
+    are not well-formed.
+
+    Priority: H
+    """
+    xml_file = tmp_path / "malformed.xml"
+    xml_file.write_text("<batch><record></batch>", encoding="utf-8")
+
+    with pytest.raises(etree.XMLSyntaxError):
+        parse_streaming(xml_file)
+
+@pytest.mark.parametrize("chunk_size", [16, 1024 * 1024])
+def test_parse_streaming_opens_file_once_and_closes_it(tmp_path, chunk_size):
+    """
+    Test that parse_streaming() finds the root element in the file it
+    is parsing, instead of opening the file a second time, and closes
+    the file.
+
+    Priority: M
+    """
+    xml_file = _write_batch(tmp_path, range(50))
+    opened_files = []
+    original_open = Path.open
+
+    def record_open(path, *args, **kwargs):
+        opened_files.append(original_open(path, *args, **kwargs))
+        return opened_files[-1]
+
+    with patch.object(Path, "open", autospec=True, side_effect=record_open), \
+         patch.object(streaming_module.etree, "iterparse", side_effect=AssertionError):
+        parse_streaming(xml_file, chunk_size=chunk_size)
+        assert list(iter_namespace_declarations(xml_file, chunk_size)) == []
+
+    assert len(opened_files) == 2
+    assert all(file.closed for file in opened_files)
+
+def test_parse_streaming_raises_for_file_without_element(tmp_path):
+    """
+    Test that parse_streaming() raises XMLSyntaxError for files that
+    hold no element.
+
+    Priority: M
+    """
+    xml_file = tmp_path / "empty.xml"
+    xml_file.write_text("<?xml version='1.0'?>\n<!-- no root -->", encoding="utf-8")
+
+    with pytest.raises(etree.XMLSyntaxError):
+        parse_streaming(xml_file)
+
+
+# iter_namespace_declarations()
+
+
+@pytest.mark.parametrize("chunk_size", [5, 64, 1024 * 1024])
+def test_iter_namespace_declarations_yields_declarations_in_order(
+    tmp_path, chunk_size
+):
+    """
+    Test that iter_namespace_declarations() yields every namespace
+    declaration in document order, wherever the chunk boundaries fall.
+
+    Priority: H
+    """
+    xml_file = tmp_path / "nested.xml"
+    xml_file.write_text(
+        '<root xmlns="urn:root"><a xmlns:x="urn:x"><x:b/></a>'
+        '<c xmlns="urn:c"/><root xmlns:y="urn:y"/></root>',
+        encoding="utf-8"
+    )
+
+    assert list(iter_namespace_declarations(xml_file, chunk_size)) == [
+        (None, "urn:root"), ("x", "urn:x"), (None, "urn:c"), ("y", "urn:y")
+    ]
+
+def test_iter_namespace_declarations_discards_completed_elements(tmp_path):
+    """
+    Test that iter_namespace_declarations() keeps only the elements
+    still being parsed, and reads no further than the consumer needs.
+
+    Priority: H
+    """
+    xml_file = tmp_path / "batch.xml"
+    records = "".join(
+        f'<record xmlns:r{index}="urn:r{index}"/>\n' for index in range(500)
+    )
+    xml_file.write_text(f"<batch>\n{records}</batch>", encoding="utf-8")
+    kept_children = []
+    original_discard = (
+        streaming_module._discard_completed_elements  # pylint: disable=W0212
+    )
+
+    def record_discard(root):
+        original_discard(root)
+        kept_children.append(len(root))
+
+    with patch.object(
+        streaming_module, "_discard_completed_elements", side_effect=record_discard
+    ):
+        declarations = iter_namespace_declarations(xml_file, chunk_size=256)
+        assert next(declarations) == ("r0", "urn:r0")
+        declarations.close()
+        assert len(kept_children) <= 1
+        assert len(list(iter_namespace_declarations(xml_file, 256))) == 500
+
+    assert max(kept_children) == 1
+
+def test_iter_namespace_declarations_raises_for_malformed_xml(tmp_path):
+    """
+    Test that iter_namespace_declarations() raises XMLSyntaxError for
+    files that are not well-formed.
+
+    Priority: M
+    """
+    xml_file = tmp_path / "malformed.xml"
+    xml_file.write_text('<batch xmlns="urn:b"><record></batch>', encoding="utf-8")
+
+    with pytest.raises(etree.XMLSyntaxError):
+        list(iter_namespace_declarations(xml_file))
+
+
+# iter_streaming_errors()
+
+
+def test_iter_streaming_errors_reports_xmlschema_reasons(tmp_path):
+    """
+    Test that iter_streaming_errors() reports the reasons xmlschema
+    reports, with the path of the top-level subtree holding the error.
+
+    Priority: H
+    """
+    xml_file = _write_batch(tmp_path, [1, "x", 3, "y"])
+    schema = XMLSchema(BATCH_XSD)
+
+    errors = list(iter_streaming_errors(xml_file, schema))
+
+    assert [error.reason for error in errors] == [
+        error.reason for error in schema.iter_errors(str(xml_file))
+    ]
+    assert [error.path for error in errors] == ["/batch/record[2]", "/batch/record[4]"]
@@ -27,13 +27,17 @@ import pytest
 
 # Local application imports.
 from xmlvalidator.results import ValidatorResultRecorder
-from xmlvalidator.schema.manager import ValidatorSchemaManager
+from xmlvalidator.schema.manager import SchemaCacheEntry, ValidatorSchemaManager
 from xmlvalidator.validation import XmlValidationRunner
 
 validation_module = __import__(
     "xmlvalidator.validation",
     fromlist=[""]
 )
+files_module = __import__(
+    "xmlvalidator.files",
+    fromlist=[""]
+)
 
 DEFAULT_ERROR_FACETS = ["path", "reason"]
 
@@ -52,6 +56,386 @@ def test_validate_validation_backend_rejects_unknown_backend():
         XmlValidationRunner.validate_validation_backend("unsupported")
 
 
+# run_validation_plan()
+
+
+def _write_note_batch(tmp_path):
+    """
+    Writes a schema plus a mix of valid and invalid XML files.
+    """
+    xsd_file = tmp_path / "note.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="note" type="xs:int"/>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    xml_files = []
+    for idx, value in enumerate(["1", "two", "3", "four"]):
+        xml_file = tmp_path / f"note_{idx}.xml"
+        xml_file.write_text(f"<note>{value}</note>", encoding="utf-8")
+        xml_files.append(xml_file)
+    return xml_files, xsd_file
+
+@pytest.mark.parametrize("parallelism", ["processes", "threads"])
+def test_run_validation_plan_workers_match_sequential_results(tmp_path, parallelism):
+    """
+    Test that run_validation_plan() with a process or thread pool
+    records the same results, in the same plan order, as sequential
+    validation.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    validations = {xml_file: xsd_file for xml_file in xml_files}
+    validations[tmp_path / "unmatched.xml"] = FileNotFoundError(
+        "No matching XSD found for: unmatched."
+    )
+    recorders = []
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(ValidatorResultRecorder, "add_valid_file"), \
+         patch.object(ValidatorResultRecorder, "add_invalid_file"), \
+         patch.object(ValidatorResultRecorder, "log_file_errors"):
+        for workers in (1, 2):
+            result_recorder = ValidatorResultRecorder()
+            XmlValidationRunner(ValidatorSchemaManager()).run_validation_plan(
+                validations,
+                result_recorder,
+                default_error_facets=DEFAULT_ERROR_FACETS,
+                workers=workers,
+                parallelism=parallelism
+            )
+            recorders.append(result_recorder)
+
+    assert recorders[1].errors_by_file == recorders[0].errors_by_file
+    assert [error["file_name"] for error in recorders[1].errors_by_file] == [
+        "note_1.xml", "note_3.xml", "unmatched.xml"
+    ]
+
+@pytest.mark.parametrize("workers, checks", [(1, 1), (2, 0)])
+def test_run_validation_plan_checks_schema_files_once(tmp_path, workers, checks):
+    """
+    Test that run_validation_plan() checks the schema files of a cached
+    schema once per plan, instead of on each lookup for each XML file.
+    Worker threads compile their own schemas during the plan, so they
+    need no check at all.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    schema_manager = ValidatorSchemaManager()
+    schema_manager.compile_lxml_schema(xsd_file)
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(ValidatorResultRecorder, "add_valid_file"), \
+         patch.object(ValidatorResultRecorder, "add_invalid_file"), \
+         patch.object(ValidatorResultRecorder, "log_file_errors"), \
+         patch.object(
+             SchemaCacheEntry,
+             "is_current",
+             autospec=True,
+             side_effect=SchemaCacheEntry.is_current
+         ) as is_current_mock:
+        XmlValidationRunner(schema_manager).run_validation_plan(
+            {xml_file: xsd_file for xml_file in xml_files},
+            ValidatorResultRecorder(),
+            default_error_facets=DEFAULT_ERROR_FACETS,
+            workers=workers,
+            parallelism="threads"
+        )
+        assert is_current_mock.call_count == checks
+        # After the plan, each lookup checks the schema files again.
+        schema_manager.compile_lxml_schema(xsd_file)
+        assert is_current_mock.call_count == checks + 1
+
+def test_run_validation_plan_workers_reuse_loaded_schema(tmp_path):
+    """
+    Test that plan entries that reuse the loaded schema are validated
+    against that schema's file inside the worker processes.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    schema_manager = ValidatorSchemaManager()
+    schema_manager.load_schema(xsd_file)
+    result_recorder = ValidatorResultRecorder()
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(ValidatorResultRecorder, "add_valid_file"), \
+         patch.object(ValidatorResultRecorder, "add_invalid_file"), \
+         patch.object(ValidatorResultRecorder, "log_file_errors"):
+        XmlValidationRunner(schema_manager).run_validation_plan(
+            dict.fromkeys(xml_files),
+            result_recorder,
+            default_error_facets=DEFAULT_ERROR_FACETS,
+            workers=2
+        )
+
+    assert [error["file_name"] for error in result_recorder.errors_by_file] == [
+        "note_1.xml", "note_3.xml"
+    ]
+
+def test_run_validation_plan_rejects_invalid_worker_count():
+    """
+    Test that run_validation_plan() rejects a worker count below one.
+
+    Priority: M
+    """
+    validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+    with pytest.raises(ValueError, match="workers must be 1 or higher"):
+        validation_runner.run_validation_plan({}, ValidatorResultRecorder(), workers=0)
+
+def test_run_validation_plan_rejects_unknown_parallelism():
+    """
+    Test that run_validation_plan() rejects unsupported worker pool
+    kinds.
+
+    Priority: M
+    """
+    validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+    with pytest.raises(ValueError, match="Unsupported parallelism"):
+        validation_runner.run_validation_plan(
+            {}, ValidatorResultRecorder(), workers=2, parallelism="fibers"
+        )
+
+def _write_list_batch(tmp_path, bad_values_per_file):
+    """
+    Writes a schema plus XML files with the given numbers of invalid
+    values.
+    """
+    xsd_file = tmp_path / "list.xsd"
+    xsd_file.write_text(
+        """<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="list">
+                <xs:complexType>
+                    <xs:sequence>
+                        <xs:element name="n" type="xs:int" maxOccurs="unbounded"/>
+                    </xs:sequence>
+                </xs:complexType>
+            </xs:element>
+        </xs:schema>""",
+        encoding="utf-8"
+    )
+    xml_files = []
+    for idx, bad_values in enumerate(bad_values_per_file):
+        xml_file = tmp_path / f"list_{idx}.xml"
+        values = "".join(f"<n>x{value}</n>" for value in range(bad_values))
+        xml_file.write_text(f"<list><n>1</n>{values}</list>", encoding="utf-8")
+        xml_files.append(xml_file)
+    return xml_files, xsd_file
+
+@pytest.mark.parametrize(
+    "workers, validation_backend",
+    [(1, "lxml"), (1, "xmlschema"), (2, "lxml")]
+)
+def test_run_validation_plan_caps_errors_per_file_and_total(
+    tmp_path, workers, validation_backend
+):
+    """
+    Test that run_validation_plan() reports at most max_errors_per_file
+    errors per file and max_errors_total errors per run, and records a
+    truncation note for each file whose errors were cut off.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_list_batch(tmp_path, [5, 2, 4, 3])
+    result_recorder = ValidatorResultRecorder()
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(ValidatorResultRecorder, "add_valid_file"), \
+         patch.object(ValidatorResultRecorder, "add_invalid_file"), \
+         patch.object(ValidatorResultRecorder, "log_file_errors"):
+        XmlValidationRunner(ValidatorSchemaManager()).run_validation_plan(
+            {xml_file: xsd_file for xml_file in xml_files},
+            result_recorder,
+            default_error_facets=["reason"],
+            validation_backend=validation_backend,
+            workers=workers,
+            parallelism="threads",
+            max_errors_per_file=3,
+            max_errors_total=6
+        )
+
+    reported = [
+        (error["file_name"], error["reason"].startswith("Error limit reached"))
+        for error in result_recorder.errors_by_file
+    ]
+    assert reported == [
+        ("list_0.xml", False), ("list_0.xml", False), ("list_0.xml", False),
+        ("list_0.xml", True),
+        ("list_1.xml", False), ("list_1.xml", False),
+        ("list_2.xml", False),
+        ("list_2.xml", True),
+        ("list_3.xml", True),
+    ]
+    assert "max_errors_per_file=3" in result_recorder.errors_by_file[3]["reason"]
+    assert "max_errors_total=6" in result_recorder.errors_by_file[7]["reason"]
+    assert result_recorder.truncated_files == [
+        "list_0.xml", "list_2.xml", "list_3.xml"
+    ]
+
+def test_run_validation_plan_stops_consuming_xmlschema_errors(tmp_path):
+    """
+    Test that the xmlschema path stops iterating over the validation
+    errors once one more error than the file limit was collected.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_list_batch(tmp_path, [50])
+    schema_manager = ValidatorSchemaManager()
+    schema_manager.load_schema(xsd_file)
+    consumed_errors = []
+
+    def iter_errors(source):
+        for error in schema_manager.schema.iter_errors(source):
+            consumed_errors.append(error)
+            yield error
+
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(ValidatorResultRecorder, "add_invalid_file"), \
+         patch.object(ValidatorResultRecorder, "log_file_errors"), \
+         patch.object(
+             schema_manager, "ensure_schema",
+             return_value=validation_module.ValidatorResult(
+                 True, MagicMock(iter_errors=iter_errors)
+             )
+         ):
+        XmlValidationRunner(schema_manager).run_validation_plan(
+            dict.fromkeys(xml_files),
+            ValidatorResultRecorder(),
+            default_error_facets=["reason"],
+            validation_backend="xmlschema",
+            max_errors_per_file=4
+        )
+
+    assert len(consumed_errors) == 5
+
+def test_run_validation_plan_stops_on_first_invalid_file(tmp_path):
+    """
+    Test that run_validation_plan() with stop_on_first_invalid stops
+    validating after the first invalid file and records the remaining
+    files as skipped.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+    result_recorder = ValidatorResultRecorder()
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(
+             validation_runner, "validate_xml", wraps=validation_runner.validate_xml
+         ) as validate_mock:
+        validation_runner.run_validation_plan(
+            {xml_file: xsd_file for xml_file in xml_files},
+            result_recorder,
+            default_error_facets=DEFAULT_ERROR_FACETS,
+            stop_on_first_invalid=True
+        )
+
+    assert validate_mock.call_count == 2
+    assert result_recorder.validation_summary == {
+        "valid": ["note_0.xml"], "invalid": ["note_1.xml"]
+    }
+    assert result_recorder.skipped_files == ["note_2.xml", "note_3.xml"]
+
+def test_run_validation_plan_cancels_pool_work_on_first_invalid_file(tmp_path):
+    """
+    Test that stopping at the first invalid file cancels the pool's
+    outstanding work and records all later files as skipped.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    validations = {xml_files[1]: xsd_file}
+    for idx in range(20):
+        xml_file = tmp_path / f"valid_{idx}.xml"
+        xml_file.write_text("<note>1</note>", encoding="utf-8")
+        validations[xml_file] = xsd_file
+    result_recorder = ValidatorResultRecorder()
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(
+             validation_module.ThreadPoolExecutor, "shutdown", autospec=True,
+             side_effect=validation_module.ThreadPoolExecutor.shutdown
+         ) as shutdown_mock:
+        XmlValidationRunner(ValidatorSchemaManager()).run_validation_plan(
+            validations,
+            result_recorder,
+            default_error_facets=DEFAULT_ERROR_FACETS,
+            workers=2,
+            parallelism="threads",
+            stop_on_first_invalid=True
+        )
+
+    assert shutdown_mock.call_args.kwargs["cancel_futures"] is True
+    assert result_recorder.validation_summary["invalid"] == ["note_1.xml"]
+    assert result_recorder.skipped_files == [
+        f"valid_{idx}.xml" for idx in range(20)
+    ]
+
+@pytest.mark.parametrize(
+    "limit", ["max_errors_per_file", "max_errors_total"]
+)
+def test_run_validation_plan_rejects_invalid_error_limits(limit):
+    """
+    Test that run_validation_plan() rejects error limits below one.
+
+    Priority: M
+    """
+    validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+    with pytest.raises(ValueError, match=f"{limit} must be 1 or higher"):
+        validation_runner.run_validation_plan(
+            {}, ValidatorResultRecorder(), **{limit: 0}
+        )
+
+def test_validate_xml_in_worker_keeps_one_runner_per_thread(tmp_path):
+    """
+    Test that each worker thread validates with its own runner, so
+    compiled schemas are never shared between concurrent validations.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    task = (xml_files[0], xsd_file, None, ["path"], True, False, "lxml")
+    runners = []
+
+    def validate_in_thread():
+        validation_module._validate_xml_in_worker(task) # pylint: disable=W0212
+        runners.append(validation_module._worker_state.runner) # pylint: disable=W0212
+
+    for _ in range(2):
+        thread = validation_module.threading.Thread(target=validate_in_thread)
+        thread.start()
+        thread.join()
+
+    assert len(runners) == 2
+    assert runners[0] is not runners[1]
+    assert runners[0].schema_manager.get_lxml_schema(xsd_file) is not None
+
+def test_validate_xml_in_worker_process_converts_non_scalar_facets(tmp_path):
+    """
+    Test that worker results only hold values that can be pickled back
+    to the calling process.
+
+    Priority: M
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+
+    is_valid, errors = validation_module._validate_xml_in_worker_process( # pylint: disable=W0212
+        (xml_files[1], xsd_file, None, ["path", "elem"], True, False, "xmlschema")
+    )
+
+    assert is_valid is False
+    assert errors is not None
+    assert errors[0]["path"] == "/note"
+    assert isinstance(errors[0]["elem"], str)
+
+
 # validate_xml()
 
 
@@ -144,7 +528,50 @@ def test_validate_xml_auto_backend_requests_lxml_schema(setup_test_files):
         )
         assert is_valid is True
         assert errors is None
-        mock_get_lxml_schema.assert_called_once_with(xsd_file, None)
+        mock_get_lxml_schema.assert_called_with(xsd_file, None)
+
+@pytest.mark.parametrize(
+    "validation_backend, xml_content, builds_xmlschema",
+    [
+        ("auto", "<note>Hello</note>", False),
+        ("lxml", "<note><b/></note>", False),
+        ("streaming", "<note>Hello</note>", False),
+        ("streaming", "<note><b/></note>", True),
+        ("xmlschema", "<note>Hello</note>", True),
+    ]
+)
+def test_validate_xml_builds_xmlschema_only_when_needed(
+    setup_test_files, validation_backend, xml_content, builds_xmlschema
+):
+    """
+    Test that validate_xml() only builds the XMLSchema object if
+    xmlschema validates the file or collects its errors.
+
+    Priority: H
+    """
+    xsd_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+        <xs:element name="note" type="xs:string"/>
+    </xs:schema>"""
+    xml_file, xsd_file = next(setup_test_files(xml_content, xsd_content))
+    schema_manager = ValidatorSchemaManager()
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(
+             schema_manager,
+             "_create_xmlschema",
+             wraps=schema_manager._create_xmlschema
+         ) as mock_create_xmlschema:
+        validation_runner = XmlValidationRunner(schema_manager)
+        validation_runner.validate_xml(
+            xml_file,
+            xsd_file,
+            default_error_facets=DEFAULT_ERROR_FACETS,
+            validation_backend=validation_backend
+        )
+    # Expected outcome: the schema is active, but only built if needed.
+    assert schema_manager.is_loaded(xsd_file)
+    assert mock_create_xmlschema.called is builds_xmlschema
 
 def test_validate_xml_xmlschema_backend_skips_lxml_schema(setup_test_files):
     """
@@ -375,6 +802,166 @@ def test_validate_xml_malformed_xml(setup_test_files):
         errors_str = " ".join(str(e) for e in errors)
         assert "Premature end of data" in errors_str
 
+def test_validate_xml_reuses_pre_parsed_document(tmp_path):
+    """
+    Test that validate_xml() validates the XML tree parsed during the
+    pre-parse sanity check instead of parsing the XML file again.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    original_parse = validation_module.etree.parse
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(
+             validation_module.etree, "parse", side_effect=original_parse
+         ) as parse_mock:
+        validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+        # Load and compile the schema up front.
+        validation_runner.validate_xml(
+            xml_files[0], xsd_file, default_error_facets=DEFAULT_ERROR_FACETS
+        )
+        parse_mock.reset_mock()
+        is_valid, errors = validation_runner.validate_xml(
+            xml_files[1],
+            xsd_file,
+            default_error_facets=DEFAULT_ERROR_FACETS,
+            validation_backend="lxml"
+        )
+    assert is_valid is False
+    assert errors == [{
+        "path": "/note",
+        "reason": "invalid literal for int() with base 10: 'two'"
+    }]
+    # Only the sanity check parses the XML file; the XSD file was
+    # already compiled for the first file and validation reuses the tree.
+    assert parse_mock.call_count == 1
+    parsed_sources = [str(call.args[0]) for call in parse_mock.call_args_list]
+    assert str(xml_files[1]) not in parsed_sources
+
+def test_validate_xml_compiles_each_xsd_once(tmp_path):
+    """
+    Test that validate_xml() compiles an XSD file once for the sanity
+    checks and the validation of all XML files planned against it.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(
+             validation_module.etree,
+             "XMLSchema",
+             wraps=validation_module.etree.XMLSchema
+         ) as xml_schema_mock:
+        validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+        outcomes = [
+            validation_runner.validate_xml(
+                xml_file,
+                xsd_file,
+                default_error_facets=DEFAULT_ERROR_FACETS,
+                validation_backend="lxml"
+            )[0]
+            for xml_file in xml_files
+        ]
+    assert outcomes == [True, False, True, False]
+    xml_schema_mock.assert_called_once()
+
+def test_validate_xml_streaming_backend_never_parses_full_tree(tmp_path):
+    """
+    Test that validate_xml() with the streaming backend validates
+    without building XML trees, and only collects error details with
+    xmlschema for invalid files.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(
+             validation_module.etree, "parse", side_effect=AssertionError
+         ), \
+         patch.object(
+             validation_module,
+             "iter_streaming_errors",
+             side_effect=validation_module.iter_streaming_errors
+         ) as iter_errors_mock:
+        validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+        outcomes = [
+            validation_runner.validate_xml(
+                xml_file,
+                xsd_file,
+                default_error_facets=DEFAULT_ERROR_FACETS,
+                validation_backend="streaming"
+            )
+            for xml_file in xml_files[:2]
+        ]
+    assert outcomes == [
+        (True, None),
+        (False, [{
+            "path": "/note",
+            "reason": "invalid literal for int() with base 10: 'two'"
+        }]),
+    ]
+    iter_errors_mock.assert_called_once()
+
+def test_validate_xml_streaming_backend_reports_malformed_xml(tmp_path):
+    """
+    Test that the streaming backend's pre-parse reports malformed XML
+    like the other backends do.
+
+    Priority: M
+    """
+    _, xsd_file = _write_note_batch(tmp_path)
+    xml_file = tmp_path / "malformed.xml"
+    xml_file.write_text("<note>1</nope>", encoding="utf-8")
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"):
+        is_valid, errors = XmlValidationRunner(
+            ValidatorSchemaManager()
+        ).validate_xml(
+            xml_file,
+            xsd_file,
+            default_error_facets=DEFAULT_ERROR_FACETS,
+            validation_backend="streaming"
+        )
+    assert is_valid is False
+    assert errors[0]["reason"] == "File parsing failed."
+
+def test_validate_xml_streaming_backend_parses_valid_files_once(tmp_path):
+    """
+    Test that the streaming backend's pre-parse does not parse valid
+    files a second time, as their validation proves them well-formed.
+
+    Priority: H
+    """
+    xml_files, xsd_file = _write_note_batch(tmp_path)
+    with patch.object(validation_module.logger, "warn"), \
+         patch.object(validation_module.logger, "info"), \
+         patch.object(
+             files_module,
+             "parse_streaming",
+             side_effect=files_module.parse_streaming
+         ) as parse_mock, \
+         patch.object(
+             validation_module,
+             "is_valid_streaming",
+             side_effect=validation_module.is_valid_streaming
+         ) as is_valid_mock:
+        validation_runner = XmlValidationRunner(ValidatorSchemaManager())
+        outcomes = [
+            validation_runner.validate_xml(
+                xml_file,
+                xsd_file,
+                default_error_facets=DEFAULT_ERROR_FACETS,
+                validation_backend="streaming"
+            )[0]
+            for xml_file in xml_files[:2]
+        ]
+    assert outcomes == [True, False]
+    assert is_valid_mock.call_count == 2
+    parse_mock.assert_called_once_with(xml_files[1])
+
 
 # _collect_lxml_validation_errors()
 
@@ -455,6 +1042,37 @@ def test_collect_lxml_validation_errors_can_skip_unavailable_facets(
     assert "reason" in errors[0]
     assert "non_existing_facet" not in errors[0]
 
+def test_collect_lxml_validation_errors_uses_given_document(setup_test_files):
+    """
+    Test that lxml error collection validates a passed-in document
+    without parsing the XML file.
+
+    Priority: M
+    """
+    xsd_content = """<?xml version="1.0" encoding="UTF-8"?>
+    <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+        <xs:element name="root" type="xs:int"/>
+    </xs:schema>"""
+    xml_file, xsd_file = next(setup_test_files("<root>1</root>", xsd_content))
+    lxml_schema = ValidatorSchemaManager().get_lxml_schema(xsd_file)
+    document = validation_module.etree.ElementTree(
+        validation_module.etree.fromstring("<root>NaN</root>")
+    )
+
+    assert lxml_schema is not None
+    with patch.object(validation_module.etree, "parse") as parse_mock:
+        errors = XmlValidationRunner._collect_lxml_validation_errors( # pylint: disable=W0212
+            xml_file,
+            lxml_schema,
+            ["reason"],
+            document=document
+        )
+
+    parse_mock.assert_not_called()
+    assert errors == [
+        {"reason": "invalid literal for int() with base 10: 'NaN'"}
+    ]
+
 
 # finalize_validation_run()
 
@@ -515,3 +1133,31 @@ def test_finalize_validation_run_raises_failure_when_configured(tmp_path):
             fail_on_errors=True
         )
     result_recorder.log_summary.assert_called_once()
+
+def test_finalize_validation_run_failure_excludes_truncation_notes(tmp_path):
+    """
+    Test that the failure message counts errors without the truncation
+    notes and mentions the truncated files.
+
+    Priority: M
+    """
+    result_recorder = ValidatorResultRecorder()
+    result_recorder.errors_by_file = [
+        {"file_name": "big.xml", "reason": "Invalid XML."},
+        {"file_name": "big.xml", "reason": "Error limit reached."},
+    ]
+    result_recorder.truncated_files = ["big.xml"]
+    result_recorder.log_summary = MagicMock()
+
+    with pytest.raises(
+        validation_module.Failure,
+        match=r"1 errors have been detected\. Errors of 1 file\(s\) were truncated\."
+    ):
+        XmlValidationRunner.finalize_validation_run(
+            [tmp_path / "big.xml"],
+            True,
+            result_recorder,
+            (False, False, False),
+            fail_on_errors=True
+        )
+
@@ -0,0 +1,84 @@
+# Copyright 2024-2026 Michael Hallik
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Contains unit tests for the src/xmlvalidator/verbosity.py module.
+
+See for an overview of all tests the file test/_doc/unit/overview.html.
+"""
+
+# Third-party library imports.
+import pytest
+
+# Local application imports.
+from xmlvalidator.verbosity import (
+    get_verbosity,
+    is_logged,
+    use_verbosity,
+    validate_verbosity,
+)
+
+
+# validate_verbosity()
+
+
+def test_validate_verbosity_rejects_unknown_level():
+    """
+    Test that validate_verbosity() rejects unsupported levels.
+
+    Priority: H
+    """
+    assert validate_verbosity("summary") == "summary"
+    with pytest.raises(ValueError, match="Unsupported verbosity: loud"):
+        validate_verbosity("loud")
+
+
+# is_logged() / use_verbosity()
+
+
+@pytest.mark.parametrize(
+    "verbosity, logged_levels",
+    [
+        ("silent", []),
+        ("summary", ["summary"]),
+        ("per-file", ["summary", "per-file"]),
+        ("per-error", ["summary", "per-file", "per-error"]),
+    ]
+)
+def test_is_logged_includes_less_verbose_levels(verbosity, logged_levels):
+    """
+    Test that a verbosity logs its own level plus all less verbose
+    levels.
+
+    Priority: H
+    """
+    with use_verbosity(verbosity):
+        assert [
+            level for level in ("summary", "per-file", "per-error")
+            if is_logged(level)
+        ] == logged_levels
+
+def test_use_verbosity_restores_previous_verbosity():
+    """
+    Test that use_verbosity() only applies within its context, also
+    when the context exits with an exception.
+
+    Priority: M
+    """
+    assert get_verbosity() == "per-error"
+    with pytest.raises(RuntimeError):
+        with use_verbosity("silent"):
+            assert get_verbosity() == "silent"
+            raise RuntimeError
+    assert get_verbosity() == "per-error"
@@ -31,7 +31,9 @@ from xmlvalidator import XmlValidator
 from xmlvalidator.results import ValidatorResult, ValidatorResultRecorder
 from xmlvalidator.schema.manager import ValidatorSchemaManager
 from xmlvalidator.schema.resolver import ValidatorSchemaResolver
+from xmlvalidator.spill import SpilledErrors
 from xmlvalidator.validation import XmlValidationRunner
+from xmlvalidator.verbosity import get_verbosity
 
 xml_validator_module = importlib.import_module("xmlvalidator.XmlValidator")
 schema_manager_module = importlib.import_module("xmlvalidator.schema.manager")
@@ -169,6 +171,47 @@ def test_init_accepts_custom_validation_backend():
         validator = XmlValidator(validation_backend="xmlschema")
         assert validator.validation_backend == "xmlschema"
 
+def test_init_configures_schema_cache_dir(tmp_path):
+    """
+    Test that XmlValidator passes the schema cache folder to its schema
+    manager and that no cache is used by default.
+
+    Priority: M
+    """
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator(schema_cache_dir=str(tmp_path / "cache"))
+        assert validator.schema_manager.schema_cache is not None
+        assert validator.schema_manager.schema_cache.cache_dir == tmp_path / "cache"
+        assert XmlValidator().schema_manager.schema_cache is None
+
+def test_init_configures_xml_catalog(tmp_path):
+    """
+    Test that XmlValidator builds an XML catalog from a dictionary or a
+    catalog file and passes it to its schema manager.
+
+    Priority: M
+    """
+    catalog_file = tmp_path / "catalog.xml"
+    catalog_file.write_text(
+        '<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">'
+        '<uri name="http://example.invalid/a.xsd" uri="a.xsd"/></catalog>',
+        encoding="utf-8",
+    )
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        from_dict = XmlValidator(
+            xml_catalog={"http://example.invalid/a.xsd": str(tmp_path / "a.xsd")}
+        )
+        from_file = XmlValidator(xml_catalog=str(catalog_file))
+        assert XmlValidator().schema_manager.xml_catalog is None
+    for validator in (from_dict, from_file):
+        xml_catalog = validator.schema_manager.xml_catalog
+        assert xml_catalog is not None
+        assert xml_catalog.resolve("http://example.invalid/a.xsd") == str(
+            tmp_path / "a.xsd"
+        )
+
 def test_init_rejects_unknown_validation_backend():
     """
     Test that XmlValidator rejects unsupported validation backends.
@@ -178,6 +221,188 @@ def test_init_rejects_unknown_validation_backend():
     with pytest.raises(ValueError, match="Unsupported validation_backend"):
         XmlValidator(validation_backend="unsupported") # type: ignore[arg-type]
 
+def test_init_configures_error_table():
+    """
+    Test that XmlValidator passes the error table settings to its
+    result recorder and rejects unsupported values.
+
+    Priority: M
+    """
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator(error_table="json", max_error_table_rows=100)
+        assert validator.validator_results.error_table == "json"
+        assert validator.validator_results.max_error_table_rows == 100
+        with pytest.raises(ValueError, match="Unsupported error table mode"):
+            XmlValidator(error_table="pdf")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="max_error_table_rows must be 1"):
+            XmlValidator(max_error_table_rows=0)
+
+
+def test_init_configures_error_spill_dir(tmp_path):
+    """
+    Test that XmlValidator makes its result recorder spill errors to the
+    given folder, and keeps them in memory by default.
+
+    Priority: M
+    """
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator(error_spill_dir=str(tmp_path))
+        assert isinstance(validator.validator_results.errors_by_file, SpilledErrors)
+        assert validator.validator_results.errors_by_file.spill_dir == tmp_path
+        assert not list(tmp_path.iterdir())
+        assert XmlValidator().validator_results.errors_by_file == []
+
+
+def test_validate_xml_files_leaves_one_spill_file_per_validator(tmp_path):
+    """
+    Test that repeated runs with error_spill_dir leave at most the spill
+    file of the last run, and that the errors of an earlier run then
+    fail to read instead of being silently replaced.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "schema.xsd"
+    xsd_file.write_text(
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        '<xs:element name="root"><xs:complexType><xs:sequence>'
+        '<xs:element name="n" type="xs:int" maxOccurs="unbounded"/>'
+        "</xs:sequence></xs:complexType></xs:element></xs:schema>",
+        encoding="utf-8",
+    )
+    invalid_xml = tmp_path / "invalid.xml"
+    invalid_xml.write_text("<root><n>a</n><n>b</n></root>", encoding="utf-8")
+    valid_xml = tmp_path / "valid.xml"
+    valid_xml.write_text("<root><n>1</n></root>", encoding="utf-8")
+    spill_dir = tmp_path / "spill"
+    returned_errors = []
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator(fail_on_errors=False, error_spill_dir=str(spill_dir))
+        for xml_file in (invalid_xml, valid_xml, invalid_xml, invalid_xml):
+            errors, _ = validator.validate_xml_files(
+                xml_file, xsd_file, write_to_csv=False, error_table=False
+            )
+            returned_errors.append(errors)
+            # Expected outcome: at most the current run's file exists.
+            assert len(list(spill_dir.glob("errors_*.jsonl"))) == (
+                1 if len(errors) else 0
+            )
+
+    assert len(returned_errors[-1]) == 2
+    assert [error["file_name"] for error in returned_errors[-1]] == [
+        "invalid.xml", "invalid.xml"
+    ]
+    with pytest.raises(ValueError, match="spilled errors were discarded"):
+        list(returned_errors[0])
+
+@pytest.mark.parametrize("parallelism", ["processes", "threads"])
+def test_validate_xml_files_workers_do_not_build_xmlschema(tmp_path, parallelism):
+    """
+    Test that a parallel run on the lxml backend never builds an
+    XMLSchema object, neither for the explicit schema nor when a next
+    run reuses that loaded schema.
+
+    Priority: H
+    """
+    xsd_file = tmp_path / "schema.xsd"
+    xsd_file.write_text(
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        '<xs:element name="n" type="xs:int"/></xs:schema>',
+        encoding="utf-8",
+    )
+    for idx in range(3):
+        (tmp_path / f"n_{idx}.xml").write_text(f"<n>{idx}</n>", encoding="utf-8")
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"), \
+         patch.object(
+             ValidatorSchemaManager, "_create_xmlschema"
+         ) as mock_create_xmlschema:
+        validator = XmlValidator(validation_backend="lxml")
+        for xsd_path in (xsd_file, None):
+            errors, _ = validator.validate_xml_files(
+                tmp_path,
+                xsd_path,
+                write_to_csv=False,
+                error_table=False,
+                workers=2,
+                parallelism=parallelism,
+            )
+            assert not errors
+
+    # Expected outcome: the schema was only compiled by lxml.
+    mock_create_xmlschema.assert_not_called()
+
+
+# get_schema_cache_statistics()
+
+
+def test_get_schema_cache_statistics_reports_configured_limits():
+    """
+    Test that get_schema_cache_statistics() returns the counters and
+    the limits configured during library import.
+
+    Priority: M
+    """
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator(max_cached_schemas=8, max_cached_schema_mb=2)
+
+    assert validator.get_schema_cache_statistics() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "entries": 0,
+        "failures": 0,
+        "estimated_bytes": 0,
+        "max_entries": 8,
+        "max_bytes": 2 * 1024 * 1024,
+    }
+
+def test_get_schema_cache_statistics_selects_cache():
+    """
+    Test that get_schema_cache_statistics() returns the statistics of
+    the XMLSchema object cache on request, and rejects unknown caches.
+
+    Priority: M
+    """
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator(max_cached_schemas=4)
+
+    with patch.object(
+        validator.schema_manager,
+        "get_xmlschema_cache_statistics",
+        return_value={"hits": 3},
+    ):
+        assert validator.get_schema_cache_statistics("xmlschema") == {"hits": 3}
+    with pytest.raises(ValueError, match="Unsupported schema cache: disk"):
+        validator.get_schema_cache_statistics("disk")
+
+
+# get_lxml_fallback_schemas()
+
+
+def test_get_lxml_fallback_schemas_returns_schemas_lxml_cannot_compile(tmp_path):
+    """
+    Test that get_lxml_fallback_schemas() returns the schemas that lxml
+    failed to compile.
+
+    Priority: M
+    """
+    xsd_file = tmp_path / "invalid_schema.xsd"
+    xsd_file.write_text("<root />", encoding="utf-8")
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator()
+
+    assert validator.get_lxml_fallback_schemas() == []
+    assert validator.schema_manager.get_lxml_schema(xsd_file) is None
+    assert [
+        schema["xsd_path"] for schema in validator.get_lxml_fallback_schemas()
+    ] == [str(xsd_file.resolve())]
+
 
 # get_validation_backend()
 
@@ -225,6 +450,63 @@ def test_set_validation_backend_rejects_unknown_backend():
     with pytest.raises(ValueError, match="Unsupported validation_backend"):
         validator.set_validation_backend("unsupported") # type: ignore[arg-type]
 
+# get_verbosity() / set_verbosity()
+
+
+def test_set_verbosity_updates_default_verbosity():
+    """
+    Test that set_verbosity() updates, and get_verbosity() returns, the
+    default verbosity, and that unknown levels are rejected.
+
+    Priority: M
+    """
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"):
+        validator = XmlValidator(verbosity="summary")
+        assert validator.get_verbosity() == "summary"
+        validator.set_verbosity("silent")
+
+    assert validator.get_verbosity() == "silent"
+    with pytest.raises(ValueError, match="Unsupported verbosity"):
+        validator.set_verbosity("loud")  # type: ignore[arg-type]
+
+@pytest.mark.parametrize(
+    "call_verbosity, expected_verbosity", [(None, "summary"), ("per-file", "per-file")]
+)
+def test_validate_xml_files_applies_verbosity_to_run(
+    call_verbosity, expected_verbosity
+):
+    """
+    Test that validate_xml_files() runs with the keyword-level verbosity
+    or else the library's, and restores the default afterwards.
+
+    Priority: H
+    """
+    xml_path = Path("example.xml")
+    run_verbosities = []
+    with patch.object(xml_validator_module.logger, "info"), \
+         patch.object(xml_validator_module.logger, "console"), \
+         patch.object(
+             xml_validator_module,
+             "get_file_paths",
+             return_value=([xml_path], True)
+         ):
+        validator = XmlValidator(verbosity="summary")
+        validator.schema_resolver.build_validation_plan = MagicMock(
+            return_value={xml_path: None}
+        )
+        validator.validation_runner.run_validation_plan = MagicMock(
+            side_effect=lambda *_, **__: run_verbosities.append(get_verbosity())
+        )
+        validator.validation_runner.finalize_validation_run = MagicMock(
+            return_value=([], None)
+        )
+
+        validator.validate_xml_files(xml_path, verbosity=call_verbosity)
+
+    assert run_verbosities == [expected_verbosity]
+    assert get_verbosity() == "per-error"
+
 def test_init_logs_custom_error_facets():
     """
     Test that XmlValidator logs the correct error facets when custom
@@ -321,7 +603,12 @@ def test_validate_xml_files_uses_keyword_backend_override():
         validator.error_facets,
         True,
         False,
-        "xmlschema"
+        "xmlschema",
+        workers=1,
+        parallelism="processes",
+        max_errors_per_file=None,
+        max_errors_total=None,
+        stop_on_first_invalid=False
     )
 
 def test_validate_xml_files_uses_instance_backend_when_no_override():
@@ -358,5 +645,10 @@ def test_validate_xml_files_uses_instance_backend_when_no_override():
         validator.error_facets,
         True,
         False,
-        "lxml"
+        "lxml",
+        workers=1,
+        parallelism="processes",
+        max_errors_per_file=None,
+        max_errors_total=None,
+        stop_on_first_invalid=False
     )